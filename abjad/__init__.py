@@ -22,16 +22,9 @@ try:
 except ImportError:
     from fractions import Fraction
 
-# ensure that the ~/.abjad directory and friends are setup
-# and instantiate Abjad's configuration singleton
-from abjad.tools.systemtools.AbjadConfiguration import AbjadConfiguration
-abjad_configuration = AbjadConfiguration()
-del AbjadConfiguration
-
-# import all tools packages
-from abjad.tools import *
-from abjad.tools.abctools import *
-from abjad.tools.datastructuretools import *
+# tools packages import their public names on first access;
+# datastructuretools sets up ordinal constants in the builtins module
+from abjad.tools.datastructuretools import OrdinalConstant
 
 # instantiate ordinal constants
 Identity = OrdinalConstant('identity', 0, 'Identity')
@@ -46,25 +39,7 @@ Up = OrdinalConstant('y', 1, 'Up')
 Down = OrdinalConstant('y', -1, 'Down')
 Top = OrdinalConstant('y', 1, 'Top')
 Bottom = OrdinalConstant('y', -1, 'Bottom')
-
-index = Pattern.index
-index_all = Pattern.index_all
-index_first = Pattern.index_first
-index_last = Pattern.index_last
-
-from abjad.tools.exceptiontools import *
-from abjad.tools.indicatortools import *
-from abjad.tools.instrumenttools import *
-from abjad.tools.lilypondfiletools import *
-from abjad.tools.lilypondnametools import *
-from abjad.tools.markuptools import *
-from abjad.tools.pitchtools import *
-from abjad.tools.schemetools import *
-from abjad.tools.scoretools import *
-from abjad.tools.segmenttools import *
-from abjad.tools.spannertools import *
-from abjad.tools.systemtools import *
-from abjad.tools.topleveltools import *
+del OrdinalConstant
 
 # mathtools classes (but not functions)
 from abjad.tools.mathtools import Infinity
@@ -72,42 +47,149 @@ Infinity = Infinity()
 from abjad.tools.mathtools import NegativeInfinity
 NegativeInfinity = NegativeInfinity()
 
-from abjad.tools.mathtools import Enumerator
-from abjad.tools.mathtools import NonreducedFraction
-from abjad.tools.mathtools import NonreducedRatio
-from abjad.tools.mathtools import Ratio
-from abjad.tools.metertools import Meter
-from abjad.tools.metertools import MeterList
-from abjad.tools.metertools import MeterManager
-from abjad.tools.metertools import MetricAccentKernel
-from abjad.tools.metertools import OffsetCounter
-
-# timespantools classes (but not functions)
-from abjad.tools.timespantools import AnnotatedTimespan
-from abjad.tools.timespantools import Timespan
-from abjad.tools.timespantools import TimespanInequality
-from abjad.tools.timespantools import TimespanList
-
-# rhythm-maker static methods
-from abjad.tools.rhythmmakertools import SilenceMask
-from abjad.tools.rhythmmakertools import SustainMask
-silence = SilenceMask.silence
-sustain = SustainMask.sustain
-
 # import custom exceptions into the builtins module
-import os
-from abjad.tools.systemtools.ImportManager import ImportManager
-ImportManager.import_public_names_from_path_into_namespace(
-    os.path.join(__path__[0], 'tools', 'exceptiontools'),
-    __builtins__,
-    )
-del os
+import six
+if six.PY3:
+    import builtins
+else:
+    import __builtin__ as builtins
+from abjad.tools import exceptiontools
+for _name in dir(exceptiontools):
+    if not _name.startswith('_'):
+        setattr(builtins, _name, getattr(exceptiontools, _name))
+del builtins
+del exceptiontools
+del six
 del tools
 
 # import version information
 from abjad._version import __version_info__, __version__
 del _version
 
+# all other public names import on first access;
+# names in later packages replace names in earlier packages
+_star_package_names = (
+    'abctools',
+    'datastructuretools',
+    'exceptiontools',
+    'indicatortools',
+    'instrumenttools',
+    'lilypondfiletools',
+    'lilypondnametools',
+    'markuptools',
+    'pitchtools',
+    'schemetools',
+    'scoretools',
+    'segmenttools',
+    'spannertools',
+    'systemtools',
+    'topleveltools',
+    )
+
+_explicit_names = (
+    # mathtools classes (but not functions)
+    ('mathtools', 'Enumerator'),
+    ('mathtools', 'NonreducedFraction'),
+    ('mathtools', 'NonreducedRatio'),
+    ('mathtools', 'Ratio'),
+    ('metertools', 'Meter'),
+    ('metertools', 'MeterList'),
+    ('metertools', 'MeterManager'),
+    ('metertools', 'MetricAccentKernel'),
+    ('metertools', 'OffsetCounter'),
+    # timespantools classes (but not functions)
+    ('timespantools', 'AnnotatedTimespan'),
+    ('timespantools', 'Timespan'),
+    ('timespantools', 'TimespanInequality'),
+    ('timespantools', 'TimespanList'),
+    # rhythm-maker static methods
+    ('rhythmmakertools', 'SilenceMask'),
+    ('rhythmmakertools', 'SustainMask'),
+    )
+
+_method_names = {
+    'index': ('datastructuretools', 'Pattern', 'index'),
+    'index_all': ('datastructuretools', 'Pattern', 'index_all'),
+    'index_first': ('datastructuretools', 'Pattern', 'index_first'),
+    'index_last': ('datastructuretools', 'Pattern', 'index_last'),
+    'silence': ('rhythmmakertools', 'SilenceMask', 'silence'),
+    'sustain': ('rhythmmakertools', 'SustainMask', 'sustain'),
+    }
+
+_lazy_index = None
+
+
+def _get_lazy_index():
+    r'''Maps lazily imported names to (module name, attribute name) pairs.
+
+    Attribute name is none for packages.
+
+    Imports tools package initializers but no modules in tools packages.
+    '''
+    global _lazy_index
+    if _lazy_index is None:
+        import importlib
+        index = {}
+        tools = importlib.import_module('abjad.tools')
+        for name in tools.__all__:
+            index[name] = ('abjad.tools.' + name, None)
+        for package_name in _star_package_names:
+            package_name = 'abjad.tools.' + package_name
+            package = importlib.import_module(package_name)
+            names = getattr(package, '__all__', None)
+            if names is None:
+                names = [_ for _ in dir(package) if not _.startswith('_')]
+            for name in names:
+                index[name] = (package_name, name)
+        for package_name, name in _explicit_names:
+            index[name] = ('abjad.tools.' + package_name, name)
+        for name in _method_names:
+            index[name] = None
+        index['abjad_configuration'] = None
+        index['demos'] = ('abjad.demos', None)
+        index['ly'] = ('abjad.ly', None)
+        _lazy_index = index
+    return _lazy_index
+
+
+def __dir__():
+    names = set(globals())
+    names.update(_get_lazy_index())
+    return sorted(names)
+
+
+def __getattr__(name):
+    import importlib
+    if name == '__all__':
+        # star-import exports lazily imported and eagerly imported names
+        names = set(_get_lazy_index())
+        names.update(_ for _ in globals() if not _.startswith('_'))
+        value = sorted(names)
+        globals()[name] = value
+        return value
+    if name.startswith('_') or name not in _get_lazy_index():
+        message = 'module {!r} has no attribute {!r}.'
+        message = message.format(__name__, name)
+        raise AttributeError(message)
+    if name == 'abjad_configuration':
+        # ensure that the ~/.abjad directory and friends are setup
+        # and instantiate Abjad's configuration singleton
+        from abjad.tools.systemtools.AbjadConfiguration import \
+            AbjadConfiguration
+        value = AbjadConfiguration()
+    elif name in _method_names:
+        package_name, class_name, method_name = _method_names[name]
+        package = importlib.import_module('abjad.tools.' + package_name)
+        value = getattr(getattr(package, class_name), method_name)
+    else:
+        module_name, attribute_name = _get_lazy_index()[name]
+        value = importlib.import_module(module_name)
+        if attribute_name is not None:
+            value = getattr(value, attribute_name)
+    globals()[name] = value
+    return value
+
+
 def f(argument, strict=False):
     if hasattr(argument, '_publish_storage_format'):
         print(format(argument, 'storage'))
@@ -117,8 +199,13 @@ def f(argument, strict=False):
         else:
             print(format(argument, 'lilypond'))
 
-from abjad import demos
-from abjad import ly
+# Python versions before 3.7 do not call module-level __getattr__
+import sys
+if sys.version_info < (3, 7):
+    for _name in __dir__():
+        if _name not in globals():
+            __getattr__(_name)
+del sys
 
 # HOUSECLEANING HELPER: uncomment below and run tests;
 #                       checks for hasattr() calls against properties:
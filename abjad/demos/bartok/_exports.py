@@ -0,0 +1,9 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'main',
+    'make_bartok_score',
+    )
+
+packages = ()
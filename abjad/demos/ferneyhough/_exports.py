@@ -0,0 +1,9 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'FerneyhoughDemo',
+    'main',
+    )
+
+packages = ()
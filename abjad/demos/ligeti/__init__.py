@@ -3,8 +3,8 @@ from abjad.tools import systemtools
 systemtools.ImportManager.import_structured_package(
     __path__[0],
     globals(),
+    ignored_names=['main'],
+    lazy=True,
     )
 
 _documentation_section = 'demos'
-
-del(main)
@@ -0,0 +1,14 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'main',
+    'make_desordre_cell',
+    'make_desordre_lilypond_file',
+    'make_desordre_measure',
+    'make_desordre_pitches',
+    'make_desordre_score',
+    'make_desordre_staff',
+    )
+
+packages = ()
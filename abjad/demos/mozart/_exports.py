@@ -0,0 +1,13 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'choose_mozart_measures',
+    'main',
+    'make_mozart_lilypond_file',
+    'make_mozart_measure',
+    'make_mozart_measure_corpus',
+    'make_mozart_score',
+    )
+
+packages = ()
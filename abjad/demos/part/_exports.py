@@ -0,0 +1,28 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'PartCantusScoreTemplate',
+    'add_bell_music_to_score',
+    'add_string_music_to_score',
+    'apply_bowing_marks',
+    'apply_dynamics',
+    'apply_expressive_marks',
+    'apply_final_bar_lines',
+    'apply_page_breaks',
+    'apply_rehearsal_marks',
+    'configure_lilypond_file',
+    'configure_score',
+    'create_pitch_contour_reservoir',
+    'durate_pitch_contour_reservoir',
+    'edit_bass_voice',
+    'edit_cello_voice',
+    'edit_first_violin_voice',
+    'edit_second_violin_voice',
+    'edit_viola_voice',
+    'main',
+    'make_part_lilypond_file',
+    'shadow_pitch_contour_reservoir',
+    )
+
+packages = ()
@@ -6,4 +6,5 @@ systemtools.ImportManager.import_structured_package(
     globals(),
     delete_systemtools=False,
     ignored_names=['abjadbooktools'],
+    lazy=True,
     )
@@ -0,0 +1,34 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = ()
+
+packages = (
+    'abctools',
+    'abjadbooktools',
+    'commandlinetools',
+    'datastructuretools',
+    'documentationtools',
+    'exceptiontools',
+    'graphtools',
+    'indicatortools',
+    'instrumenttools',
+    'lilypondfiletools',
+    'lilypondnametools',
+    'lilypondparsertools',
+    'markuptools',
+    'mathtools',
+    'metertools',
+    'pitchtools',
+    'quantizationtools',
+    'rhythmmakertools',
+    'rhythmtreetools',
+    'schemetools',
+    'scoretools',
+    'segmenttools',
+    'spannertools',
+    'systemtools',
+    'timespantools',
+    'tonalanalysistools',
+    'topleveltools',
+    )
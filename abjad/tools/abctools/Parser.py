@@ -3,8 +3,11 @@ import logging
 import os
 import pickle
 import ply
+from ply import lex
 from ply import yacc
+import threading
 import traceback
+import types
 from abjad.tools.abctools.AbjadObject import AbjadObject
 
 
@@ -24,8 +27,15 @@ class Parser(AbjadObject):
         '_lexer',
         '_logger',
         '_parser',
+        '_pool_key',
         )
 
+    _idle_parsers = {}
+
+    _idle_parsers_lock = threading.Lock()
+
+    _packaged_tables_are_current = {}
+
     ### INITIALIZER ###
 
     def __init__(self, debug=False):
@@ -33,6 +43,7 @@ class Parser(AbjadObject):
         self._debug = bool(debug)
         self._lexer = None
         self._parser = None
+        self._pool_key = None
 
         if self.debug:
             logging.basicConfig(
@@ -48,26 +59,35 @@ class Parser(AbjadObject):
         self._lexer = ply.lex.lex(
             debug=self.debug,
             debuglog=self.logger,
-            object=self.lexer_rules_object
+            object=self._get_rules_namespace(self.lexer_rules_object),
             )
 
-        if self.pickle_path and not os.path.exists(self.pickle_path):
+        if self._has_current_packaged_tables():
+            pickle_path = self.packaged_pickle_path
+        else:
+            pickle_path = self.pickle_path
+        if pickle_path and not os.path.exists(pickle_path):
             try:
-                directory, _ = os.path.split(self.pickle_path)
+                directory, _ = os.path.split(pickle_path)
                 if not os.path.exists(directory):
                     os.makedirs(directory)
                 string = pickle.dumps(None)
-                with open(self.pickle_path, 'wb') as file_pointer:
+                with open(pickle_path, 'wb') as file_pointer:
                     file_pointer.write(string)
             except (IOError, OSError):
                 traceback.print_exc()
 
+        output_path = None
+        if self.debug:
+            output_path = self.output_path
+
         self._parser = ply.yacc.yacc(
             debug=self.debug,
             debuglog=self.logger,
-            module=self.parser_rules_object,
-            outputdir=self.output_path,
-            picklefile=self.pickle_path,
+            module=self._get_rules_namespace(self.parser_rules_object),
+            outputdir=output_path,
+            picklefile=pickle_path,
+            write_tables=False,
             )
 
     ### SPECIAL METHODS ###
@@ -94,6 +114,108 @@ class Parser(AbjadObject):
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _call_pooled(class_, input_string, **keywords):
+        r'''Calls pooled parser initialized with `keywords` on
+        `input_string`.
+
+        Returns result.
+        '''
+        parser = class_._check_out(**keywords)
+        try:
+            return parser(input_string)
+        finally:
+            parser._check_in()
+
+    def _check_in(self):
+        r'''Resets parser state and returns parser to process-wide pool.
+        '''
+        if self._pool_key is None:
+            return
+        try:
+            self._parser.restart()
+        except Exception:
+            pass
+        self._lexer.input('')
+        if hasattr(self, '_teardown'):
+            self._teardown()
+        with Parser._idle_parsers_lock:
+            Parser._idle_parsers.setdefault(self._pool_key, []).append(self)
+
+    @classmethod
+    def _check_out(class_, **keywords):
+        r'''Checks out idle parser initialized with `keywords` from
+        process-wide pool.
+
+        Builds new parser when no such parser is idle. Only one caller uses a
+        checked-out parser at a time; concurrent and nested calls check out
+        different parsers.
+
+        Check parser back in with `_check_in()`.
+
+        Returns parser.
+        '''
+        key = (class_, tuple(sorted(keywords.items())))
+        with Parser._idle_parsers_lock:
+            parsers = Parser._idle_parsers.get(key)
+            if parsers:
+                return parsers.pop()
+        parser = class_(**keywords)
+        parser._pool_key = key
+        return parser
+
+    @staticmethod
+    def _get_rules_namespace(rules_object):
+        r'''Gets namespace of rule definitions in `rules_object`.
+
+        PLY gets every attribute ``dir()`` lists. Namespace omits properties
+        of `rules_object` because properties like `output_path` set up the
+        Abjad configuration directory.
+        '''
+        class_ = type(rules_object)
+        dictionary = {}
+        for name in dir(rules_object):
+            if isinstance(getattr(class_, name, None), property):
+                continue
+            dictionary[name] = getattr(rules_object, name)
+        return types.SimpleNamespace(**dictionary)
+
+    def _get_signature(self):
+        r'''Gets PLY signature of parser's grammar.
+
+        Signature changes whenever tokens, precedence or rule docstrings
+        change.
+        '''
+        module = self._get_rules_namespace(self.parser_rules_object)
+        dictionary = dict(vars(module))
+        reflection = yacc.ParserReflect(dictionary, log=yacc.NullLogger())
+        reflection.get_all()
+        return reflection.signature()
+
+    def _has_current_packaged_tables(self):
+        r'''Is true when parsing tables shipped with Abjad match the installed
+        PLY table version and the parser's grammar.
+
+        Checks once per parser class and process.
+        '''
+        class_ = type(self)
+        if class_ not in Parser._packaged_tables_are_current:
+            result = False
+            try:
+                with open(self.packaged_pickle_path, 'rb') as file_pointer:
+                    table_version = pickle.load(file_pointer)
+                    pickle.load(file_pointer)
+                    signature = pickle.load(file_pointer)
+            except Exception:
+                pass
+            else:
+                if table_version == yacc.__tabversion__:
+                    result = signature == self._get_signature()
+            Parser._packaged_tables_are_current[class_] = result
+        return Parser._packaged_tables_are_current[class_]
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, input_string):
@@ -103,6 +225,27 @@ class Parser(AbjadObject):
         for token in self.lexer:
             print(token)
 
+    def write_packaged_tables(self):
+        r'''Writes parser's parsing tables to packaged pickle path.
+
+        Run abjad/scr/devel/prime-parser-tables after changing any parser's
+        grammar.
+
+        Returns packaged pickle path.
+        '''
+        path = self.packaged_pickle_path
+        if os.path.exists(path):
+            os.remove(path)
+        ply.yacc.yacc(
+            debug=False,
+            errorlog=yacc.NullLogger(),
+            module=self._get_rules_namespace(self.parser_rules_object),
+            picklefile=path,
+            write_tables=False,
+            )
+        Parser._packaged_tables_are_current.pop(type(self), None)
+        return path
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -160,6 +303,21 @@ class Parser(AbjadObject):
                 return None
         return output_path
 
+    @property
+    def packaged_pickle_path(self):
+        r'''The path of the parser's prebuilt parsing tables shipped with
+        Abjad.
+
+        Parsers load these tables read-only when they match the installed PLY
+        table version and the parser's grammar. Otherwise parsers build their
+        tables and cache them at `pickle_path`.
+        '''
+        import sys
+        module = sys.modules[type(self).__module__]
+        directory = os.path.dirname(os.path.abspath(module.__file__))
+        file_name = 'parse_tables_{}.pkl'.format(type(self).__name__)
+        return os.path.join(directory, file_name)
+
     @property
     def parser(self):
         r'''The parser's PLY LRParser instance.
@@ -0,0 +1,101 @@
+import abjad
+import threading
+from abjad.tools import lilypondparsertools
+from abjad.tools import rhythmtreetools
+
+
+def test_abctools_Parser__call_pooled_01():
+    r'''Reuses idle parser.
+    '''
+
+    parser = rhythmtreetools.RhythmTreeParser._check_out()
+    parser._check_in()
+    assert rhythmtreetools.RhythmTreeParser._check_out() is parser
+    parser._check_in()
+
+
+def test_abctools_Parser__call_pooled_02():
+    r'''Pools parsers by keyword.
+    '''
+
+    parser_1 = lilypondparsertools.LilyPondParser._check_out(
+        default_language='english',
+        )
+    parser_1._check_in()
+    parser_2 = lilypondparsertools.LilyPondParser._check_out(
+        default_language='nederlands',
+        )
+    parser_2._check_in()
+
+    assert parser_1 is not parser_2
+    assert parser_1.default_language == 'english'
+    assert parser_2.default_language == 'nederlands'
+
+
+def test_abctools_Parser__call_pooled_03():
+    r'''Lexer state stack does not grow across calls.
+    '''
+
+    for _ in range(3):
+        abjad.Staff("c'4 ^ \\markup { foo } d'4")
+    parser = lilypondparsertools.LilyPondParser._check_out(
+        default_language='nederlands',
+        )
+    try:
+        assert parser._lexer.lexstatestack == ['INITIAL']
+        parser("{ c'4 }")
+        assert parser._lexer.lexstatestack == ['INITIAL']
+    finally:
+        parser._check_in()
+
+
+def test_abctools_Parser__call_pooled_04():
+    r'''Concurrent threads parse with different parsers.
+    '''
+
+    results = []
+    errors = []
+
+    def parse(string):
+        try:
+            for _ in range(10):
+                staff = abjad.Staff(string)
+                results.append(format(staff))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=parse, args=("c'4 d'4 e'4 f'4",)),
+        threading.Thread(target=parse, args=("c'4 d'4 e'4 f'4",)),
+        threading.Thread(target=parse, args=("c'4 d'4 e'4 f'4",)),
+        ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(results) == 30
+    assert len(set(results)) == 1
+
+
+def test_abctools_Parser__call_pooled_05():
+    r'''Checks Scheme parser back into pool after parsing Scheme inside
+    LilyPond.
+    '''
+
+    string = r'''c'4 \set Staff.instrumentName = #"Violin" d'4'''
+    for _ in range(2):
+        staff = abjad.Staff(string)
+        assert len(staff) == 2
+
+    parser = lilypondparsertools.SchemeParser._check_out(debug=False)
+    try:
+        parser('"Viola" c\'4')
+    except abjad.SchemeParserFinishedError:
+        assert parser.result == 'Viola'
+    finally:
+        parser._check_in()
+
+    assert lilypondparsertools.SchemeParser._check_out(debug=False) is parser
+    parser._check_in()
@@ -0,0 +1,63 @@
+import abjad
+import os
+import pickle
+import subprocess
+import sys
+from ply import yacc
+
+
+def test_abctools_Parser_packaged_pickle_path_01():
+    r'''Parsing tables shipped with Abjad are current.
+
+    Run abjad/scr/devel/prime-parser-tables when this test fails.
+    '''
+
+    for class_ in (
+        abjad.lilypondparsertools.LilyPondParser,
+        abjad.lilypondparsertools.ReducedLyParser,
+        abjad.lilypondparsertools.SchemeParser,
+        abjad.rhythmtreetools.RhythmTreeParser,
+        ):
+        parser = class_()
+        with open(parser.packaged_pickle_path, 'rb') as file_pointer:
+            table_version = pickle.load(file_pointer)
+            pickle.load(file_pointer)
+            signature = pickle.load(file_pointer)
+        assert table_version == yacc.__tabversion__
+        assert signature == parser._get_signature(), class_.__name__
+        assert parser._has_current_packaged_tables()
+
+
+def test_abctools_Parser_packaged_pickle_path_02():
+    r'''Parsers load packaged tables without setting up the Abjad
+    configuration directory.
+    '''
+
+    command = '\n'.join((
+        'import abjad',
+        'abjad.lilypondparsertools.LilyPondParser()',
+        'abjad.lilypondparsertools.ReducedLyParser()',
+        'abjad.lilypondparsertools.SchemeParser()',
+        'abjad.rhythmtreetools.RhythmTreeParser()("(1 (1 -1))")',
+        'abjad.parse(r"""{ c4 \\set Staff.instrumentName = #"Violin" d4 }""")',
+        ))
+    directory = os.path.dirname(os.path.dirname(abjad.__file__))
+    with abjad.TemporaryDirectory() as temporary_directory:
+        home_directory = os.path.join(temporary_directory, 'home')
+        tmp_directory = os.path.join(temporary_directory, 'tmp')
+        os.mkdir(home_directory)
+        os.mkdir(tmp_directory)
+        environment = os.environ.copy()
+        environment['HOME'] = home_directory
+        environment['TMPDIR'] = tmp_directory
+        process = subprocess.Popen(
+            [sys.executable, '-W', 'ignore', '-c', command],
+            cwd=directory,
+            env=environment,
+            stderr=subprocess.PIPE,
+            )
+        _, error = process.communicate()
+        assert process.returncode == 0, error
+        assert not error, error
+        assert not os.listdir(home_directory)
+        assert not os.path.exists(os.path.join(tmp_directory, '.abjad'))
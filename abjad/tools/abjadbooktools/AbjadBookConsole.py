@@ -20,7 +20,7 @@ class AbjadBookConsole(code.InteractiveConsole):
         ):
         import abjad
         if locals is None:
-            locals = abjad.__dict__.copy()
+            locals = abjad.ImportManager.get_namespace(abjad)
         locals['__builtins__'] = __builtins__.copy()
         locals['__name__'] = '__main__'
         locals['__package__'] = None
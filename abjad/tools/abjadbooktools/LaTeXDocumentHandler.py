@@ -116,7 +116,7 @@ class LaTeXDocumentHandler(abctools.AbjadObject):
             verbose=verbose,
             )
         self._errored = False
-        namespace = abjad.__dict__.copy()
+        namespace = abjad.ImportManager.get_namespace(abjad)
         namespace['abjad'] = abjad
         console = abjadbooktools.AbjadBookConsole(
             document_handler=self,
@@ -111,13 +111,14 @@ class LilyPondOutputProxy(ImageOutputProxy):
         source = format(self.payload)
         with open(ly_file_path, 'w') as file_pointer:
             file_pointer.write(source)
-        systemtools.IOManager.run_lilypond(ly_file_path)
+        result = systemtools.IOManager.run_lilypond(ly_file_path)
         pdf_file_path = os.path.join(
             temporary_directory,
             self.file_name_without_extension + '.pdf',
             )
         if not os.path.exists(pdf_file_path):
             print(format(self.payload))
+            print(result.log)
             raise AssertionError
         assert systemtools.IOManager.find_executable('pdfcrop')
         command = 'pdfcrop {path} {path}'.format(path=pdf_file_path)
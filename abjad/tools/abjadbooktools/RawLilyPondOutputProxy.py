@@ -67,8 +67,6 @@ class RawLilyPondOutputProxy(ImageOutputProxy):
         self,
         temporary_directory,
         ):
-        from abjad import abjad_configuration
-        log_file_path = abjad_configuration.lilypond_log_file_path
         ly_file_path = os.path.join(
             temporary_directory,
             self.file_name_without_extension + '.ly',
@@ -76,15 +74,14 @@ class RawLilyPondOutputProxy(ImageOutputProxy):
         source = format(self.payload)
         with open(ly_file_path, 'w') as file_pointer:
             file_pointer.write(source)
-        systemtools.IOManager.run_lilypond(ly_file_path)
+        result = systemtools.IOManager.run_lilypond(ly_file_path)
         pdf_file_path = os.path.join(
             temporary_directory,
             self.file_name_without_extension + '.pdf',
             )
         if not os.path.exists(pdf_file_path):
             print(format(self.payload))
-            with open(log_file_path) as file_pointer:
-                print(file_pointer.read())
+            print(result.log)
             raise AssertionError
         assert systemtools.IOManager.find_executable('pdfcrop')
         command = 'pdfcrop {path} {path}'.format(path=pdf_file_path)
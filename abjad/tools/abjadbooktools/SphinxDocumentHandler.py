@@ -403,7 +403,7 @@ class SphinxDocumentHandler(abctools.AbjadObject):
         try:
             handler = SphinxDocumentHandler()
             abjad_blocks = handler.collect_abjad_input_blocks(document)
-            namespace = abjad.__dict__.copy()
+            namespace = abjad.ImportManager.get_namespace(abjad)
             namespace['abjad'] = abjad
             for module_name in getattr(
                 app.config, 'abjadbook_console_module_names', ()):
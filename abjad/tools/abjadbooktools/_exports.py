@@ -0,0 +1,35 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AbjadBookConsole',
+    'AbjadBookError',
+    'AbjadBookScript',
+    'AbjadDirective',
+    'AbjadDoctestDirective',
+    'CodeBlock',
+    'CodeBlockSpecifier',
+    'CodeOutputProxy',
+    'GraphvizOutputProxy',
+    'ImageLayoutSpecifier',
+    'ImageOutputProxy',
+    'ImageRenderSpecifier',
+    'ImportDirective',
+    'LaTeXDocumentHandler',
+    'LilyPondBlock',
+    'LilyPondOutputProxy',
+    'RawLilyPondOutputProxy',
+    'RevealDirective',
+    'ShellDirective',
+    'SphinxDocumentHandler',
+    'ThumbnailDirective',
+    'abjad_import_block',
+    'abjad_input_block',
+    'abjad_output_block',
+    'abjad_reveal_block',
+    'abjad_thumbnail_block',
+    'example_function',
+    'run_abjad_book',
+    )
+
+packages = ()
@@ -69,7 +69,8 @@ class DoctestScript(CommandlineScript):
             for module_name in self._module_names_for_globs:
                 try:
                     module = importlib.import_module(module_name)
-                    globs.update(module.__dict__)
+                    namespace = systemtools.ImportManager.get_namespace(module)
+                    globs.update(namespace)
                 except:
                     pass
         external_modules = external_modules or ''
@@ -253,6 +253,7 @@ class ManageBuildTargetScript(ScorePackageScript):
     def _handle_render(
         self,
         target_name,
+        force=False,
         render_back_cover=None,
         render_front_cover=None,
         render_music=None,
@@ -282,22 +283,22 @@ class ManageBuildTargetScript(ScorePackageScript):
             render_score = True
             open_score_only = True
         if render_music:
-            path = self._render_music(build_target_path)
+            path = self._render_music(build_target_path, force=force)
             paths_to_open.append(path)
         if render_parts:
-            path = self._render_parts(build_target_path)
+            path = self._render_parts(build_target_path, force=force)
             paths_to_open.append(path)
         if render_preface:
-            path = self._render_preface(build_target_path)
+            path = self._render_preface(build_target_path, force=force)
             paths_to_open.append(path)
         if render_front_cover:
-            path = self._render_front_cover(build_target_path)
+            path = self._render_front_cover(build_target_path, force=force)
             paths_to_open.append(path)
         if render_back_cover:
-            path = self._render_back_cover(build_target_path)
+            path = self._render_back_cover(build_target_path, force=force)
             paths_to_open.append(path)
         if render_score:
-            path = self._render_score(build_target_path)
+            path = self._render_score(build_target_path, force=force)
             paths_to_open.append(path)
         if any([
             render_preface,
@@ -326,6 +327,7 @@ class ManageBuildTargetScript(ScorePackageScript):
                 )
         if arguments.render:
             self._handle_render(
+                force=arguments.force,
                 render_back_cover=arguments.back_cover,
                 render_front_cover=arguments.front_cover,
                 render_music=arguments.music,
@@ -335,57 +337,63 @@ class ManageBuildTargetScript(ScorePackageScript):
                 target_name=arguments.render,
                 )
 
-    def _render_back_cover(self, build_target_path):
+    def _render_back_cover(self, build_target_path, force=False):
         path = build_target_path.joinpath('back-cover.tex')
         print('Rendering {!s}'.format(path.relative_to(self._score_package_path)))
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_latex(path)
+        return self._run_latex(path, force=force)
 
-    def _render_front_cover(self, build_target_path):
+    def _render_front_cover(self, build_target_path, force=False):
         path = build_target_path.joinpath('front-cover.tex')
         print('Rendering {!s}'.format(path.relative_to(self._score_package_path)))
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_latex(path)
+        return self._run_latex(path, force=force)
 
-    def _render_music(self, build_target_path):
+    def _render_music(self, build_target_path, force=False):
         path = build_target_path.joinpath('music.ly')
         print('Rendering {!s}'.format(path.relative_to(self._score_package_path)))
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_lilypond(path)
+        return self._run_lilypond(path, force=force)
 
-    def _render_parts(self, build_target_path):
+    def _render_parts(self, build_target_path, force=False):
         path = build_target_path.joinpath('parts.ly')
         print('Rendering {!s}'.format(path.relative_to(self._score_package_path)))
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_lilypond(path)
+        return self._run_lilypond(path, force=force)
 
-    def _render_preface(self, build_target_path):
+    def _render_preface(self, build_target_path, force=False):
         path = build_target_path.joinpath('preface.tex')
         print('Rendering {!s}'.format(path.relative_to(self._score_package_path)))
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_latex(path)
+        return self._run_latex(path, force=force)
 
-    def _render_score(self, build_target_path):
+    def _render_score(self, build_target_path, force=False):
         path = build_target_path.joinpath('score.tex')
         print('Rendering {!s}'.format(path.relative_to(self._score_package_path)))
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_latex(path)
+        return self._run_latex(path, force=force)
 
-    def _run_latex(self, latex_path):
+    def _run_latex(self, latex_path, force=False):
         latex_path = latex_path.absolute()
         relative_path = latex_path.relative_to(self._score_package_path)
+        pdf_path = latex_path.with_suffix('.pdf')
+        input_paths = self._find_latex_dependencies(latex_path)
+        fingerprint = self._get_fingerprint(input_paths)
+        if not force and self._is_up_to_date(pdf_path, fingerprint):
+            print('    Unchanged: {!s}'.format(relative_path))
+            return pdf_path
         command = 'xelatex {!s}'.format(latex_path)
         with systemtools.TemporaryDirectoryChange(str(latex_path.parent)):
             for _ in range(2):
@@ -397,10 +405,19 @@ class ManageBuildTargetScript(ScorePackageScript):
                 if exit_code:
                     print('    Failed to render: {!s}'.format(relative_path))
                     sys.exit(1)
-        return latex_path.with_suffix('.pdf')
+        self._update_build_graph(pdf_path, input_paths, fingerprint)
+        return pdf_path
 
-    def _run_lilypond(self, lilypond_path):
+    def _run_lilypond(self, lilypond_path, force=False):
         from abjad import abjad_configuration
+        lilypond_path = lilypond_path.absolute()
+        relative_path = lilypond_path.relative_to(self._score_package_path)
+        pdf_path = lilypond_path.with_suffix('.pdf')
+        input_paths = self._find_lilypond_dependencies(lilypond_path)
+        fingerprint = self._get_fingerprint(input_paths)
+        if not force and self._is_up_to_date(pdf_path, fingerprint):
+            print('    Unchanged: {!s}'.format(relative_path))
+            return pdf_path
         command = '{} -dno-point-and-click -o {} {}'.format(
             # not sure why abjad_configuration.get() returns none:
             #abjad_configuration.get('lilypond_path', 'lilypond'),
@@ -411,10 +428,10 @@ class ManageBuildTargetScript(ScorePackageScript):
         with systemtools.TemporaryDirectoryChange(str(lilypond_path.parent)):
             exit_code = subprocess.call(command, shell=True)
         if exit_code:
-            print('    Failed to render: {!s}'.format(
-                lilypond_path.relative_to(self._score_package_path)))
+            print('    Failed to render: {!s}'.format(relative_path))
             sys.exit(1)
-        return lilypond_path.with_suffix('.pdf')
+        self._update_build_graph(pdf_path, input_paths, fingerprint)
+        return pdf_path
 
     def _setup_argument_parser(self, parser):
         action_group = parser.add_argument_group('actions')
@@ -519,5 +536,5 @@ class ManageBuildTargetScript(ScorePackageScript):
         common_group.add_argument(
             '--force', '-f',
             action='store_true',
-            help='force overwriting',
+            help='force overwriting and rerendering unchanged sources',
             )
@@ -153,7 +153,7 @@ class ManageSegmentScript(ScorePackageScript):
         if exit_code:
             sys.exit(exit_code)
 
-    def _handle_illustrate(self, segment_name, unstaged=False):
+    def _handle_illustrate(self, segment_name, force=False, unstaged=False):
         globbable_names = self._collect_globbable_names(segment_name)
         print('Illustration candidates: {!r} ...'.format(
             ' '.join(globbable_names)))
@@ -165,7 +165,11 @@ class ManageSegmentScript(ScorePackageScript):
             print('    No matching segments.')
             self._handle_list()
         for path in matching_paths:
-            self._illustrate_one_segment(segment_directory=path)
+            if not self._illustrate_one_segment(
+                force=force,
+                segment_directory=path,
+                ):
+                continue
             print('    Illustrated {path!s}{sep}'.format(
                 path=path.relative_to(self._score_package_path.parent),
                 sep=os.path.sep))
@@ -191,7 +195,7 @@ class ManageSegmentScript(ScorePackageScript):
             print('    No segments available.')
         sys.exit(2)
 
-    def _handle_render(self, segment_name, unstaged=False):
+    def _handle_render(self, segment_name, force=False, unstaged=False):
         globbable_names = self._collect_globbable_names(segment_name)
         print('Rendering candidates: {!r} ...'.format(
             ' '.join(globbable_names)))
@@ -203,7 +207,11 @@ class ManageSegmentScript(ScorePackageScript):
             print('    No matching segments.')
             self._handle_list()
         for path in matching_paths:
-            self._render_one_segment(segment_directory=path)
+            if not self._render_one_segment(
+                force=force,
+                segment_directory=path,
+                ):
+                continue
             print('    Rendered {path!s}{sep}'.format(
                 path=path.relative_to(self._score_package_path.parent),
                 sep=os.path.sep))
@@ -242,7 +250,7 @@ class ManageSegmentScript(ScorePackageScript):
         for name in new_staged_names:
             print('    {}'.format(name))
 
-    def _illustrate_one_segment(self, segment_directory):
+    def _illustrate_one_segment(self, segment_directory, force=False):
         print('Illustrating {path!s}{sep}'.format(
             path=segment_directory.relative_to(self._score_package_path.parent),
             sep=os.path.sep))
@@ -255,12 +263,18 @@ class ManageSegmentScript(ScorePackageScript):
             if 0 < index:
                 previous_segment_name = segment_names[index - 1]
             index += 1
+        # segment depends on its modules, segment order and previous metadata
+        input_paths = self._find_python_dependencies(
+            segment_directory.joinpath('definition.py'),
+            )
+        input_paths.append(self._segments_path.joinpath('metadata.json'))
         previous_metadata = {}
         if previous_segment_name:
             previous_segment_metadata_path = self._segments_path.joinpath(
                 previous_segment_name,
                 'metadata.json',
                 )
+            input_paths.append(previous_segment_metadata_path)
             previous_metadata = self._read_json(
                 previous_segment_metadata_path)
         segment_metadata_path = segment_directory.joinpath('metadata.json')
@@ -271,6 +285,17 @@ class ManageSegmentScript(ScorePackageScript):
             previous_metadata.get('measure_count', 0) +
             previous_metadata.get('first_bar_number', 1)
             )
+        ly_path = segment_directory.joinpath('illustration.ly')
+        fingerprint = self._get_fingerprint(input_paths)
+        if not force and self._is_up_to_date(ly_path, fingerprint):
+            message = '    Writing {!s} ... Unchanged!'
+            print(message.format(
+                ly_path.relative_to(self._score_repository_path)))
+            return self._write_lilypond_pdf(
+                force=force,
+                ly_path=ly_path,
+                output_directory=segment_directory,
+                )
         segment_package_path = self._path_to_packagesystem_path(
             segment_directory)
         definition_import_path = segment_package_path + '.definition'
@@ -298,10 +323,13 @@ class ManageSegmentScript(ScorePackageScript):
             lilypond_file,
             output_directory=segment_directory,
             )
+        self._update_build_graph(ly_path, input_paths, fingerprint)
         self._write_lilypond_pdf(
+            force=force,
             ly_path=ly_path,
             output_directory=segment_directory,
             )
+        return True
 
     def _process_args(self, arguments):
         self._setup_paths(arguments.score_path)
@@ -311,6 +339,7 @@ class ManageSegmentScript(ScorePackageScript):
             self._handle_edit(segment_name=arguments.edit)
         if arguments.illustrate is not None:
             self._handle_illustrate(
+                force=arguments.force,
                 segment_name=arguments.illustrate,
                 unstaged=arguments.unstaged,
                 )
@@ -320,6 +349,7 @@ class ManageSegmentScript(ScorePackageScript):
             self._handle_create(force=arguments.force, segment_name=arguments.new)
         if arguments.render is not None:
             self._handle_render(
+                force=arguments.force,
                 segment_name=arguments.render,
                 unstaged=arguments.unstaged,
                 )
@@ -339,7 +369,7 @@ class ManageSegmentScript(ScorePackageScript):
         contents = '\n'.join(contents)
         return contents
 
-    def _render_one_segment(self, segment_directory):
+    def _render_one_segment(self, segment_directory, force=False):
         print('Rendering {path!s}{sep}'.format(
             path=segment_directory.relative_to(self._score_package_path.parent),
             sep=os.path.sep))
@@ -347,7 +377,8 @@ class ManageSegmentScript(ScorePackageScript):
         if not ly_path.is_file():
             print('    illustration.ly is missing or malformed.')
             sys.exit(1)
-        self._write_lilypond_pdf(
+        return self._write_lilypond_pdf(
+            force=force,
             ly_path=ly_path,
             output_directory=segment_directory,
             )
@@ -421,7 +452,7 @@ class ManageSegmentScript(ScorePackageScript):
         common_group.add_argument(
             '--force', '-f',
             action='store_true',
-            help='force overwriting',
+            help='force overwriting and rebuilding unchanged segments',
             )
         common_group.add_argument(
             '-u', '--unstaged',
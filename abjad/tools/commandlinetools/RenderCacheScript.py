@@ -0,0 +1,55 @@
+from abjad.tools.commandlinetools.CommandlineScript import CommandlineScript
+
+
+class RenderCacheScript(CommandlineScript):
+    r'''Reports, prunes or clears LilyPond render cache.
+
+    ..  shell::
+
+        ajv render-cache --help
+
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    alias = 'render-cache'
+    short_description = 'Report, prune or clear LilyPond render cache.'
+
+    ### PRIVATE METHODS ###
+
+    def _process_args(self, arguments):
+        import abjad
+        cache = abjad.LilyPondRenderCache(directory=arguments.directory)
+        if arguments.clear:
+            cache.clear()
+        elif arguments.prune is not None:
+            maximum_size = int(arguments.prune * 1024 * 1024)
+            count = cache.prune(maximum_size=maximum_size)
+            print('Evicted {} entries.'.format(count))
+        message = '{} entries, {:.1f} MB in {}'
+        message = message.format(
+            cache.entry_count,
+            cache.size / 1024.0 / 1024.0,
+            cache.directory,
+            )
+        print(message)
+
+    def _setup_argument_parser(self, parser):
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='remove all entries',
+            )
+        parser.add_argument(
+            '--directory',
+            help='cache directory (default: render_cache in output directory)',
+            metavar='DIRECTORY',
+            )
+        parser.add_argument(
+            '--prune',
+            help='evict least recently used entries down to MEGABYTES',
+            metavar='MEGABYTES',
+            type=float,
+            )
@@ -1,5 +1,7 @@
 import abc
+import ast
 import collections
+import hashlib
 import importlib
 import json
 import os
@@ -32,6 +34,13 @@ class ScorePackageScript(CommandlineScript):
         '_segments_path',
         )
 
+    _latex_include_re = re.compile(
+        r'\\(input|include|includepdf|includegraphics)\s*'
+        r'(\[[^\]]*\])?\s*\{([^}]+)\}'
+        )
+
+    _lilypond_include_re = re.compile(r'\\include\s+"([^"]+)"')
+
     _name_re = re.compile('^[a-z][a-z0-9_]*$')
 
     ### INITIALIZER ###
@@ -125,15 +134,162 @@ class ScorePackageScript(CommandlineScript):
                 self._template_file(path, **metadata)
         return target_path
 
+    def _find_latex_dependencies(self, latex_path):
+        # LaTeX resolves paths against directory in which it runs
+        directory = latex_path.parent
+        paths, queue = [], [latex_path]
+        while queue:
+            path = queue.pop(0)
+            if path in paths:
+                continue
+            paths.append(path)
+            if path.suffix != '.tex' or not path.is_file():
+                continue
+            with open(str(path), 'r') as file_pointer:
+                contents = file_pointer.read()
+            for match in self._latex_include_re.finditer(contents):
+                command, name = match.group(1), match.group(3).strip()
+                dependency_path = directory.joinpath(name)
+                if command in ('input', 'include'):
+                    if not dependency_path.suffix:
+                        dependency_path = dependency_path.with_suffix('.tex')
+                dependency_path = os.path.normpath(str(dependency_path))
+                queue.append(pathlib.Path(dependency_path))
+        return paths
+
+    def _find_lilypond_dependencies(self, ly_path):
+        # score packages set relative-includes; fall back to main directory
+        directory = ly_path.parent
+        paths, queue = [], [ly_path]
+        while queue:
+            path = queue.pop(0)
+            if path in paths:
+                continue
+            paths.append(path)
+            if not path.is_file():
+                continue
+            with open(str(path), 'r') as file_pointer:
+                contents = file_pointer.read()
+            for match in self._lilypond_include_re.finditer(contents):
+                name = match.group(1)
+                dependency_path = path.parent.joinpath(name)
+                if not dependency_path.exists():
+                    if directory.joinpath(name).exists():
+                        dependency_path = directory.joinpath(name)
+                dependency_path = os.path.normpath(str(dependency_path))
+                queue.append(pathlib.Path(dependency_path))
+        return paths
+
+    def _find_module_paths(self, directory, parts):
+        if parts:
+            module_path = directory.joinpath(*parts[:-1])
+            module_path = module_path.joinpath(parts[-1] + '.py')
+            if module_path.is_file():
+                return [module_path]
+        package_path = directory.joinpath(*parts)
+        initializer_path = package_path.joinpath('__init__.py')
+        if not initializer_path.is_file():
+            return []
+        paths = [initializer_path]
+        # material and segment packages define their objects here
+        definition_path = package_path.joinpath('definition.py')
+        if definition_path.is_file():
+            paths.append(definition_path)
+        with open(str(initializer_path), 'r') as file_pointer:
+            contents = file_pointer.read()
+        if 'ImportManager' in contents:
+            # package imports all of its modules and subpackages at runtime
+            for path in sorted(package_path.glob('*')):
+                if path.suffix == '.py' and path != initializer_path:
+                    paths.append(path)
+                elif path.is_dir():
+                    paths.extend(self._find_module_paths(path, []))
+        return paths
+
+    def _find_python_dependencies(self, module_path):
+        score_package_name = self._score_package_path.name
+        paths, queue = [], [module_path]
+        while queue:
+            path = queue.pop(0)
+            if path in paths:
+                continue
+            paths.append(path)
+            if not path.is_file():
+                continue
+            try:
+                with open(str(path), 'r') as file_pointer:
+                    tree = ast.parse(file_pointer.read())
+            except (SyntaxError, ValueError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        parts = alias.name.split('.')
+                        if parts[0] != score_package_name:
+                            continue
+                        queue.extend(self._find_module_paths(
+                            self._score_repository_path,
+                            parts,
+                            ))
+                elif isinstance(node, ast.ImportFrom):
+                    parts = (node.module or '').split('.')
+                    parts = [_ for _ in parts if _]
+                    if node.level:
+                        directory = path.parent
+                        for _ in range(node.level - 1):
+                            directory = directory.parent
+                    elif parts and parts[0] == score_package_name:
+                        directory = self._score_repository_path
+                    else:
+                        continue
+                    for alias in node.names:
+                        # imported names are modules or attributes of module
+                        module_paths = self._find_module_paths(
+                            directory,
+                            parts + [alias.name],
+                            )
+                        if not module_paths:
+                            module_paths = self._find_module_paths(
+                                directory,
+                                parts,
+                                )
+                        queue.extend(module_paths)
+        return paths
+
     @classmethod
     def _get_boilerplate_path(cls):
         import abjad
         return pathlib.Path(abjad.__path__[0]).joinpath('boilerplate')
 
+    def _get_build_graph_key(self, path):
+        return path.relative_to(self._score_repository_path).as_posix()
+
+    def _get_build_graph_path(self):
+        return self._score_repository_path.joinpath('.build_graph.json')
+
     @classmethod
     def _get_current_working_directory(self):
         return pathlib.Path('.').absolute()
 
+    def _get_fingerprint(self, input_paths):
+        import abjad
+        hash_ = hashlib.sha256()
+        hash_.update(abjad.__version__.encode('utf-8'))
+        for path in input_paths:
+            hash_.update(b'\0')
+            try:
+                name = self._get_build_graph_key(path)
+            except ValueError:
+                name = str(path)
+            hash_.update(name.encode('utf-8'))
+            hash_.update(b'\0')
+            try:
+                with open(str(path), 'rb') as file_pointer:
+                    hash_.update(file_pointer.read())
+            except (IOError, OSError):
+                hash_.update(b'\1missing')
+        return hash_.hexdigest()
+
     def _import_all_materials(self, verbose=True):
         materials = collections.OrderedDict()
         for path in self._list_material_subpackages():
@@ -176,6 +332,17 @@ class ScorePackageScript(CommandlineScript):
                 traceback.print_exc()
                 raise SystemExit(1)
 
+    def _is_up_to_date(self, output_path, fingerprint):
+        if not output_path.exists():
+            return False
+        build_graph = self._read_json(
+            self._get_build_graph_path(),
+            verbose=False,
+            )
+        key = self._get_build_graph_key(output_path)
+        node = build_graph.get(key, {})
+        return node.get('fingerprint') == fingerprint
+
     def _list_material_subpackages(self, score_path=None):
         materials_path = self._materials_path
         if score_path:
@@ -373,6 +540,21 @@ class ScorePackageScript(CommandlineScript):
         with open(file_path, 'w') as file_pointer:
             file_pointer.write(completed_template)
 
+    def _update_build_graph(self, output_path, input_paths, fingerprint):
+        build_graph_path = self._get_build_graph_path()
+        build_graph = self._read_json(build_graph_path, verbose=False)
+        inputs = []
+        for path in input_paths:
+            try:
+                inputs.append(self._get_build_graph_key(path))
+            except ValueError:
+                inputs.append(str(path))
+        build_graph[self._get_build_graph_key(output_path)] = {
+            'fingerprint': fingerprint,
+            'inputs': inputs,
+            }
+        self._write_json(build_graph, build_graph_path, verbose=False)
+
     def _write_json(self, argument, path, verbose=True):
         if verbose:
             message = '    Writing {!s}'
@@ -417,6 +599,7 @@ class ScorePackageScript(CommandlineScript):
         self,
         ly_path,
         output_directory,
+        force=True,
         ):
         from abjad import abjad_configuration
         pdf_path = output_directory.joinpath('illustration.pdf')
@@ -425,6 +608,11 @@ class ScorePackageScript(CommandlineScript):
             pdf_path.relative_to(self._score_repository_path)
             )
         print(message, end='')
+        input_paths = self._find_lilypond_dependencies(ly_path)
+        fingerprint = self._get_fingerprint(input_paths)
+        if not force and self._is_up_to_date(pdf_path, fingerprint):
+            print('Unchanged!')
+            return False
         command = '{} -dno-point-and-click -o {} {}'.format(
             # not sure why the call to abjad_configuration.get() returns none:
             #abjad_configuration.get('lilypond_path', 'lilypond'),
@@ -440,6 +628,8 @@ class ScorePackageScript(CommandlineScript):
             sys.exit(1)
         print('OK!')
         self._report_time(timer, prefix='LilyPond runtime')
+        self._update_build_graph(pdf_path, input_paths, fingerprint)
+        return True
 
     def _write_score_metadata_json(self, score_path=None, verbose=True, **keywords):
         if score_path:
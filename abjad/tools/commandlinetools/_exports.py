@@ -0,0 +1,22 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AbjDevScript',
+    'BuildApiScript',
+    'CheckClassSections',
+    'CleanScript',
+    'CommandlineScript',
+    'DoctestScript',
+    'ManageBuildTargetScript',
+    'ManageMaterialScript',
+    'ManageScoreScript',
+    'ManageSegmentScript',
+    'RenderCacheScript',
+    'ReplaceScript',
+    'ScorePackageScript',
+    'StatsScript',
+    'run_ajv',
+    )
+
+packages = ()
@@ -1,11 +1,25 @@
+import os
 import pathlib
 import shutil
 import sys
+import time
 from abjad.tools import commandlinetools
 from abjad.tools import datastructuretools
 from abjad.tools import systemtools
 
 
+def fake_render(command, shell=False):
+    r'''Writes PDF for LilyPond or LaTeX `command` without rendering.
+
+    PDF contents differ from run to run, as real PDF timestamps do.
+    '''
+    source_path = command.split()[-1]
+    pdf_path = os.path.splitext(source_path)[0] + '.pdf'
+    with open(pdf_path, 'w') as file_pointer:
+        file_pointer.write('{}\n{!r}\n'.format(command, time.time()))
+    return 0
+
+
 class ScorePackageScriptTestCase(systemtools.TestCase):
     r'''A base test class for score-package scripts.
     '''
@@ -2,6 +2,7 @@ import abjad
 import os
 import platform
 from base import ScorePackageScriptTestCase
+from base import fake_render
 try:
     from unittest import mock
 except ImportError:
@@ -10,6 +11,55 @@ except ImportError:
 
 class Test(ScorePackageScriptTestCase):
 
+    @mock.patch('abjad.IOManager.open_file')
+    @mock.patch('subprocess.call', side_effect=fake_render)
+    def test_incremental(self, call_mock, open_file_mock):
+        self.create_score()
+        self.create_segment('test_segment')
+        self.illustrate_segments()
+        self.collect_segments()
+        target_path = self.create_build_target()
+        script = abjad.commandlinetools.ManageBuildTargetScript()
+        command = ['--render', 'letter-portrait']
+        with abjad.TemporaryDirectoryChange(str(self.score_path)):
+            script(command)
+        with abjad.RedirectedStreams(stdout=self.string_io):
+            with abjad.TemporaryDirectoryChange(str(self.score_path)):
+                script(command)
+        self.compare_captured_output(r'''
+            Rendering builds/letter-portrait/music.ly
+                Unchanged: builds/letter-portrait/music.ly
+            Rendering builds/letter-portrait/parts.ly
+                Unchanged: builds/letter-portrait/parts.ly
+            Rendering builds/letter-portrait/preface.tex
+                Unchanged: builds/letter-portrait/preface.tex
+            Rendering builds/letter-portrait/front-cover.tex
+                Unchanged: builds/letter-portrait/front-cover.tex
+            Rendering builds/letter-portrait/back-cover.tex
+                Unchanged: builds/letter-portrait/back-cover.tex
+            Rendering builds/letter-portrait/score.tex
+                Unchanged: builds/letter-portrait/score.tex
+        '''.replace('/', os.path.sep))
+        segment_path = self.build_path.joinpath(
+            'segments',
+            'test-segment.ily',
+            )
+        with open(str(segment_path), 'a') as file_pointer:
+            file_pointer.write('\n% changed\n')
+        call_count = call_mock.call_count
+        with abjad.TemporaryDirectoryChange(str(self.score_path)):
+            script(command)
+        rendered_names = [
+            os.path.basename(_[0][0].split()[-1])
+            for _ in call_mock.call_args_list[call_count:]
+            ]
+        # score includes music PDF and renders twice
+        assert rendered_names == ['music.ly', 'score.tex', 'score.tex']
+        with abjad.TemporaryDirectoryChange(str(self.score_path)):
+            script(command + ['--force'])
+        assert call_mock.call_count == call_count + 3 + 10
+        assert target_path.joinpath('score.pdf').exists()
+
     @mock.patch('abjad.IOManager.open_file')
     def test_success_all(self, open_file_mock):
         expected_files = [
@@ -1,7 +1,9 @@
 import abjad
 import os
 import platform
+import sys
 from base import ScorePackageScriptTestCase
+from base import fake_render
 try:
     from unittest import mock
 except ImportError:
@@ -50,6 +52,138 @@ class Test(ScorePackageScriptTestCase):
         }
         ''')
 
+    @mock.patch('abjad.IOManager.open_file')
+    @mock.patch('subprocess.call', side_effect=fake_render)
+    def test_incremental_changed_definition(self, call_mock, open_file_mock):
+        """
+        Reillustrate changed segments and segments after changed metadata.
+        """
+        self.create_score()
+        self.install_fancy_segment_maker()
+        self.create_segment('segment_one')
+        path_2 = self.create_segment('segment_two')
+        path_3 = self.create_segment('segment_three')
+        self.illustrate_segments()
+        definition_path = path_2.joinpath('definition.py')
+        with open(str(definition_path), 'w') as file_pointer:
+            file_pointer.write(abjad.String.normalize(r'''
+            from test_score.tools import SegmentMaker
+
+
+            segment_maker = SegmentMaker(measure_count=2)
+            '''))
+        # command line runs start with fresh modules
+        del(sys.modules['test_score.segments.segment_two.definition'])
+        script = abjad.commandlinetools.ManageSegmentScript()
+        command = ['--illustrate', '*']
+        with abjad.RedirectedStreams(stdout=self.string_io):
+            with abjad.TemporaryDirectoryChange(str(self.score_path)):
+                script(command)
+        self.compare_captured_output(r'''
+            Illustration candidates: '*' ...
+                Reading test_score/segments/metadata.json ... OK!
+            Illustrating test_score/segments/segment_one/
+                Reading test_score/segments/metadata.json ... OK!
+                Reading test_score/segments/segment_one/metadata.json ... OK!
+                Writing test_score/segments/segment_one/illustration.ly ... Unchanged!
+                Writing test_score/segments/segment_one/illustration.pdf ... Unchanged!
+            Illustrating test_score/segments/segment_two/
+                Reading test_score/segments/metadata.json ... OK!
+                Reading test_score/segments/segment_one/metadata.json ... OK!
+                Reading test_score/segments/segment_two/metadata.json ... OK!
+                Importing test_score.segments.segment_two.definition
+                Writing test_score/segments/segment_two/metadata.json
+                    Abjad runtime: ... second...
+                Writing test_score/segments/segment_two/illustration.ly ... OK!
+                Writing test_score/segments/segment_two/illustration.pdf ... OK!
+                    LilyPond runtime: ... second...
+                Illustrated test_score/segments/segment_two/
+            Illustrating test_score/segments/segment_three/
+                Reading test_score/segments/metadata.json ... OK!
+                Reading test_score/segments/segment_two/metadata.json ... OK!
+                Reading test_score/segments/segment_three/metadata.json ... OK!
+                Importing test_score.segments.segment_three.definition
+                Writing test_score/segments/segment_three/metadata.json
+                    Abjad runtime: ... second...
+                Writing test_score/segments/segment_three/illustration.ly ... OK!
+                Writing test_score/segments/segment_three/illustration.pdf ... OK!
+                    LilyPond runtime: ... second...
+                Illustrated test_score/segments/segment_three/
+        '''.replace('/', os.path.sep))
+        with open(str(path_3.joinpath('metadata.json'))) as file_pointer:
+            assert '"first_bar_number": 4' in file_pointer.read()
+
+    @mock.patch('abjad.IOManager.open_file')
+    @mock.patch('subprocess.call', side_effect=fake_render)
+    def test_incremental_changed_stylesheet(self, call_mock, open_file_mock):
+        """
+        Rerender without reillustrating when stylesheet changes.
+        """
+        self.create_score()
+        self.create_segment('test_segment')
+        self.illustrate_segments()
+        stylesheet_path = self.score_path.joinpath(
+            'test_score',
+            'stylesheets',
+            'stylesheet.ily',
+            )
+        with open(str(stylesheet_path), 'a') as file_pointer:
+            file_pointer.write('\n% changed\n')
+        script = abjad.commandlinetools.ManageSegmentScript()
+        command = ['--illustrate', '*']
+        with abjad.RedirectedStreams(stdout=self.string_io):
+            with abjad.TemporaryDirectoryChange(str(self.score_path)):
+                script(command)
+        self.compare_captured_output(r'''
+            Illustration candidates: '*' ...
+                Reading test_score/segments/metadata.json ... OK!
+            Illustrating test_score/segments/test_segment/
+                Reading test_score/segments/metadata.json ... OK!
+                Reading test_score/segments/test_segment/metadata.json ... OK!
+                Writing test_score/segments/test_segment/illustration.ly ... Unchanged!
+                Writing test_score/segments/test_segment/illustration.pdf ... OK!
+                    LilyPond runtime: ... second...
+                Illustrated test_score/segments/test_segment/
+        '''.replace('/', os.path.sep))
+
+    @mock.patch('abjad.IOManager.open_file')
+    @mock.patch('subprocess.call', side_effect=fake_render)
+    def test_incremental_unchanged(self, call_mock, open_file_mock):
+        """
+        Skip unchanged segments unless forced.
+        """
+        self.create_score()
+        self.create_segment('segment_one')
+        self.create_segment('segment_two')
+        self.illustrate_segments()
+        assert call_mock.call_count == 2
+        script = abjad.commandlinetools.ManageSegmentScript()
+        command = ['--illustrate', '*']
+        with abjad.RedirectedStreams(stdout=self.string_io):
+            with abjad.TemporaryDirectoryChange(str(self.score_path)):
+                script(command)
+        self.compare_captured_output(r'''
+            Illustration candidates: '*' ...
+                Reading test_score/segments/metadata.json ... OK!
+            Illustrating test_score/segments/segment_one/
+                Reading test_score/segments/metadata.json ... OK!
+                Reading test_score/segments/segment_one/metadata.json ... OK!
+                Writing test_score/segments/segment_one/illustration.ly ... Unchanged!
+                Writing test_score/segments/segment_one/illustration.pdf ... Unchanged!
+            Illustrating test_score/segments/segment_two/
+                Reading test_score/segments/metadata.json ... OK!
+                Reading test_score/segments/segment_one/metadata.json ... OK!
+                Reading test_score/segments/segment_two/metadata.json ... OK!
+                Writing test_score/segments/segment_two/illustration.ly ... Unchanged!
+                Writing test_score/segments/segment_two/illustration.pdf ... Unchanged!
+        '''.replace('/', os.path.sep))
+        assert call_mock.call_count == 2
+        command = ['--illustrate', '*', '--force']
+        with abjad.RedirectedStreams(stdout=self.string_io):
+            with abjad.TemporaryDirectoryChange(str(self.score_path)):
+                script(command)
+        assert call_mock.call_count == 4
+
     def test_lilypond_error(self):
         """
         Handle failing LilyPond rendering.
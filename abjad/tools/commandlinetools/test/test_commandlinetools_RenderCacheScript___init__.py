@@ -0,0 +1,28 @@
+import abjad
+import io
+import os
+
+
+def test_commandlinetools_RenderCacheScript___init___01():
+    r'''Prunes and clears cache directory.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.LilyPondRenderCache(directory=directory)
+        for name in ('a', 'b'):
+            entry = os.path.join(directory, name)
+            os.mkdir(entry)
+            with open(os.path.join(entry, '.pdf'), 'w') as file_pointer:
+                file_pointer.write(1024 * 1024 * 'x')
+        script = abjad.commandlinetools.RenderCacheScript()
+        string_io = io.StringIO()
+        with abjad.RedirectedStreams(stdout=string_io):
+            script(['--directory', directory])
+        assert string_io.getvalue().startswith('2 entries, 2.0 MB in ')
+        string_io = io.StringIO()
+        with abjad.RedirectedStreams(stdout=string_io):
+            script(['--directory', directory, '--prune', '1'])
+        assert string_io.getvalue().startswith('Evicted 1 entries.\n1 entries')
+        with abjad.RedirectedStreams(stdout=io.StringIO()):
+            script(['--directory', directory, '--clear'])
+        assert cache.entry_count == 0
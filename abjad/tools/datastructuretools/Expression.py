@@ -914,7 +914,7 @@ class Expression(AbjadValueObject):
     def _make_globals(self):
         import abjad
         globals_ = {'abjad': abjad}
-        globals_.update(abjad.__dict__.copy())
+        globals_.update(abjad.ImportManager.get_namespace(abjad))
         module_names = self.module_names or []
         if self.qualified_method_name is not None:
             parts = self.qualified_method_name.split('.')
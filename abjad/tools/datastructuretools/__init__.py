@@ -27,5 +27,6 @@ del(mathtools)
 systemtools.ImportManager.import_structured_package(
     __path__[0],
     globals(),
+    lazy=True,
     )
 _documentation_section = 'core'
@@ -0,0 +1,31 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'CyclicTuple',
+    'Duration',
+    'DurationInequality',
+    'Enumeration',
+    'Expression',
+    'Inequality',
+    'LengthInequality',
+    'Multiplier',
+    'Offset',
+    'OrdinalConstant',
+    'Pattern',
+    'PatternTuple',
+    'PitchInequality',
+    'Sequence',
+    'SortedCollection',
+    'String',
+    'TreeContainer',
+    'TreeNode',
+    'TypedCollection',
+    'TypedCounter',
+    'TypedFrozenset',
+    'TypedList',
+    'TypedOrderedDict',
+    'TypedTuple',
+    )
+
+packages = ()
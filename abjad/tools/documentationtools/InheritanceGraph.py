@@ -2,6 +2,7 @@ import importlib
 import inspect
 import types
 from abjad.tools.abctools.AbjadObject import AbjadObject
+from abjad.tools.systemtools.ImportManager import ImportManager
 
 
 class InheritanceGraph(AbjadObject):
@@ -386,7 +387,8 @@ class InheritanceGraph(AbjadObject):
                         module = None
                 if module is None:
                     continue
-                for y in module.__dict__.values():
+                namespace = ImportManager.get_namespace(module)
+                for y in namespace.values():
                     if isinstance(y, type):
                         all_classes.add(y)
                         immediate_classes.add(y)
@@ -512,7 +514,8 @@ class InheritanceGraph(AbjadObject):
     @classmethod
     def _submodule_recurse(cls, module, visited_modules):
         result = []
-        for obj in list(module.__dict__.values()):
+        namespace = ImportManager.get_namespace(module)
+        for obj in list(namespace.values()):
             if isinstance(obj, type):
                 result.append(obj)
             elif isinstance(obj, types.ModuleType) and \
@@ -0,0 +1,37 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'DocumentationManager',
+    'InheritanceGraph',
+    'ReSTAutodocDirective',
+    'ReSTAutosummaryDirective',
+    'ReSTAutosummaryItem',
+    'ReSTDirective',
+    'ReSTDocument',
+    'ReSTGraphvizDirective',
+    'ReSTHeading',
+    'ReSTHorizontalRule',
+    'ReSTInheritanceDiagram',
+    'ReSTLineageDirective',
+    'ReSTOnlyDirective',
+    'ReSTParagraph',
+    'ReSTTOCDirective',
+    'ReSTTOCItem',
+    'compare_images',
+    'list_all_abjad_classes',
+    'list_all_abjad_functions',
+    'list_all_classes',
+    'list_all_functions',
+    'list_all_ide_classes',
+    'list_all_ide_functions',
+    'make_ligeti_example_lilypond_file',
+    'make_reference_manual_graphviz_graph',
+    'make_reference_manual_lilypond_file',
+    'make_text_alignment_example_lilypond_file',
+    'yield_all_classes',
+    'yield_all_functions',
+    'yield_all_modules',
+    )
+
+packages = ()
@@ -0,0 +1,20 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AssignabilityError',
+    'ExtraSpannerError',
+    'ImpreciseMetronomeMarkError',
+    'LilyPondParserError',
+    'MissingMeasureError',
+    'MissingMetronomeMarkError',
+    'MissingSpannerError',
+    'OverfullContainerError',
+    'ParentageError',
+    'SchemeParserFinishedError',
+    'UnboundedTimeIntervalError',
+    'UnderfullContainerError',
+    'WellformednessError',
+    )
+
+packages = ()
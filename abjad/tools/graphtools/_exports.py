@@ -0,0 +1,19 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'GraphvizEdge',
+    'GraphvizField',
+    'GraphvizGraph',
+    'GraphvizGroup',
+    'GraphvizMixin',
+    'GraphvizNode',
+    'GraphvizSubgraph',
+    'GraphvizTable',
+    'GraphvizTableCell',
+    'GraphvizTableHorizontalRule',
+    'GraphvizTableRow',
+    'GraphvizTableVerticalRule',
+    )
+
+packages = ()
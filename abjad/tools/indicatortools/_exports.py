@@ -0,0 +1,46 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Accelerando',
+    'Arpeggio',
+    'ArrowLineSegment',
+    'Articulation',
+    'BarLine',
+    'BendAfter',
+    'BowContactPoint',
+    'BowMotionTechnique',
+    'BowPressure',
+    'BreathMark',
+    'Clef',
+    'ColorFingering',
+    'Dynamic',
+    'Fermata',
+    'KeyCluster',
+    'KeySignature',
+    'LaissezVibrer',
+    'LilyPondCommand',
+    'LilyPondComment',
+    'LilyPondLiteral',
+    'LineBreak',
+    'LineSegment',
+    'MetricModulation',
+    'MetronomeMark',
+    'MetronomeMarkDictionary',
+    'PageBreak',
+    'RehearsalMark',
+    'Repeat',
+    'Ritardando',
+    'Staccatissimo',
+    'Staccato',
+    'StaffChange',
+    'StemTremolo',
+    'StringContactPoint',
+    'StringNumber',
+    'TimeSignature',
+    'Tremolo',
+    'Tuning',
+    'WoodwindFingering',
+    )
+
+packages = ()
@@ -0,0 +1,56 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Accordion',
+    'AltoFlute',
+    'AltoSaxophone',
+    'AltoTrombone',
+    'AltoVoice',
+    'BaritoneSaxophone',
+    'BaritoneVoice',
+    'BassClarinet',
+    'BassFlute',
+    'BassSaxophone',
+    'BassTrombone',
+    'BassVoice',
+    'Bassoon',
+    'Cello',
+    'ClarinetInA',
+    'ClarinetInBFlat',
+    'ClarinetInEFlat',
+    'Contrabass',
+    'ContrabassClarinet',
+    'ContrabassFlute',
+    'ContrabassSaxophone',
+    'Contrabassoon',
+    'EnglishHorn',
+    'Flute',
+    'FrenchHorn',
+    'Glockenspiel',
+    'Guitar',
+    'Harp',
+    'Harpsichord',
+    'Instrument',
+    'InstrumentDictionary',
+    'Marimba',
+    'MezzoSopranoVoice',
+    'Oboe',
+    'Percussion',
+    'Piano',
+    'Piccolo',
+    'SopraninoSaxophone',
+    'SopranoSaxophone',
+    'SopranoVoice',
+    'TenorSaxophone',
+    'TenorTrombone',
+    'TenorVoice',
+    'Trumpet',
+    'Tuba',
+    'Vibraphone',
+    'Viola',
+    'Violin',
+    'Xylophone',
+    )
+
+packages = ()
@@ -125,60 +125,9 @@ class Block(AbjadObject):
 
     ### PRIVATE METHODS ###
 
-    def _format_item(self, item, depth=1, strict=False):
-        import abjad
-        indent = abjad.LilyPondFormatManager.indent * depth
-        result = []
-        if isinstance(item, (list, tuple)):
-            result.append(indent + '{')
-            depth_ = depth + 1
-            for x in item:
-                pieces = self._format_item(x, depth=depth_, strict=strict)
-                result.extend(pieces)
-            result.append(indent + '}')
-        elif isinstance(item, str):
-            string = indent + item
-            result.append(string)
-        elif '_get_format_pieces' in dir(item):
-            try:
-                pieces = item._get_format_pieces(strict=strict)
-            except TypeError:
-                pieces = item._get_format_pieces()
-            pieces = (indent + item for item in pieces)
-            result.extend(pieces)
-        return result
-
     def _get_format_pieces(self, strict=False):
-        import abjad
-        indent = abjad.LilyPondFormatManager.indent
         result = []
-        if (not self._get_formatted_user_attributes() and
-            not getattr(self, 'contexts', None) and
-            not getattr(self, 'context_blocks', None) and
-            not len(self.items)
-            ):
-            if self.name == 'score':
-                return ''
-            string = '{} {{}}'.format(self._escaped_name)
-            result.append(string)
-            return result
-        string = '{} {{'.format(self._escaped_name)
-        result.append(string)
-        for item in self.items:
-            if isinstance(item, abjad.ContextBlock):
-                continue
-            if isinstance(item, (abjad.Leaf, abjad.Markup)):
-                item = [item]
-            result.extend(self._format_item(item, strict=strict))
-        formatted_attributes = self._get_formatted_user_attributes()
-        formatted_attributes = [indent + _ for _ in formatted_attributes]
-        result.extend(formatted_attributes)
-        formatted_context_blocks = getattr(
-            self, '_formatted_context_blocks', [])
-        formatted_context_blocks = [
-            indent + _ for _ in formatted_context_blocks]
-        result.extend(formatted_context_blocks)
-        result.append('}')
+        self._write_format_pieces(result.append, strict=strict)
         return result
 
     def _get_format_specification(self):
@@ -233,6 +182,76 @@ class Block(AbjadObject):
     def _get_lilypond_format(self, strict=False):
         return '\n'.join(self._get_format_pieces(strict=strict))
 
+    def _write_format_pieces(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        import abjad
+        indent_ = abjad.LilyPondFormatManager.indent
+        if (not self._get_formatted_user_attributes() and
+            not getattr(self, 'contexts', None) and
+            not getattr(self, 'context_blocks', None) and
+            not len(self.items)
+            ):
+            if self.name == 'score':
+                return
+            string = '{} {{}}'.format(self._escaped_name)
+            write(indent + string)
+            return
+        string = '{} {{'.format(self._escaped_name)
+        write(indent + string)
+        for item in self.items:
+            if isinstance(item, abjad.ContextBlock):
+                continue
+            if isinstance(item, (abjad.Leaf, abjad.Markup)):
+                item = [item]
+            self._write_item(
+                item,
+                write,
+                indent=indent,
+                strict=strict,
+                workers=workers,
+                )
+        for string in self._get_formatted_user_attributes():
+            write(indent + indent_ + string)
+        for string in getattr(self, '_formatted_context_blocks', []):
+            write(indent + indent_ + string)
+        write(indent + '}')
+
+    def _write_item(self, item, write, indent='', strict=False, workers=None):
+        import abjad
+        indent += abjad.LilyPondFormatManager.indent
+        if isinstance(item, (list, tuple)):
+            write(indent + '{')
+            for x in item:
+                self._write_item(
+                    x,
+                    write,
+                    indent=indent,
+                    strict=strict,
+                    workers=workers,
+                    )
+            write(indent + '}')
+        elif isinstance(item, str):
+            write(indent + item)
+        elif hasattr(item, '_write_format_pieces'):
+            item._write_format_pieces(
+                write,
+                indent=indent,
+                strict=strict,
+                workers=workers,
+                )
+        elif '_get_format_pieces' in dir(item):
+            try:
+                pieces = item._get_format_pieces(strict=strict)
+            except TypeError:
+                pieces = item._get_format_pieces()
+            for piece in pieces:
+                write(indent + piece)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -121,6 +121,17 @@ class ContextBlock(Block):
         result.append('}')
         return result
 
+    # ignores strict and workers keywords
+    def _write_format_pieces(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        for piece in self._get_format_pieces():
+            write(indent + piece)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -384,26 +384,7 @@ class LilyPondFile(AbjadObject):
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self, strict=False):
-        result = []
-        if self.date_time_token is not None:
-            string = '% {}'.format(self.date_time_token)
-            result.append(string)
-        result.extend(self._get_formatted_comments())
-        includes = []
-        if self.lilypond_version_token is not None:
-            string = '{}'.format(self.lilypond_version_token)
-            includes.append(string)
-        if self.lilypond_language_token is not None:
-            string = '{}'.format(self.lilypond_language_token)
-            includes.append(string)
-        includes = '\n'.join(includes)
-        if includes:
-            result.append(includes)
-        if self.use_relative_includes:
-            string = "#(ly:set-option 'relative-includes #t)"
-            result.append(string)
-        result.extend(self._get_formatted_includes())
-        result.extend(self._get_formatted_scheme_settings())
+        result = self._get_formatted_preamble()
         result.extend(self._get_formatted_blocks(strict=strict))
         return result
 
@@ -455,6 +436,29 @@ class LilyPondFile(AbjadObject):
             result = ['\n'.join(result)]
         return result
 
+    def _get_formatted_preamble(self):
+        result = []
+        if self.date_time_token is not None:
+            string = '% {}'.format(self.date_time_token)
+            result.append(string)
+        result.extend(self._get_formatted_comments())
+        includes = []
+        if self.lilypond_version_token is not None:
+            string = '{}'.format(self.lilypond_version_token)
+            includes.append(string)
+        if self.lilypond_language_token is not None:
+            string = '{}'.format(self.lilypond_language_token)
+            includes.append(string)
+        includes = '\n'.join(includes)
+        if includes:
+            result.append(includes)
+        if self.use_relative_includes:
+            string = "#(ly:set-option 'relative-includes #t)"
+            result.append(string)
+        result.extend(self._get_formatted_includes())
+        result.extend(self._get_formatted_scheme_settings())
+        return result
+
     def _get_formatted_scheme_settings(self):
         result = []
         default_paper_size = self.default_paper_size
@@ -512,6 +516,43 @@ class LilyPondFile(AbjadObject):
         grob.default_staff_staff_spacing = spacing_vector
         return block
 
+    def _write_lilypond_format(self, file_pointer, strict=False, workers=None):
+        import abjad
+        line_count = 0
+        separate = False
+
+        def write(line):
+            nonlocal line_count, separate
+            if separate:
+                file_pointer.write('\n\n')
+                separate = False
+            elif line_count:
+                file_pointer.write('\n')
+            file_pointer.write(line)
+            line_count += 1
+
+        for piece in self._get_formatted_preamble():
+            separate = 0 < line_count
+            write(piece)
+        for item in self.items:
+            separate = 0 < line_count
+            if isinstance(item, abjad.Block):
+                item._write_format_pieces(
+                    write,
+                    strict=strict,
+                    workers=workers,
+                    )
+            elif ('_get_lilypond_format' in dir(item) and
+                not isinstance(item, str)):
+                try:
+                    string = item._get_lilypond_format(strict=strict)
+                except TypeError:
+                    string = item._get_lilypond_format()
+                if string:
+                    write(string)
+            else:
+                write(str(item))
+
     ### PUBLIC PROPERTIES ###
 
     @property
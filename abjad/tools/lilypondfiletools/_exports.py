@@ -0,0 +1,15 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Block',
+    'ContextBlock',
+    'DateTimeToken',
+    'LilyPondDimension',
+    'LilyPondFile',
+    'LilyPondLanguageToken',
+    'LilyPondVersionToken',
+    'PackageGitCommitToken',
+    )
+
+packages = ()
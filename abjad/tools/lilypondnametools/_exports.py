@@ -0,0 +1,17 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'LilyPondContext',
+    'LilyPondContextSetting',
+    'LilyPondEngraver',
+    'LilyPondGrob',
+    'LilyPondGrobInterface',
+    'LilyPondGrobNameManager',
+    'LilyPondGrobOverride',
+    'LilyPondNameManager',
+    'LilyPondSettingNameManager',
+    'LilyPondTweakManager',
+    )
+
+packages = ()
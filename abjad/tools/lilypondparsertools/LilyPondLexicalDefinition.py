@@ -395,7 +395,9 @@ class LilyPondLexicalDefinition(AbjadObject):
         from abjad.tools import lilypondparsertools
         #t.type = 'SCHEME_START'
         #t.lexer.push_state('INITIAL')
-        scheme_parser = lilypondparsertools.SchemeParser(debug=False)
+        scheme_parser = lilypondparsertools.SchemeParser._check_out(
+            debug=False,
+            )
         input_string = t.lexer.lexdata[t.lexpos+1:]
         #print 'PREPARSE'
         try:
@@ -413,6 +415,8 @@ class LilyPondLexicalDefinition(AbjadObject):
             #else:
             #    t.type = 'SCM_TOKEN'
             t.lexer.skip(scheme_parser.cursor_end + 1)
+        finally:
+            scheme_parser._check_in()
         return t
 
     # lexer.ll:387
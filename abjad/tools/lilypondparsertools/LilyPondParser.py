@@ -1,6 +1,7 @@
 import collections
 import itertools
 import ply
+import re
 from abjad.tools import abctools
 from abjad.tools import datastructuretools
 from abjad.tools import indicatortools
@@ -311,6 +312,21 @@ class LilyPondParser(abctools.Parser):
         '_syndef',
         )
 
+    _scheme_token_regex = re.compile(r'''
+        [()]
+        |"(?:[^"\\]|\\.)*("|\Z)
+        |;[^\n]*(\n|\Z)
+        |\#\\.
+        ''', re.DOTALL | re.VERBOSE)
+
+    _string_regex = re.compile(r'''(?:[^"\\]|\\.)*"''', re.DOTALL)
+
+    _toplevel_token_regex = re.compile(r'''
+        %\{|%|"|\#['`]?\(|\\|<<|>>|[{}]|[-^_]>
+        ''', re.VERBOSE)
+
+    _word_regex = re.compile(r'[a-zA-Z]+|.', re.DOTALL)
+
     ### INITIALIZER ###
 
     def __init__(self, default_language='english', debug=False):
@@ -345,17 +361,7 @@ class LilyPondParser(abctools.Parser):
         Returns Abjad components.
         '''
         self._reset_parser_variables()
-        if self._debug:
-            result = self._parser._lilypond_patch_parse_debug(
-                input_string,
-                lexer=self._lexer,
-                debug=self._logger,
-                )
-        else:
-            result = self._parser._lilypond_patch_parse(
-                input_string,
-                lexer=self._lexer,
-                )
+        result = self._parse_input_string(input_string)
         if isinstance(result, scoretools.Container):
             self._apply_spanners(result)
         elif isinstance(result, lilypondfiletools.LilyPondFile):
@@ -757,6 +763,104 @@ class LilyPondParser(abctools.Parser):
         assert abjad.inspect(leaf).get_annotation('spanners') is None
         return annotation
 
+    def _get_toplevel_token_end(self, text, match):
+        r'''Gets end of top-level token in `text` matched by `match`.
+
+        Returns none when `text` ends before token.
+        '''
+        token = match.group()
+        start = match.end()
+        if token == '%{':
+            index = text.find('%}', start)
+            if index == -1:
+                return None
+            return index + 2
+        elif token == '%':
+            index = text.find('\n', start)
+            if index == -1:
+                return None
+            return index + 1
+        elif token == '"':
+            match = self._string_regex.match(text, start)
+            if match is None:
+                return None
+            return match.end()
+        elif token == '\\':
+            match = self._word_regex.match(text, start)
+            if match is None:
+                return None
+            return match.end()
+        elif token.startswith('#'):
+            level = 1
+            while level:
+                match = self._scheme_token_regex.search(text, start)
+                if match is None or match.end() == len(text):
+                    return None
+                if match.group() == '(':
+                    level += 1
+                elif match.group() == ')':
+                    level -= 1
+                start = match.end()
+            return start
+        return start
+
+    def _iterate_toplevel_strings(self, file_pointer, block_size=2 ** 16):
+        r'''Iterates strings read from `file_pointer` that end where
+        brackets or Scheme expressions close at top level.
+
+        Reads `file_pointer` in blocks of `block_size` characters. Skips
+        brackets inside comments, strings, Scheme expressions and escaped
+        words.
+
+        Parsing some strings gives complete top-level expressions. Other
+        strings, like ``\new Staff \with { ... }``, continue in the next
+        string.
+        '''
+        depth = 0
+        is_exhausted = False
+        position = 0
+        text = ''
+        while True:
+            end = None
+            match = self._toplevel_token_regex.search(text, position)
+            if match is not None:
+                end = self._get_toplevel_token_end(text, match)
+            if end is None or (not is_exhausted and len(text) - 2 < end):
+                if is_exhausted:
+                    break
+                block = file_pointer.read(block_size)
+                if not block:
+                    is_exhausted = True
+                text += block
+                continue
+            position = end
+            token = match.group()
+            if token in ('{', '<<'):
+                depth += 1
+                continue
+            elif token in ('}', '>>'):
+                depth -= 1
+            elif not token.startswith('#'):
+                continue
+            if depth == 0:
+                yield text[:position]
+                text = text[position:]
+                position = 0
+        if text:
+            yield text
+
+    def _parse_input_string(self, input_string):
+        if self._debug:
+            return self._parser._lilypond_patch_parse_debug(
+                input_string,
+                lexer=self._lexer,
+                debug=self._logger,
+                )
+        return self._parser._lilypond_patch_parse(
+            input_string,
+            lexer=self._lexer,
+            )
+
     def _pop_variable_scope(self):
         if self._scope_stack:
             self._scope_stack.pop()
@@ -825,19 +929,32 @@ class LilyPondParser(abctools.Parser):
     def _reset_parser_variables(self):
         from abjad.tools import lilypondparsertools
         import abjad
-        try:
-            self._parser.restart()
-        except:
-            pass
         self._scope_stack = [{}]
-        self._chord_pitch_orders = {}
-        self._lexer.push_state('notes')
         self._default_duration = lilypondparsertools.LilyPondDuration(
             abjad.Duration(1, 4), None)
         self._last_chord = None
         # LilyPond's default!
         # self._last_chord = scoretools.Chord(['c', 'g', "c'"], (1, 4))
         self._pitch_names = self._language_pitch_names[self.default_language]
+        self._reset_toplevel_expression_variables()
+
+    def _reset_toplevel_expression_variables(self):
+        r'''Resets parser state local to one top-level expression.
+
+        Keeps top-level variables, default duration, last chord and note-input
+        language.
+        '''
+        try:
+            self._parser.restart()
+        except:
+            pass
+        del self._scope_stack[1:]
+        self._chord_pitch_orders = {}
+        # clear states left by earlier calls
+        self._lexer.lexstatestack = []
+        self._lexer.begin('INITIAL')
+        self._lexer.lineno = 1
+        self._lexer.push_state('notes')
         self._repeated_chords = {}
 
     def _resolve_event_identifier(self, identifier):
@@ -886,6 +1003,13 @@ class LilyPondParser(abctools.Parser):
         message = message.format(name)
         raise Exception(message)
 
+    def _teardown(self):
+        # release parsed components held by pooled parser
+        self._chord_pitch_orders = {}
+        self._last_chord = None
+        self._repeated_chords = {}
+        self._scope_stack = [{}]
+
     def _test_scheme_predicate(self, predicate, value):
         predicates = self._get_scheme_predicates()
         if predicate in predicates:
@@ -972,6 +1096,80 @@ class LilyPondParser(abctools.Parser):
 
     ### PUBLIC METHODS ###
 
+    def iterate_file(self, argument):
+        r'''Iterates top-level items of LilyPond file `argument` one at a
+        time.
+
+        ..  container:: example
+
+            >>> import io
+            >>> string = r"""
+            ... \version "2.19.0"
+            ... melody = { c'4 d'4 }
+            ... \header { title = "Example" }
+            ... \score { \new Staff \melody }
+            ... % { e'4 }
+            ... \new Staff { e'4 ( f'4 ) }
+            ... \markup { Fine }
+            ... """
+            >>> parser = abjad.lilypondparsertools.LilyPondParser()
+            >>> for item in parser.iterate_file(io.StringIO(string)):
+            ...     item
+            ...
+            <Block(name='header')>
+            <Block(name='score')>
+            Staff("e'4 f'4")
+            Markup(contents=['Fine'])
+
+        Yields the items that parsing the whole file gives in
+        ``LilyPondFile.items``: score, header, layout and paper blocks, music
+        expressions and markup. Keeps top-level variables, default duration
+        and note-input language from one item to the next.
+
+        Reads `argument` incrementally and parses one top-level expression at
+        a time. Memory use depends on the largest top-level expression rather
+        than on file size.
+
+        `argument` is a path or a file object open for reading.
+
+        Returns generator.
+        '''
+        if isinstance(argument, str):
+            with open(argument) as file_pointer:
+                for item in self.iterate_file(file_pointer):
+                    yield item
+            return
+        self._reset_parser_variables()
+        pending_string = ''
+        for string in self._iterate_toplevel_strings(argument):
+            pending_string += string
+            try:
+                self._reset_toplevel_expression_variables()
+                result = self._parse_input_string(pending_string)
+            except LilyPondParserError as e:
+                # parser reached end of string in middle of expression
+                if e.args and e.args[0] is None:
+                    continue
+                raise
+            pending_string = ''
+            if isinstance(result, lilypondfiletools.LilyPondFile):
+                items = result.items
+            elif result is None:
+                items = []
+            else:
+                items = [result]
+            for item in items:
+                if isinstance(item, scoretools.Container):
+                    self._apply_spanners(item)
+                elif (isinstance(item, lilypondfiletools.Block) and
+                    item.name == 'score'):
+                    for x in item.items:
+                        self._apply_spanners(x)
+                yield item
+        if pending_string:
+            self._reset_toplevel_expression_variables()
+            self._parse_input_string(pending_string)
+
     @staticmethod
     def list_known_contexts():
         r'''Lists all LilyPond contexts recognized by LilyPond parser.
@@ -0,0 +1,241 @@
+import re
+from abjad.tools import datastructuretools
+from abjad.tools import indicatortools
+from abjad.tools import pitchtools
+from abjad.tools import scoretools
+from abjad.tools.abctools.AbjadObject import AbjadObject
+from abjad.tools.topleveltools import attach
+
+
+class SimpleLeafParser(AbjadObject):
+    r'''Simple leaf parser.
+
+    ..  container:: example
+
+        Parses note, chord, rest and skip strings without the full LilyPond
+        grammar:
+
+        >>> parser = abjad.lilypondparsertools.SimpleLeafParser()
+        >>> parser("cs''8.")
+        Note("cs''8.")
+
+        >>> parser("<c' e'! g'?>4")
+        Chord("<c' e'! g'?>4")
+
+        >>> parser('r16')
+        Rest('r16')
+
+    ..  container:: example
+
+        Parses simple post-events:
+
+        >>> note = parser("c'4 -. ^\\accent \\p")
+        >>> abjad.f(note)
+        c'4 -\staccato \p ^\accent
+
+    ..  container:: example
+
+        Hands all other strings to LilyPondParser:
+
+        >>> parser("c'4 ^ \\markup { pont. }")
+        Note("c'4")
+
+    Simple leaf syntax is a pitch or chord body, a written duration with
+    optional dots and zero or more articulations or dynamics. Pitches may
+    carry octave ticks, forced accidentals and cautionary accidentals.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Parsers'
+
+    __slots__ = (
+        '_default_language',
+        '_pitch_names',
+        )
+
+    _abbreviations = {
+        '+': 'dashPlus',
+        '-': 'dashDash',
+        '.': 'dashDot',
+        '>': 'dashLarger',
+        '^': 'dashHat',
+        '_': 'dashUnderscore',
+        '|': 'dashBar',
+        }
+
+    _chord_element_regex = re.compile(r'''
+        (?P<name>[a-zA-Z]+)
+        (?P<octave>'+|,+)?
+        (?P<exclamations>!*)
+        (?P<questions>\?*)
+        \Z
+        ''', re.VERBOSE)
+
+    _duration_body = r'''
+        (?P<duration>(?:128|64|32|16|8|4|2|1)\.*)
+        '''
+
+    _chord_regex = re.compile(r'''
+        <(?P<body>[^<>]*)>
+        ''' + _duration_body, re.VERBOSE)
+
+    _leaf_regex = re.compile(r'''
+        (?P<name>[a-zA-Z]+)
+        (?P<octave>'+|,+)?
+        (?P<exclamations>!*)
+        (?P<questions>\?*)
+        ''' + _duration_body, re.VERBOSE)
+
+    _post_event_regex = re.compile(r'''
+        \s*
+        (?:(?P<direction>[-^_])\s*)?
+        (?:\\(?P<identifier>[a-zA-Z]+)|(?P<abbreviation>[-^_+|>.]))
+        ''', re.VERBOSE)
+
+    ### INITIALIZER ###
+
+    def __init__(self, default_language='english'):
+        from abjad.ly import language_pitch_names
+        self._default_language = default_language
+        self._pitch_names = language_pitch_names[default_language]
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, string):
+        r'''Calls simple leaf parser on `string`.
+
+        Returns leaf.
+        '''
+        from abjad.tools import lilypondparsertools
+        leaf = self._parse(string)
+        if leaf is None:
+            string = '{{ {} }}'.format(string)
+            parsed = lilypondparsertools.LilyPondParser._call_pooled(
+                string,
+                default_language=self.default_language,
+                )
+            assert len(parsed) == 1
+            leaf = parsed[0]
+            assert isinstance(leaf, scoretools.Leaf), repr(leaf)
+        return leaf
+
+    ### PRIVATE METHODS ###
+
+    def _make_indicator(self, direction, identifier, abbreviation):
+        from abjad.ly import current_module
+        from abjad.tools import lilypondparsertools
+        if abbreviation is not None:
+            if direction is None:
+                return None
+            name = current_module[self._abbreviations[abbreviation]]['alias']
+            return indicatortools.Articulation(name, direction)
+        keywords = lilypondparsertools.LilyPondLexicalDefinition.keywords
+        if '\\' + identifier in keywords:
+            return None
+        lookup = current_module.get(identifier)
+        if (
+            not isinstance(lookup, dict) or
+            lookup.get('type') != 'ly:prob?' or
+            'event' not in lookup['types']
+            ):
+            return None
+        if lookup['name'] == 'ArticulationEvent':
+            name = lookup['articulation-type']
+            return indicatortools.Articulation(name, direction)
+        if lookup['name'] == 'AbsoluteDynamicEvent' and direction is None:
+            return indicatortools.Dynamic(lookup['text'])
+        return None
+
+    def _make_pitch(self, match):
+        name = match.group('name')
+        if name not in self._pitch_names:
+            return None
+        string = str(self._pitch_names[name]) + (match.group('octave') or '')
+        return pitchtools.NamedPitch(string)
+
+    def _parse(self, string):
+        string = string.strip()
+        match = self._leaf_regex.match(string)
+        if match is None:
+            match = self._chord_regex.match(string)
+            if match is None:
+                return None
+            leaf = self._parse_chord(match)
+        else:
+            leaf = self._parse_leaf(match)
+        if leaf is None:
+            return None
+        indicators = []
+        position = match.end()
+        while position < len(string):
+            match = self._post_event_regex.match(string, position)
+            if match is None:
+                if string[position:].isspace():
+                    break
+                return None
+            indicator = self._make_indicator(
+                match.group('direction'),
+                match.group('identifier'),
+                match.group('abbreviation'),
+                )
+            if indicator is None:
+                return None
+            indicators.append(indicator)
+            position = match.end()
+        for indicator in indicators:
+            attach(indicator, leaf)
+        return leaf
+
+    def _parse_chord(self, match):
+        duration = datastructuretools.Duration.from_lilypond_duration_string(
+            match.group('duration'))
+        note_heads = []
+        for element in match.group('body').split():
+            element_match = self._chord_element_regex.match(element)
+            if element_match is None:
+                return None
+            pitch = self._make_pitch(element_match)
+            if pitch is None:
+                return None
+            note_head = scoretools.NoteHead(
+                written_pitch=pitch,
+                is_cautionary=bool(element_match.group('questions')),
+                is_forced=bool(element_match.group('exclamations')),
+                )
+            note_heads.append(note_head)
+        chord = scoretools.Chord([], duration)
+        chord.note_heads.extend(note_heads)
+        return chord
+
+    def _parse_leaf(self, match):
+        duration = datastructuretools.Duration.from_lilypond_duration_string(
+            match.group('duration'))
+        name = match.group('name')
+        if name in ('r', 's') and name not in self._pitch_names:
+            if (
+                match.group('octave') or
+                match.group('exclamations') or
+                match.group('questions')
+                ):
+                return None
+            if name == 'r':
+                return scoretools.Rest(duration)
+            return scoretools.Skip(duration)
+        pitch = self._make_pitch(match)
+        if pitch is None:
+            return None
+        note = scoretools.Note(pitch, duration)
+        note.note_head.is_forced = bool(match.group('exclamations'))
+        note.note_head.is_cautionary = bool(match.group('questions'))
+        return note
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def default_language(self):
+        r'''Gets default language of simple leaf parser.
+
+        Returns string.
+        '''
+        return self._default_language
@@ -0,0 +1,24 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'ContextSpeccedMusic',
+    'GuileProxy',
+    'LilyPondDuration',
+    'LilyPondEvent',
+    'LilyPondFraction',
+    'LilyPondGrammarGenerator',
+    'LilyPondLexicalDefinition',
+    'LilyPondParser',
+    'LilyPondSyntacticalDefinition',
+    'Music',
+    'ReducedLyParser',
+    'SchemeParser',
+    'SequentialMusic',
+    'SimpleLeafParser',
+    'SimultaneousMusic',
+    'SyntaxNode',
+    'parse_reduced_ly_syntax',
+    )
+
+packages = ()
@@ -0,0 +1,130 @@
+import abjad
+import io
+import os
+import pytest
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_01():
+    r'''Iterates items that parsing whole file gives.
+    '''
+
+    maker = abjad.BenchmarkScoreMaker()
+    staves = [
+        abjad.Staff([maker.make_score_00()]),
+        maker.make_score_with_indicators_01(),
+        ]
+    score = abjad.Score(staves)
+    lilypond_file = abjad.LilyPondFile.new(score)
+    lilypond_file.items.append(abjad.Staff("c'4 ( d'4 ) e'4 \\< f'4 \\!"))
+    lilypond_file.items.append(abjad.Markup('Fine'))
+    string = format(lilypond_file)
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    items = parser(string).items
+
+    with abjad.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'test.ly')
+        with open(path, 'w') as file_pointer:
+            file_pointer.write(string)
+        streamed_items = list(parser.iterate_file(path))
+
+    assert len(streamed_items) == len(items) == 6
+    for item, streamed_item in zip(items, streamed_items):
+        assert format(streamed_item) == format(item)
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_02():
+    r'''Finds top-level expressions independent of block size.
+
+    Skips brackets in comments, strings, Scheme expressions and escaped words.
+    '''
+
+    string = r'''
+    % { line comment
+    %{ block { comment << %}
+    #(define foo ; ) {
+      "(}")
+    { c'4 -> \< d'4 \> e'4 \! }
+    \header { title = "} >>" }
+    << { c'4 } \\ { d'4 } >>
+    \markup { #'(x . "(") }
+    '''
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    file_pointer = io.StringIO(string)
+    strings = list(parser._iterate_toplevel_strings(file_pointer))
+
+    assert ''.join(strings) == string
+    assert [_.strip() for _ in strings[:-1]] == [
+        '% { line comment\n    %{ block { comment << %}\n'
+        '    #(define foo ; ) {\n      "(}")',
+        "{ c'4 -> \\< d'4 \\> e'4 \\! }",
+        '\\header { title = "} >>" }',
+        "<< { c'4 } \\\\ { d'4 } >>",
+        '\\markup { #\'(x . "(") }',
+        ]
+    for block_size in range(1, 8):
+        file_pointer = io.StringIO(string)
+        iterator = parser._iterate_toplevel_strings(
+            file_pointer,
+            block_size=block_size,
+            )
+        assert list(iterator) == strings
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_03():
+    r'''Keeps variables, default duration and language from one item to the
+    next.
+    '''
+
+    string = r'''
+    \language "nederlands"
+    melody = { cis'8 }
+    { \melody d' }
+    { e' }
+    '''
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    items = list(parser.iterate_file(io.StringIO(string)))
+
+    assert [format(_) for _ in items] == [
+        "{\n    {\n        cs'8\n    }\n    d'8\n}",
+        "{\n    e'8\n}",
+        ]
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_04():
+    r'''Joins strings that end in middle of top-level expression.
+    '''
+
+    string = r'''
+    \new Staff \relative c' { c d e }
+    \transpose c d { c'4 }
+    '''
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    items = list(parser.iterate_file(io.StringIO(string)))
+
+    assert [format(_) for _ in items] == [
+        "\\new Staff {\n    c'4\n    d'4\n    e'4\n}",
+        "{\n    d'4\n}",
+        ]
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_05():
+    r'''Raises parser error after yielding items before error.
+    '''
+
+    string = r'''
+    { c'4 }
+    { d'4 } }
+    { e'4 }
+    '''
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    iterator = parser.iterate_file(io.StringIO(string))
+
+    assert format(next(iterator)) == "{\n    c'4\n}"
+    assert format(next(iterator)) == "{\n    d'4\n}"
+    with pytest.raises(abjad.LilyPondParserError):
+        next(iterator)
+
+    iterator = parser.iterate_file(io.StringIO("{ c'4 } { d'4"))
+    assert format(next(iterator)) == "{\n    c'4\n}"
+    with pytest.raises(abjad.LilyPondParserError):
+        next(iterator)
@@ -0,0 +1,169 @@
+import abjad
+import ast
+import doctest
+import os
+import re
+
+
+def _compare(parser, string):
+    fast_leaf = parser._parse(string)
+    try:
+        container = abjad.parse(
+            '{{ {} }}'.format(string),
+            language=parser.default_language,
+            )
+    except Exception:
+        assert fast_leaf is None, repr(string)
+        return False
+    if fast_leaf is None:
+        return False
+    leaf = container[0]
+    assert type(fast_leaf) is type(leaf), repr(string)
+    assert format(fast_leaf) == format(leaf), repr(string)
+    indicators = abjad.inspect(leaf).get_indicators()
+    fast_indicators = abjad.inspect(fast_leaf).get_indicators()
+    assert fast_indicators == indicators, repr(string)
+    for indicator, fast_indicator in zip(indicators, fast_indicators):
+        direction = getattr(indicator, 'direction', None)
+        assert getattr(fast_indicator, 'direction', None) == direction
+    return True
+
+
+def _get_leaf_strings():
+    class_names = ('Chord', 'Note', 'Rest', 'Skip')
+    regex = re.compile(r'''\b(Chord|Note|Rest|Skip)\(['"]''')
+    strings = set()
+    sources = []
+    directory = os.path.dirname(abjad.__file__)
+    for root, directory_names, file_names in os.walk(directory):
+        for file_name in file_names:
+            if not file_name.endswith('.py'):
+                continue
+            with open(os.path.join(root, file_name)) as file_pointer:
+                source = file_pointer.read()
+            if not regex.search(source):
+                continue
+            try:
+                tree = ast.parse(source)
+            except SyntaxError:
+                continue
+            sources.append(tree)
+            for node in ast.walk(tree):
+                docstring = None
+                if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+                    docstring = ast.get_docstring(node, clean=False)
+                if not docstring:
+                    continue
+                if not regex.search(docstring):
+                    continue
+                for example in doctest.DocTestParser().get_examples(docstring):
+                    if not regex.search(example.source):
+                        continue
+                    try:
+                        sources.append(ast.parse(example.source))
+                    except SyntaxError:
+                        pass
+    for tree in sources:
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or len(node.args) != 1:
+                continue
+            name = getattr(node.func, 'attr', getattr(node.func, 'id', None))
+            if name not in class_names:
+                continue
+            argument = node.args[0]
+            if isinstance(argument, ast.Constant):
+                argument = argument.value
+            elif isinstance(argument, ast.Str):
+                argument = argument.s
+            if isinstance(argument, str):
+                strings.add(argument)
+    return sorted(strings)
+
+
+def test_lilypondparsertools_SimpleLeafParser___call___01():
+    r'''Parses every leaf string in Abjad source and docstrings exactly as
+    LilyPondParser does.
+    '''
+
+    parser = abjad.lilypondparsertools.SimpleLeafParser()
+    strings = _get_leaf_strings()
+    count = sum(_compare(parser, _) for _ in strings)
+
+    assert 100 < len(strings)
+    assert 0.8 * len(strings) < count
+
+
+def test_lilypondparsertools_SimpleLeafParser___call___02():
+    r'''Parses simple post-events exactly as LilyPondParser does.
+    '''
+
+    parser = abjad.lilypondparsertools.SimpleLeafParser()
+    strings = [
+        "c'4 -.",
+        "c'4-.",
+        "c'4 - .",
+        "c'4 --",
+        "c'4 -> -^ -+ -_ -|",
+        "c'4 ^. _>",
+        "c'4 \\accent",
+        "c'4 ^\\accent",
+        "c'4 _\\fermata -\\staccato",
+        "c'4 \\p",
+        "c'4 \\sfz \\accent",
+        "<c' e' g'>4 -> \\ff",
+        "r8. \\fermata",
+        "s2 \\mf",
+        "  cs''8.  ",
+        "c!!4",
+        "c'!?4",
+        "<c!? e? g! b>4",
+        "<>8.",
+        "c,,16..",
+        ]
+    for string in strings:
+        assert _compare(parser, string), repr(string)
+
+
+def test_lilypondparsertools_SimpleLeafParser___call___03():
+    r'''Hands other strings to LilyPondParser.
+    '''
+
+    parser = abjad.lilypondparsertools.SimpleLeafParser()
+    strings = [
+        "c'4 ^\\p",
+        "c'4 .",
+        "c'4 ~",
+        "c'4 (",
+        "c'4 \\breve",
+        "c'4 ^ \\markup { pont. }",
+        "c'4 * 1/2",
+        "c'4 % comment",
+        "c' 4",
+        "c'",
+        "c'3",
+        "c'4 5",
+        "c'4 \\rest",
+        "r'4",
+        "R1",
+        "sn4",
+        "<c' sn>4",
+        "<c'-. e'>4",
+        "cis4",
+        "c'4 \\foo",
+        ]
+    for string in strings:
+        assert not _compare(parser, string), repr(string)
+
+    note = parser("c'4 ^ \\markup { pont. }")
+    assert format(note) == "c'4 ^ \\markup { pont. }"
+
+
+def test_lilypondparsertools_SimpleLeafParser___call___04():
+    r'''Parses note names in default language.
+    '''
+
+    parser = abjad.lilypondparsertools.SimpleLeafParser('nederlands')
+
+    assert _compare(parser, "cis''8.")
+    assert _compare(parser, "<ees' g' bes'>4")
+    assert parser("cis''8.").written_pitch == abjad.NamedPitch("cs''")
@@ -0,0 +1,12 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Markup',
+    'MarkupCommand',
+    'MarkupList',
+    'Postscript',
+    'PostscriptOperator',
+    )
+
+packages = ()
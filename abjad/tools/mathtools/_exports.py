@@ -0,0 +1,53 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'BoundedObject',
+    'Enumerator',
+    'Infinity',
+    'NegativeInfinity',
+    'NonreducedFraction',
+    'NonreducedRatio',
+    'Ratio',
+    'all_are_equal',
+    'all_are_integer_equivalent',
+    'all_are_integer_equivalent_numbers',
+    'all_are_nonnegative_integer_equivalent_numbers',
+    'all_are_nonnegative_integer_powers_of_two',
+    'all_are_nonnegative_integers',
+    'all_are_pairs_of_types',
+    'all_are_positive_integers',
+    'are_relatively_prime',
+    'arithmetic_mean',
+    'binomial_coefficient',
+    'cumulative_products',
+    'cumulative_sums',
+    'cumulative_sums_pairwise',
+    'difference_series',
+    'divisors',
+    'factors',
+    'fraction_to_proper_fraction',
+    'greatest_common_divisor',
+    'greatest_power_of_two_less_equal',
+    'integer_equivalent_number_to_integer',
+    'integer_to_base_k_tuple',
+    'integer_to_binary_string',
+    'is_assignable_integer',
+    'is_integer_equivalent',
+    'is_integer_equivalent_n_tuple',
+    'is_integer_equivalent_number',
+    'is_nonnegative_integer',
+    'is_nonnegative_integer_equivalent_number',
+    'is_nonnegative_integer_power_of_two',
+    'is_positive_integer',
+    'is_positive_integer_equivalent_number',
+    'is_positive_integer_power_of_two',
+    'least_common_multiple',
+    'partition_integer_by_ratio',
+    'partition_integer_into_canonic_parts',
+    'sign',
+    'weight',
+    'yield_all_compositions_of_integer',
+    )
+
+packages = ()
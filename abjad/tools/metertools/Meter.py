@@ -335,7 +335,8 @@ class Meter(AbjadValueObject):
 
         elif isinstance(argument, (str, rhythmtreetools.RhythmTreeContainer)):
             if isinstance(argument, str):
-                parsed = rhythmtreetools.RhythmTreeParser()(argument)
+                parsed = rhythmtreetools.RhythmTreeParser._call_pooled(
+                    argument)
                 assert len(parsed) == 1
                 root = parsed[0]
             else:
@@ -0,0 +1,13 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Meter',
+    'MeterFittingSession',
+    'MeterList',
+    'MeterManager',
+    'MetricAccentKernel',
+    'OffsetCounter',
+    )
+
+packages = ()
@@ -47,7 +47,7 @@ class Segment(TypedTuple):
         if isinstance(item_class, str):
             import abjad
             globals_ = {'abjad': abjad}
-            globals_.update(abjad.__dict__.copy())
+            globals_.update(abjad.ImportManager.get_namespace(abjad))
             item_class = eval(item_class, globals_)
         assert issubclass(item_class, self._parent_item_class)
         TypedTuple.__init__(
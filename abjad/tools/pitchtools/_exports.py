@@ -0,0 +1,50 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Accidental',
+    'ColorMap',
+    'CompoundOperator',
+    'Duplication',
+    'Interval',
+    'IntervalClass',
+    'IntervalClassSegment',
+    'IntervalClassSet',
+    'IntervalClassVector',
+    'IntervalSegment',
+    'IntervalSet',
+    'IntervalVector',
+    'Inversion',
+    'Multiplication',
+    'NamedInterval',
+    'NamedIntervalClass',
+    'NamedInversionEquivalentIntervalClass',
+    'NamedPitch',
+    'NamedPitchClass',
+    'NumberedInterval',
+    'NumberedIntervalClass',
+    'NumberedInversionEquivalentIntervalClass',
+    'NumberedPitch',
+    'NumberedPitchClass',
+    'Octave',
+    'Pitch',
+    'PitchClass',
+    'PitchClassSegment',
+    'PitchClassSet',
+    'PitchClassVector',
+    'PitchRange',
+    'PitchSegment',
+    'PitchSet',
+    'PitchVector',
+    'Retrograde',
+    'Rotation',
+    'Segment',
+    'Set',
+    'SetClass',
+    'StaffPosition',
+    'Transposition',
+    'TwelveToneRow',
+    'Vector',
+    )
+
+packages = ()
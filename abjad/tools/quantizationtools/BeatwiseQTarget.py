@@ -25,13 +25,16 @@ class BeatwiseQTarget(QTarget):
         attach_tempos=True,
         attack_point_optimizer=None,
         grace_handler=None,
+        previous_item=None,
+        previous_leaf=None,
         ):
         import abjad
         voice = abjad.Voice()
         # generate the first
         beat = self.items[0]
         components = beat.q_grid(beat.beatspan)
-        if attach_tempos:
+        if attach_tempos and (previous_item is None or
+            beat.tempo != previous_item.tempo):
             attachment_target = components[0]
             leaves = select(attachment_target).leaves()
             if isinstance(attachment_target, abjad.Container):
@@ -56,6 +59,7 @@ class BeatwiseQTarget(QTarget):
         self._notate_leaves(
             grace_handler=grace_handler,
             voice=voice,
+            previous_leaf=previous_leaf,
             )
 
         # partition logical ties in voice
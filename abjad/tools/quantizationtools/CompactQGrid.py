@@ -0,0 +1,292 @@
+import bisect
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from abjad.tools.abctools import AbjadObject
+
+
+class CompactQGrid(AbjadObject):
+    r'''Compact q-grid.
+
+    Array-based model of ``QGrid`` for searching many candidate rhythms
+    quickly.
+
+    ..  container:: example
+
+        >>> q_event_proxies = [
+        ...     abjad.quantizationtools.QEventProxy(
+        ...         abjad.quantizationtools.PitchedQEvent(x, [0]),
+        ...         0,
+        ...         1000,
+        ...         )
+        ...     for x in (0, 200, 400)
+        ...     ]
+        >>> q_grid = abjad.quantizationtools.CompactQGrid(q_event_proxies)
+        >>> q_grid.denominator, q_grid.leaf_numerators, q_grid.proxy_numerators
+        (5, (0, 5), (0, 1, 2))
+
+        >>> q_grid.distance
+        Duration(1, 5)
+
+    ..  container:: example
+
+        Subdividing returns new compact q-grid and leaves this compact q-grid
+        unchanged:
+
+        >>> new_q_grid = q_grid.subdivide_leaves([(0, (1, 1, 1))])
+        >>> new_q_grid.denominator, new_q_grid.leaf_numerators
+        (15, (0, 5, 10, 15))
+        >>> new_q_grid.distance
+        Duration(1, 15)
+
+        >>> q_grid.leaf_numerators
+        (0, 5)
+
+        >>> print(new_q_grid.to_q_grid().rtm_format)
+        (1 (1 1 1))
+
+    Stores offsets of leaves and of ``QEventProxies`` as integer numerators
+    over common denominator. Leaf offsets end with offset of next downbeat.
+    Compact q-grids made by subdivision share unchanged ``QEventProxy``
+    numerators and parentage with the compact q-grid they subdivide.
+
+    Computes distance with NumPy when NumPy is installed.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_commands',
+        '_denominator',
+        '_leaf_numerators',
+        '_parentage_ratios',
+        '_proxy_array',
+        '_proxy_numerators',
+        '_q_event_proxies',
+        )
+
+    # keeps sums of distance numerators within 64-bit integers
+    _maximum_array_denominator = 2 ** 40
+
+    ### INITIALIZER ###
+
+    def __init__(self, q_event_proxies=None):
+        import abjad
+        from abjad.tools import quantizationtools
+        q_event_proxies = tuple(q_event_proxies or ())
+        assert all(
+            isinstance(_, quantizationtools.QEventProxy)
+            for _ in q_event_proxies
+            )
+        denominator = 1
+        for q_event_proxy in q_event_proxies:
+            denominator = abjad.mathtools.least_common_multiple(
+                denominator,
+                q_event_proxy.offset.denominator,
+                )
+        proxy_numerators = sorted(
+            _.offset.numerator * (denominator // _.offset.denominator)
+            for _ in q_event_proxies
+            )
+        self._commands = ()
+        self._denominator = denominator
+        self._leaf_numerators = (0, denominator)
+        self._parentage_ratios = ((abjad.Duration(1),),)
+        self._proxy_array = None
+        self._proxy_numerators = tuple(proxy_numerators)
+        self._q_event_proxies = q_event_proxies
+
+    ### PRIVATE METHODS ###
+
+    def _find_distance(self, indices=()):
+        # ignores QEventProxies between leaf at each index and next leaf
+        import abjad
+        count = len(self._proxy_numerators)
+        if not count:
+            return None
+        indices = set(indices)
+        if self._uses_arrays():
+            leaf_array = numpy.array(self._leaf_numerators, dtype=numpy.int64)
+            proxy_array = self._get_proxy_array()
+            right_indices = numpy.searchsorted(leaf_array, proxy_array)
+            right_indices = numpy.minimum(right_indices, len(leaf_array) - 1)
+            left_indices = numpy.maximum(right_indices - 1, 0)
+            distances = numpy.minimum(
+                numpy.abs(leaf_array[right_indices] - proxy_array),
+                numpy.abs(proxy_array - leaf_array[left_indices]),
+                )
+            if indices:
+                leaf_indices = numpy.searchsorted(
+                    leaf_array,
+                    proxy_array,
+                    side='right',
+                    ) - 1
+                mask = numpy.isin(leaf_indices, list(indices))
+                distances = distances[~mask]
+            distance = int(distances.sum())
+        else:
+            leaf_numerators = self._leaf_numerators
+            distance = 0
+            for proxy_numerator in self._proxy_numerators:
+                i = bisect.bisect_left(leaf_numerators, proxy_numerator)
+                if leaf_numerators[i] == proxy_numerator:
+                    continue
+                if indices and i - 1 in indices:
+                    continue
+                distance += min(
+                    leaf_numerators[i] - proxy_numerator,
+                    proxy_numerator - leaf_numerators[i - 1],
+                    )
+        return abjad.Duration(distance, count * self._denominator)
+
+    def _find_misaligned_leaf_indices(self):
+        # leaves followed by QEventProxies off their offset
+        leaf_numerators = self._leaf_numerators
+        proxy_numerators = self._proxy_numerators
+        indices = []
+        for i in range(len(leaf_numerators) - 1):
+            aligned_index = bisect.bisect_right(
+                proxy_numerators,
+                leaf_numerators[i],
+                )
+            stop_index = bisect.bisect_left(
+                proxy_numerators,
+                leaf_numerators[i + 1],
+                )
+            if aligned_index < stop_index:
+                indices.append(i)
+        return indices
+
+    def _get_proxy_array(self):
+        if self._proxy_array is None:
+            self._proxy_array = numpy.array(
+                self._proxy_numerators,
+                dtype=numpy.int64,
+                )
+        return self._proxy_array
+
+    def _uses_arrays(self):
+        if numpy is None:
+            return False
+        return self._denominator < self._maximum_array_denominator
+
+    ### PUBLIC METHODS ###
+
+    def subdivide_leaves(self, pairs):
+        r'''Makes new compact q-grid with leaves at each index in leaf-index:
+        subdivision-ratio pairs `pairs` subdivided by subdivision ratio.
+
+        Returns new compact q-grid.
+        '''
+        import abjad
+        pairs = sorted(dict(pairs).items())
+        multiplier = 1
+        for index, subdivision in pairs:
+            width = self._leaf_numerators[index + 1]
+            width -= self._leaf_numerators[index]
+            total = sum(subdivision)
+            multiplier = abjad.mathtools.least_common_multiple(
+                multiplier,
+                total // abjad.mathtools.greatest_common_divisor(width, total),
+                )
+        leaf_numerators = [_ * multiplier for _ in self._leaf_numerators]
+        parentage_ratios = list(self._parentage_ratios)
+        for index, subdivision in reversed(pairs):
+            start, stop = leaf_numerators[index], leaf_numerators[index + 1]
+            total = sum(subdivision)
+            new_numerators, new_parentage_ratios = [], []
+            partial_sum = 0
+            for x in subdivision:
+                new_numerators.append(
+                    start + (stop - start) * partial_sum // total)
+                new_parentage_ratios.append(
+                    parentage_ratios[index] +
+                    ((abjad.Duration(x), abjad.Duration(total)),)
+                    )
+                partial_sum += x
+            leaf_numerators[index:index + 1] = new_numerators
+            parentage_ratios[index:index + 1] = new_parentage_ratios
+        q_grid = type(self).__new__(type(self))
+        q_grid._commands = self._commands + (tuple(pairs),)
+        q_grid._denominator = self._denominator * multiplier
+        q_grid._leaf_numerators = tuple(leaf_numerators)
+        q_grid._parentage_ratios = tuple(parentage_ratios)
+        q_grid._q_event_proxies = self._q_event_proxies
+        if multiplier == 1:
+            q_grid._proxy_array = self._proxy_array
+            q_grid._proxy_numerators = self._proxy_numerators
+        else:
+            q_grid._proxy_array = None
+            q_grid._proxy_numerators = tuple(
+                _ * multiplier for _ in self._proxy_numerators)
+        return q_grid
+
+    def to_q_grid(self):
+        r'''Makes ``QGrid`` with structure of compact q-grid and fits
+        ``QEventProxies`` of compact q-grid onto it.
+
+        Returns ``QGrid``.
+        '''
+        from abjad.tools import quantizationtools
+        q_grid = quantizationtools.QGrid()
+        for command in self._commands:
+            q_grid.subdivide_leaves(command)
+        q_grid.fit_q_events(self.q_event_proxies)
+        return q_grid
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def denominator(self):
+        r'''Gets common denominator of offsets.
+
+        Returns positive integer.
+        '''
+        return self._denominator
+
+    @property
+    def distance(self):
+        r'''Gets mean distance of offset of each ``QEventProxy`` to nearest
+        leaf offset.
+
+        Equals distance of ``QGrid`` made by ``to_q_grid()``.
+
+        Returns duration or none.
+        '''
+        return self._find_distance()
+
+    @property
+    def leaf_numerators(self):
+        r'''Gets numerators of leaf offsets, including offset of next
+        downbeat.
+
+        Returns tuple of integers.
+        '''
+        return self._leaf_numerators
+
+    @property
+    def offsets(self):
+        r'''Gets leaf offsets, including offset of next downbeat.
+
+        Returns tuple of offsets.
+        '''
+        import abjad
+        return tuple(
+            abjad.Offset(_, self.denominator) for _ in self.leaf_numerators)
+
+    @property
+    def proxy_numerators(self):
+        r'''Gets sorted numerators of ``QEventProxy`` offsets.
+
+        Returns tuple of integers.
+        '''
+        return self._proxy_numerators
+
+    @property
+    def q_event_proxies(self):
+        r'''Gets ``QEventProxies`` of compact q-grid.
+
+        Returns tuple.
+        '''
+        return self._q_event_proxies
@@ -21,6 +21,8 @@ class MeasurewiseQTarget(QTarget):
         attach_tempos=True,
         attack_point_optimizer=None,
         grace_handler=None,
+        previous_item=None,
+        previous_leaf=None,
         ):
         import abjad
         voice = abjad.Voice()
@@ -30,7 +32,8 @@ class MeasurewiseQTarget(QTarget):
         measure = abjad.Measure(q_target_measure.time_signature)
         for beat in q_target_measure.beats:
             measure.extend(beat.q_grid(beat.beatspan))
-        if attach_tempos:
+        if attach_tempos and (previous_item is None or
+            q_target_measure.tempo != previous_item.tempo):
             tempo = copy.copy(q_target_measure.tempo)
             #abjad.attach(tempo, measure)
             leaf = abjad.inspect(measure).get_leaf(0)
@@ -55,6 +58,7 @@ class MeasurewiseQTarget(QTarget):
         self._notate_leaves(
             grace_handler=grace_handler,
             voice=voice,
+            previous_leaf=previous_leaf,
             )
 
         # partition logical ties in each measure
@@ -1,5 +1,8 @@
+import math
 import multiprocessing
 import pickle
+import queue
+import weakref
 from abjad.tools.quantizationtools.JobHandler import JobHandler
 
 
@@ -8,35 +11,226 @@ class ParallelJobHandler(JobHandler):
 
     Processes ``QuantizationJob`` instances in parallel, based on the number of
     CPUs available.
+
+    ..  container:: example
+
+        >>> job_handler = abjad.quantizationtools.ParallelJobHandler(
+        ...     worker_count=2,
+        ...     )
+        >>> job_handler
+        ParallelJobHandler(worker_count=2)
+
+    ..  container:: example
+
+        Quantizes many sequences with one pool of workers:
+
+        >>> quantizer = abjad.quantizationtools.Quantizer()
+        >>> with job_handler: # doctest: +SKIP
+        ...     for q_event_sequence in q_event_sequences:
+        ...         result = quantizer(
+        ...             q_event_sequence,
+        ...             job_handler=job_handler,
+        ...             )
+        ...
+
+    Starts `worker_count` worker processes at first call and keeps them for
+    later calls. Stops workers on exit, on shutdown or when handler is
+    garbage-collected. Workers are daemonic and also stop when Python exits.
+
+    Sends jobs to workers in chunks of `chunk_size` jobs. Chooses chunk size
+    to give each worker about four chunks when `chunk_size` is none.
+
+    Returns jobs in order of submission. Raises exception of first job that
+    raises. Stops workers when call fails before all chunks return, so that
+    later calls never receive chunks of failed call.
     '''
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = (
+        '__weakref__',
+        '_chunk_size',
+        '_finalizer',
+        '_job_queue',
+        '_result_queue',
+        '_worker_count',
+        '_workers',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, worker_count=None, chunk_size=None):
+        if worker_count is not None:
+            worker_count = int(worker_count)
+            assert 0 < worker_count, repr(worker_count)
+        if chunk_size is not None:
+            chunk_size = int(chunk_size)
+            assert 0 < chunk_size, repr(chunk_size)
+        self._chunk_size = chunk_size
+        self._finalizer = None
+        self._job_queue = None
+        self._result_queue = None
+        self._worker_count = worker_count
+        self._workers = []
 
     ### SPECIAL METHODS ###
 
     def __call__(self, jobs):
         r'''Calls parallel job handler.
+
+        Returns list of jobs.
         '''
+        jobs = list(jobs)
+        if not jobs:
+            return jobs
+        self._start_workers()
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = len(jobs) / float(len(self._workers) * 4)
+            chunk_size = int(math.ceil(chunk_size))
+        chunk_count, exception = 0, None
+        try:
+            for i in range(0, len(jobs), chunk_size):
+                chunk = (chunk_count, jobs[i:i + chunk_size])
+                self._job_queue.put(
+                    pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL))
+                chunk_count += 1
+            chunks = [None] * chunk_count
+            for _ in range(chunk_count):
+                index, finished_jobs, chunk_exception = pickle.loads(
+                    self._get_result())
+                chunks[index] = finished_jobs
+                if chunk_exception is not None and exception is None:
+                    exception = chunk_exception
+        except BaseException:
+            # workers may still hold chunks of this call
+            self.shutdown()
+            raise
+        if exception is not None:
+            raise exception
+        return [job for chunk in chunks for job in chunk]
+
+    def __enter__(self):
+        r'''Enters parallel job handler.
+
+        Returns parallel job handler.
+        '''
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r'''Exits parallel job handler.
+
+        Stops workers.
+
+        Returns none.
+        '''
+        self.shutdown()
+
+    def __getstate__(self):
+        r'''Gets state of parallel job handler.
+
+        Omits workers: copies start their own workers.
+
+        Returns dictionary.
+        '''
+        return {
+            '_chunk_size': self.chunk_size,
+            '_finalizer': None,
+            '_job_queue': None,
+            '_result_queue': None,
+            '_worker_count': self.worker_count,
+            '_workers': [],
+            }
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        import abjad
+        return abjad.FormatSpecification(
+            client=self,
+            repr_kwargs_names=['chunk_size', 'worker_count'],
+            )
+
+    def _get_result(self):
+        while True:
+            try:
+                return self._result_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+            if not all(_.is_alive() for _ in self._workers):
+                self.shutdown()
+                message = 'parallel job handler worker stopped unexpectedly.'
+                raise RuntimeError(message)
+
+    def _start_workers(self):
         from abjad.tools import quantizationtools
-        finished_jobs = []
-        job_queue = multiprocessing.JoinableQueue()
-        result_queue = multiprocessing.Queue()
-        workers = [quantizationtools.ParallelJobHandlerWorker(
-            job_queue, result_queue)
-            for i in range(multiprocessing.cpu_count() * 2)]
-        for worker in workers:
+        if self._workers:
+            return
+        worker_count = self.worker_count or multiprocessing.cpu_count()
+        self._job_queue = multiprocessing.Queue()
+        self._result_queue = multiprocessing.Queue()
+        for _ in range(worker_count):
+            worker = quantizationtools.ParallelJobHandlerWorker(
+                self._job_queue,
+                self._result_queue,
+                )
+            worker.daemon = True
             worker.start()
-        for job in jobs:
-            job_queue.put(pickle.dumps(job, protocol=0))
-        for i in range(len(jobs)):
-            finished_jobs.append(pickle.loads(result_queue.get()))
+            self._workers.append(worker)
+        self._finalizer = weakref.finalize(
+            self,
+            ParallelJobHandler._stop_workers,
+            self._workers,
+            self._job_queue,
+            self._result_queue,
+            )
+
+    @staticmethod
+    def _stop_workers(workers, job_queue, result_queue):
         for worker in workers:
-            job_queue.put(None)
-        job_queue.join()
-        result_queue.close()
-        job_queue.close()
+            if worker.is_alive():
+                job_queue.put(None)
         for worker in workers:
-            worker.join()
-        return finished_jobs
+            worker.join(timeout=1)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        job_queue.close()
+        result_queue.close()
+
+    ### PUBLIC METHODS ###
+
+    def shutdown(self):
+        r'''Stops workers.
+
+        Handler restarts workers at next call.
+
+        Returns none.
+        '''
+        if not self._workers:
+            return
+        self._finalizer()
+        self._finalizer = None
+        self._job_queue = None
+        self._result_queue = None
+        self._workers = []
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def chunk_size(self):
+        r'''Gets number of jobs sent to worker at once.
+
+        Returns positive integer or none.
+        '''
+        return self._chunk_size
+
+    @property
+    def worker_count(self):
+        r'''Gets number of worker processes.
+
+        Uses number of CPUs when none.
+
+        Returns positive integer or none.
+        '''
+        return self._worker_count
@@ -5,7 +5,7 @@ import pickle
 class ParallelJobHandlerWorker(multiprocessing.Process):
     r'''Parallel job-handler worker.
 
-    Worker process which runs ``QuantizationJobs``.
+    Worker process which runs chunks of ``QuantizationJobs``.
 
     Not composer-safe.
 
@@ -29,15 +29,26 @@ class ParallelJobHandlerWorker(multiprocessing.Process):
         Returns none.
         '''
         while True:
-            job = self.job_queue.get()
-            if job is None:
+            chunk = self.job_queue.get()
+            if chunk is None:
                 # poison pill causes worker shutdown
-                #print '{}: Exiting'.format(process_name)
-                self.job_queue.task_done()
                 break
-            #print '{}: {!r}'.format(process_name, job)
-            job = pickle.loads(job)
-            job()
-            self.job_queue.task_done()
-            self.result_queue.put(pickle.dumps(job, protocol=0))
+            index, jobs = pickle.loads(chunk)
+            exception = None
+            try:
+                for job in jobs:
+                    job()
+            except Exception as e:
+                exception = e
+            try:
+                result = pickle.dumps(
+                    (index, jobs, exception),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+            except Exception as e:
+                result = pickle.dumps(
+                    (index, [], RuntimeError(repr(e))),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+            self.result_queue.put(result)
         return
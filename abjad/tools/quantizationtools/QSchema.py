@@ -72,9 +72,7 @@ class QSchema(AbjadObject):
         idx, current_offset = 0, 0
         duration = abjad.Duration(duration)
         while current_offset < duration:
-            lookup = self[idx]
-            lookup['offset_in_ms'] = current_offset
-            target_item = self.target_item_class(**lookup)
+            target_item = self._make_target_item(idx, current_offset)
             target_items.append(target_item)
             current_offset += target_item.duration_in_ms
             idx += 1
@@ -126,6 +124,11 @@ class QSchema(AbjadObject):
             lookups[name] = dict(lookups[name])
         return dict(lookups)
 
+    def _make_target_item(self, index, offset_in_ms):
+        lookup = self[index]
+        lookup['offset_in_ms'] = offset_in_ms
+        return self.target_item_class(**lookup)
+
     ### PUBLIC PROPERTIES ###
 
     @abc.abstractproperty
@@ -1,5 +1,6 @@
 import abc
 import bisect
+import collections
 from abjad.tools import datastructuretools
 from abjad.tools import indicatortools
 from abjad.tools import scoretools
@@ -27,6 +28,8 @@ class QTarget(AbjadObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_cache_hit_count',
+        '_cache_miss_count',
         '_items',
         )
 
@@ -36,6 +39,8 @@ class QTarget(AbjadObject):
         items = items or []
         #assert len(items)
         assert all(isinstance(x, self.item_class) for x in items)
+        self._cache_hit_count = 0
+        self._cache_miss_count = 0
         self._items = tuple(sorted(items, key=lambda x: x.offset_in_ms))
 
     ### SPECIAL METHODS ###
@@ -47,9 +52,13 @@ class QTarget(AbjadObject):
         heuristic=None,
         job_handler=None,
         attack_point_optimizer=None,
-        attach_tempos=True
+        attach_tempos=True,
+        cache=None,
         ):
         r'''Calls q-target.
+
+        Fetches ``QGrids`` of beats from `cache` when `cache` is not none and
+        searches only beats missing from `cache`.
         '''
 
         from abjad.tools import quantizationtools
@@ -74,6 +83,9 @@ class QTarget(AbjadObject):
         assert isinstance(
             attack_point_optimizer, quantizationtools.AttackPointOptimizer)
 
+        if cache is not None:
+            assert isinstance(cache, quantizationtools.QuantizationJobCache)
+
         # if next-to-last QEvent is silent, pop the TerminalQEvent,
         # in order to prevent rest-tuplets
         q_events = q_event_sequence
@@ -88,45 +100,51 @@ class QTarget(AbjadObject):
             beat = beats[index]
             beat.q_events.append(q_event)
 
-        # generate QuantizationJobs and process with the JobHandler
-        jobs = [beat(i) for i, beat in enumerate(beats)]
-        jobs = [job for job in jobs if job]
-        jobs = job_handler(jobs)
-        for job in jobs:
-            beats[job.job_id]._q_grids = job.q_grids
-
-        #for i, beat in enumerate(beats):
-        #    print i, len(beat.q_grids)
-        #    for q_event in beat.q_events:
-        #        print '\t{}'.format(q_event.offset)
-
-        # select the best QGrid for each beat, according to the Heuristic
-        beats = heuristic(beats)
-
-        # shift QEvents attached to each QGrid's "next downbeat"
-        # over to the next QGrid's first leaf - the real downbeat
-        self._shift_downbeat_q_events_to_next_q_grid()
-
-        #  TODO: handle a final QGrid with QEvents attached to its
-        #        next_downbeat.
-        #  TODO: remove a final QGrid with no QEvents
-
-        # convert the QGrid representation into notation,
-        # handling grace-note behavior with the GraceHandler
-        return self._notate(
+        return self._quantize(
             attach_tempos=attach_tempos,
             attack_point_optimizer=attack_point_optimizer,
+            cache=cache,
             grace_handler=grace_handler,
+            heuristic=heuristic,
+            job_handler=job_handler,
             )
 
     ### PRIVATE METHODS ###
 
+    def _handle_jobs(self, jobs, job_handler, cache):
+        if cache is None:
+            return job_handler(jobs)
+        hit_count, miss_count = cache.hit_count, cache.miss_count
+        finished_jobs, new_jobs = [], collections.OrderedDict()
+        repeated_jobs = []
+        for job in jobs:
+            key = cache.get_key(job)
+            if key in new_jobs:
+                repeated_jobs.append(job)
+            elif cache.fetch(job):
+                finished_jobs.append(job)
+            else:
+                new_jobs[key] = job
+        for job in job_handler(list(new_jobs.values())):
+            cache.store(job)
+            finished_jobs.append(job)
+        for job in repeated_jobs:
+            # search again only when cache evicted entry
+            if not cache.fetch(job):
+                job()
+            finished_jobs.append(job)
+        self._cache_hit_count = cache.hit_count - hit_count
+        self._cache_miss_count = cache.miss_count - miss_count
+        return finished_jobs
+
     @abc.abstractmethod
     def _notate(
         self,
         grace_handler=None,
         attack_point_optimizer=None,
         attach_tempos=True,
+        previous_item=None,
+        previous_leaf=None,
         ):
         pass
 
@@ -134,6 +152,7 @@ class QTarget(AbjadObject):
         self,
         grace_handler=None,
         voice=None,
+        previous_leaf=None,
         ):
         for leaf in iterate(voice).leaves():
             if leaf._has_indicator(dict):
@@ -155,33 +174,96 @@ class QTarget(AbjadObject):
                     attach(tie, new_leaf)
                 mutate(leaf).replace(new_leaf)
             else:
-                previous_leaf = leaf._get_leaf(-1)
-                if isinstance(previous_leaf, scoretools.Rest):
-                    new_leaf = type(previous_leaf)(
+                preceding_leaf = leaf._get_leaf(-1)
+                if preceding_leaf is None:
+                    # voice continues output that ends with previous leaf
+                    preceding_leaf = previous_leaf
+                if isinstance(preceding_leaf, scoretools.Rest):
+                    new_leaf = type(preceding_leaf)(
                         leaf.written_duration,
                         )
-                elif isinstance(previous_leaf, scoretools.Note):
-                    new_leaf = type(previous_leaf)(
-                        previous_leaf.written_pitch,
+                elif isinstance(preceding_leaf, scoretools.Note):
+                    new_leaf = type(preceding_leaf)(
+                        preceding_leaf.written_pitch,
                         leaf.written_duration,
                         )
                 else:
-                    new_leaf = type(previous_leaf)(
-                        previous_leaf.written_pitch,
+                    new_leaf = type(preceding_leaf)(
+                        preceding_leaf.written_pitch,
                         leaf.written_duration,
                         )
                 mutate(leaf).replace(new_leaf)
-                tie = inspect(previous_leaf).get_spanner(spannertools.Tie)
-                if tie is not None:
-                    tie._append(new_leaf)
+                if preceding_leaf is previous_leaf:
+                    tie = spannertools.Tie()
+                    if tie._attachment_test(new_leaf):
+                        attach(tie, new_leaf)
+                else:
+                    tie = inspect(preceding_leaf).get_spanner(
+                        spannertools.Tie)
+                    if tie is not None:
+                        tie._append(new_leaf)
             if leaf._has_indicator(indicatortools.MetronomeMark):
                 tempo = leaf._get_indicator(indicatortools.MetronomeMark)
                 detach(indicatortools.MetronomeMark, leaf)
                 attach(tempo, new_leaf)
 
-    def _shift_downbeat_q_events_to_next_q_grid(self):
+    def _quantize(
+        self,
+        attach_tempos=True,
+        attack_point_optimizer=None,
+        cache=None,
+        grace_handler=None,
+        heuristic=None,
+        job_handler=None,
+        previous_item=None,
+        previous_leaf=None,
+        ):
+        # output notated earlier ends with previous item and previous leaf
+        beats = self.beats
+        previous_beat = None
+        if previous_item is not None:
+            previous_beat = type(self)([previous_item]).beats[-1]
+
+        # generate QuantizationJobs and process with the JobHandler
+        jobs = [beat(i) for i, beat in enumerate(beats)]
+        jobs = [job for job in jobs if job]
+        jobs = self._handle_jobs(jobs, job_handler, cache)
+        for job in jobs:
+            beats[job.job_id]._q_grids = job.q_grids
+
+        #for i, beat in enumerate(beats):
+        #    print i, len(beat.q_grids)
+        #    for q_event in beat.q_events:
+        #        print '\t{}'.format(q_event.offset)
+
+        # select the best QGrid for each beat, according to the Heuristic
+        beats = heuristic(beats)
+
+        # shift QEvents attached to each QGrid's "next downbeat"
+        # over to the next QGrid's first leaf - the real downbeat
+        self._shift_downbeat_q_events_to_next_q_grid(
+            previous_beat=previous_beat,
+            )
+
+        #  TODO: handle a final QGrid with QEvents attached to its
+        #        next_downbeat.
+        #  TODO: remove a final QGrid with no QEvents
+
+        # convert the QGrid representation into notation,
+        # handling grace-note behavior with the GraceHandler
+        return self._notate(
+            attach_tempos=attach_tempos,
+            attack_point_optimizer=attack_point_optimizer,
+            grace_handler=grace_handler,
+            previous_item=previous_item,
+            previous_leaf=previous_leaf,
+            )
+
+    def _shift_downbeat_q_events_to_next_q_grid(self, previous_beat=None):
         import abjad
         beats = self.beats
+        if previous_beat is not None:
+            beats = (previous_beat,) + tuple(beats)
         for one, two in abjad.sequence(beats).nwise():
             one_q_events = one.q_grid.next_downbeat.q_event_proxies
             two_q_events = two.q_grid.leaves[0].q_event_proxies
@@ -196,6 +278,34 @@ class QTarget(AbjadObject):
         '''
         raise NotImplementedError
 
+    @property
+    def cache_hit_count(self):
+        r'''Number of beats of last call whose ``QGrids`` came from cache.
+
+        Returns nonnegative integer.
+        '''
+        return self._cache_hit_count
+
+    @property
+    def cache_hit_rate(self):
+        r'''Ratio of cache hits to beats searched or fetched in last call.
+
+        Returns float or none.
+        '''
+        count = self.cache_hit_count + self.cache_miss_count
+        if not count:
+            return None
+        return self.cache_hit_count / count
+
+    @property
+    def cache_miss_count(self):
+        r'''Number of beats of last call searched because missing from
+        cache.
+
+        Returns nonnegative integer.
+        '''
+        return self._cache_miss_count
+
     @property
     def duration_in_ms(self):
         r'''Duration of q-target in milliseconds.
@@ -44,8 +44,10 @@ class QuantizationJob(AbjadObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_explored_count',
         '_job_id',
         '_q_event_proxies',
+        '_pruned_count',
         '_q_grids',
         '_search_tree',
         )
@@ -67,7 +69,9 @@ class QuantizationJob(AbjadObject):
             isinstance(x, quantizationtools.QEventProxy)
             for x in q_event_proxies
             )
+        self._explored_count = 0
         self._job_id = job_id
+        self._pruned_count = 0
         self._search_tree = search_tree
         self._q_event_proxies = tuple(q_event_proxies)
         if q_grids is None:
@@ -90,27 +94,63 @@ class QuantizationJob(AbjadObject):
         #print('XXX')
         #print(format(self.q_event_proxies[0]))
 
-        q_grid = quantizationtools.QGrid()
-        q_grid.fit_q_events(self.q_event_proxies)
+        search_tree = self.search_tree
+        if search_tree.compact:
+            q_grid = quantizationtools.CompactQGrid(self.q_event_proxies)
+        else:
+            q_grid = quantizationtools.QGrid()
+            q_grid.fit_q_events(self.q_event_proxies)
 
         #print(format(q_grid))
 
+        maximum_explored_count = search_tree.maximum_explored_count
+        best_distance = None
+        if search_tree.bounded:
+            best_distance = q_grid.distance
+        explored_count, pruned_count = 0, 0
         old_q_grids = []
         new_q_grids = [q_grid]
 
         while new_q_grids:
             q_grid = new_q_grids.pop()
-            search_results = self.search_tree(q_grid)
+            if best_distance is not None:
+                lower_bound = search_tree._find_lower_bound(q_grid)
+                if best_distance < lower_bound:
+                    pruned_count += 1
+                    continue
+            old_q_grids.append(q_grid)
+            if (maximum_explored_count is not None and
+                maximum_explored_count <= explored_count):
+                pruned_count += 1
+                continue
+            if best_distance is None:
+                search_results = search_tree(q_grid)
+            else:
+                search_results, best_distance, count = search_tree._search(
+                    q_grid,
+                    best_distance,
+                    )
+                pruned_count += count
+            explored_count += 1
             #print q_grid.rtm_format
             #for x in search_results:
             #    print '\t', x.rtm_format
             new_q_grids.extend(search_results)
-            old_q_grids.append(q_grid)
+
+        if best_distance is not None:
+            q_grids = [_ for _ in old_q_grids if _.distance <= best_distance]
+            pruned_count += len(old_q_grids) - len(q_grids)
+            old_q_grids = q_grids
+
+        if search_tree.compact:
+            old_q_grids = [_.to_q_grid() for _ in old_q_grids]
 
         #for q_grid in old_q_grids:
         #    print('\t', q_grid)
         #print()
 
+        self._explored_count = explored_count
+        self._pruned_count = pruned_count
         self._q_grids = tuple(old_q_grids)
 
     def __eq__(self, argument):
@@ -139,6 +179,14 @@ class QuantizationJob(AbjadObject):
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def explored_count(self):
+        r'''Number of ``QGrids`` search subdivided in last call.
+
+        Returns nonnegative integer.
+        '''
+        return self._explored_count
+
     @property
     def job_id(self):
         r'''The job id of the ``QuantizationJob``.
@@ -203,6 +251,15 @@ class QuantizationJob(AbjadObject):
         '''
         return self._q_event_proxies
 
+    @property
+    def pruned_count(self):
+        r'''Number of ``QGrids`` search discarded or left unsubdivided in last
+        call because of search bounds.
+
+        Returns nonnegative integer.
+        '''
+        return self._pruned_count
+
     @property
     def q_grids(self):
         r'''The generated ``QGrids``.
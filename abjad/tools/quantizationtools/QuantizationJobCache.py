@@ -0,0 +1,285 @@
+import collections
+import copy
+import os
+import pickle
+import tempfile
+from abjad.tools.abctools import AbjadObject
+
+
+class QuantizationJobCache(AbjadObject):
+    r'''Quantization job cache.
+
+    ..  container:: example
+
+        >>> cache = abjad.quantizationtools.QuantizationJobCache()
+        >>> cache
+        QuantizationJobCache(maximum_size=1024)
+
+    ..  container:: example
+
+        Beats with the same search tree and the same offsets share
+        ``QGrids``:
+
+        >>> q_event_a = abjad.quantizationtools.PitchedQEvent(250, [0, 1])
+        >>> q_event_b = abjad.quantizationtools.PitchedQEvent(1250, [3, 7])
+        >>> proxy_a = abjad.quantizationtools.QEventProxy(q_event_a, 0.25)
+        >>> proxy_b = abjad.quantizationtools.QEventProxy(
+        ...     q_event_b, 1000, 2000)
+
+        >>> definition = {2: {2: None}, 3: None}
+        >>> search_tree = abjad.quantizationtools.UnweightedSearchTree(
+        ...     definition)
+        >>> job_a = abjad.quantizationtools.QuantizationJob(
+        ...     1, search_tree, [proxy_a])
+        >>> job_b = abjad.quantizationtools.QuantizationJob(
+        ...     2, search_tree, [proxy_b])
+
+        >>> cache.fetch(job_a)
+        False
+        >>> job_a()
+        >>> cache.store(job_a)
+        >>> cache.fetch(job_b)
+        True
+
+        >>> for q_grid in job_b.q_grids:
+        ...     print(q_grid.rtm_format)
+        1
+        (1 (1 1 1))
+        (1 (1 1))
+        (1 ((1 (1 1)) 1))
+
+        >>> job_b.q_grids[-1].leaves[1].q_event_proxies[0] is proxy_b
+        True
+
+        >>> cache.hit_count, cache.miss_count
+        (1, 1)
+
+    ..  container:: example
+
+        Quantizer searches each distinct beat once:
+
+        >>> durations = [250, 250, 500] * 8
+        >>> q_event_sequence = \
+        ...     abjad.quantizationtools.QEventSequence.from_millisecond_durations(
+        ...     durations)
+        >>> quantizer = abjad.quantizationtools.Quantizer()
+        >>> cache = abjad.quantizationtools.QuantizationJobCache()
+        >>> result = quantizer(q_event_sequence, cache=cache)
+        >>> cache.hit_count, cache.miss_count
+        (6, 2)
+
+    Keys ``QGrids`` by search tree and by offsets of ``QEventProxies``
+    normalized to beat; see ``get_key()``. Stores ``QGrids`` without ``QEventProxies`` and fits
+    ``QEventProxies`` of fetching job onto copies.
+
+    Evicts least recently used entries when cache holds more than
+    `maximum_size` entries. Loads entries from `path` at initialization
+    when `path` is not none; call ``save()`` to write entries to `path`.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_entries',
+        '_hit_count',
+        '_maximum_size',
+        '_miss_count',
+        '_path',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, maximum_size=1024, path=None):
+        maximum_size = int(maximum_size)
+        assert 0 < maximum_size, repr(maximum_size)
+        self._entries = collections.OrderedDict()
+        self._hit_count = 0
+        self._maximum_size = maximum_size
+        self._miss_count = 0
+        if path is not None:
+            path = os.path.abspath(os.path.expanduser(path))
+        self._path = path
+        if path is not None and os.path.isfile(path):
+            self.load()
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        r'''Gets number of entries in cache.
+
+        Returns nonnegative integer.
+        '''
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self):
+        while self.maximum_size < len(self._entries):
+            self._entries.popitem(last=False)
+
+    def _get_format_specification(self):
+        import abjad
+        return abjad.FormatSpecification(
+            client=self,
+            repr_kwargs_names=['maximum_size'],
+            )
+
+    @staticmethod
+    def _make_q_grids(templates, q_event_proxies):
+        q_grids = []
+        for template in templates:
+            q_grid = copy.copy(template)
+            q_grid.fit_q_events(q_event_proxies)
+            q_grids.append(q_grid)
+        return tuple(q_grids)
+
+    @staticmethod
+    def _make_templates(q_grids):
+        templates = []
+        for q_grid in q_grids:
+            template = copy.copy(q_grid)
+            for leaf in template.leaves:
+                del leaf.q_event_proxies[:]
+            templates.append(template)
+        return tuple(templates)
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        r'''Removes all entries from cache.
+
+        Returns none.
+        '''
+        self._entries.clear()
+
+    def fetch(self, job):
+        r'''Fits ``QEventProxies`` of `job` onto ``QGrids`` stored under
+        key of `job` and sets ``QGrids`` of `job`.
+
+        Returns true when cache contains key of `job`. Otherwise false.
+        '''
+        key = self.get_key(job)
+        templates = self._entries.get(key)
+        if templates is None:
+            self._miss_count += 1
+            return False
+        self._entries.move_to_end(key)
+        job._q_grids = self._make_q_grids(templates, job.q_event_proxies)
+        self._hit_count += 1
+        return True
+
+    @staticmethod
+    def get_key(job):
+        r'''Gets cache key of `job`.
+
+        Key is search tree and sorted distinct offsets of ``QEventProxies``.
+        Exhaustive search depends on nothing else. Bounded or budgeted search
+        prunes by ``QGrid`` distance, which averages over ``QEventProxies``;
+        key then pairs each offset with count of ``QEventProxies`` at offset.
+
+        Returns tuple.
+        '''
+        search_tree = job.search_tree
+        counter = collections.Counter(_.offset for _ in job.q_event_proxies)
+        if (search_tree.bounded or
+            search_tree.maximum_explored_count is not None):
+            offsets = tuple(sorted(counter.items()))
+        else:
+            offsets = tuple(sorted(counter))
+        return (repr(search_tree), offsets)
+
+    def load(self):
+        r'''Replaces entries of cache with entries saved to path of cache.
+
+        Empties cache when file at path is missing or unreadable.
+
+        Returns none.
+        '''
+        assert self.path is not None
+        try:
+            with open(self.path, 'rb') as file_pointer:
+                entries = pickle.load(file_pointer)
+            assert isinstance(entries, collections.OrderedDict)
+        except Exception:
+            entries = collections.OrderedDict()
+        self._entries = entries
+        self._evict()
+
+    def save(self):
+        r'''Writes entries of cache to path of cache.
+
+        Returns none.
+        '''
+        assert self.path is not None
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file_pointer:
+                pickle.dump(
+                    self._entries,
+                    file_pointer,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+            os.replace(temporary_path, self.path)
+        except Exception:
+            os.remove(temporary_path)
+            raise
+
+    def store(self, job):
+        r'''Stores ``QGrids`` of `job` under key of `job`.
+
+        Then evicts least recently used entries.
+
+        Returns none.
+        '''
+        key = self.get_key(job)
+        self._entries[key] = self._make_templates(job.q_grids)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def hit_count(self):
+        r'''Gets number of fetches that found ``QGrids`` in cache.
+
+        Returns nonnegative integer.
+        '''
+        return self._hit_count
+
+    @property
+    def hit_rate(self):
+        r'''Gets ratio of hits to fetches.
+
+        Returns float or none.
+        '''
+        count = self.hit_count + self.miss_count
+        if not count:
+            return None
+        return self.hit_count / count
+
+    @property
+    def maximum_size(self):
+        r'''Gets maximum number of entries in cache.
+
+        Returns positive integer.
+        '''
+        return self._maximum_size
+
+    @property
+    def miss_count(self):
+        r'''Gets number of fetches that found no ``QGrids`` in cache.
+
+        Returns nonnegative integer.
+        '''
+        return self._miss_count
+
+    @property
+    def path(self):
+        r'''Gets path of file to which cache saves entries.
+
+        Returns string or none.
+        '''
+        return self._path
@@ -209,6 +209,11 @@ class Quantizer(AbjadObject):
           Options currently include ``MeasurewiseAttackPointOptimizer``,
           ``NaiveAttackPointOptimizer`` and ``NullAttackPointOptimizer``.
 
+        * ``cache``: a ``QuantizationJobCache`` instance stores the
+          ``QGrids`` found for each beat. Beats with the same search tree and
+          the same offsets skip the search. Reuse the cache across calls to
+          quantize repeated material quickly.
+
     Refer to the reference pages for ``BeatwiseQSchema`` and
     ``MeasurewiseQSchema`` for more information on controlling the
     ``Quantizer``'s output, and to the reference on ``SearchTree`` for
@@ -235,6 +240,7 @@ class Quantizer(AbjadObject):
         job_handler=None,
         attack_point_optimizer=None,
         attach_tempos=True,
+        cache=None,
         ):
         r'''Calls quantizer.
 
@@ -257,6 +263,7 @@ class Quantizer(AbjadObject):
             job_handler=job_handler,
             attack_point_optimizer=attack_point_optimizer,
             attach_tempos=attach_tempos,
+            cache=cache,
             )
 
         return notation
@@ -1,4 +1,5 @@
 import abc
+import bisect
 import copy
 from abjad.tools import datastructuretools
 from abjad.tools import mathtools
@@ -15,22 +16,87 @@ class SearchTree(AbjadObject):
     subdivisions in the quantization output.  That is to say, they allow
     composers to specify what sorts of tuplets and ratios of pulses may be
     contained within other tuplets, to arbitrary levels of nesting.
+
+    ..  container:: example
+
+        Bounded search trees skip ``QGrids`` which can not beat the least
+        distance found so far:
+
+        >>> definition = {2: {2: {2: None}, 3: None}, 3: {2: None}, 5: None}
+        >>> search_tree = abjad.quantizationtools.UnweightedSearchTree(
+        ...     definition=definition,
+        ...     bounded=True,
+        ...     )
+        >>> offsets = [0, 200, 250, 400, 500, 600, 750, 800]
+        >>> q_event_proxies = [
+        ...     abjad.quantizationtools.QEventProxy(
+        ...         abjad.quantizationtools.PitchedQEvent(x, [0]),
+        ...         0,
+        ...         1000,
+        ...         )
+        ...     for x in offsets
+        ...     ]
+        >>> job = abjad.quantizationtools.QuantizationJob(
+        ...     1, search_tree, q_event_proxies)
+        >>> job()
+        >>> job.explored_count, job.pruned_count, len(job.q_grids)
+        (8, 11, 1)
+
+        Exhaustive search keeps every ``QGrid``:
+
+        >>> search_tree = abjad.quantizationtools.UnweightedSearchTree(
+        ...     definition=definition,
+        ...     )
+        >>> job = abjad.quantizationtools.QuantizationJob(
+        ...     1, search_tree, q_event_proxies)
+        >>> job()
+        >>> job.explored_count, job.pruned_count, len(job.q_grids)
+        (12, 0, 12)
+
+    Bounded search keeps only ``QGrids`` with least distance, which are
+    the only ``QGrids`` ``DistanceHeuristic`` selects from. Search
+    stops subdividing after `maximum_explored_count` ``QGrids`` when
+    `maximum_explored_count` is not none, and may then miss the ``QGrid``
+    with least distance.
+
+    Compact search trees search with ``CompactQGrids`` and make ``QGrids``
+    only of ``CompactQGrids`` kept after search. Compact and ordinary
+    search keep the same ``QGrids``.
     '''
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_bounded',
+        '_compact',
         '_definition',
+        '_maximum_explored_count',
         )
 
     ### INITIALIZER ###
 
-    def __init__(self, definition=None):
+    def __init__(
+        self,
+        definition=None,
+        bounded=None,
+        maximum_explored_count=None,
+        compact=None,
+        ):
         if definition is None:
             definition = self.default_definition
         else:
             assert self._is_valid_definition(definition)
         self._definition = definition
+        if bounded is not None:
+            bounded = bool(bounded)
+        self._bounded = bounded
+        if compact is not None:
+            compact = bool(compact)
+        self._compact = compact
+        if maximum_explored_count is not None:
+            maximum_explored_count = int(maximum_explored_count)
+            assert 0 < maximum_explored_count, repr(maximum_explored_count)
+        self._maximum_explored_count = maximum_explored_count
 
     ### SPECIAL METHODS ###
 
@@ -38,25 +104,29 @@ class SearchTree(AbjadObject):
         r'''Calls search tree.
         '''
         from abjad.tools import quantizationtools
+        if isinstance(q_grid, quantizationtools.CompactQGrid):
+            indices, subdivisions = \
+                self._find_compact_divisible_leaf_indices_and_subdivisions(
+                    q_grid)
+            commands = self._make_subdivision_commands(indices, subdivisions)
+            return [q_grid.subdivide_leaves(_) for _ in commands]
         assert isinstance(q_grid, quantizationtools.QGrid)
-        new_q_grids = []
         commands = self._generate_all_subdivision_commands(q_grid)
-        for command in commands:
-            new_q_grid = copy.copy(q_grid)
-            q_events = new_q_grid.subdivide_leaves(command)
-            new_q_grid.fit_q_events(q_events)
-            new_q_grids.append(new_q_grid)
-        return new_q_grids
+        return self._subdivide(q_grid, commands)
 
     def __eq__(self, argument):
-        r'''Is true when `argument` is a search tree with definition equal to that of
-        this search tree. Otherwise false.
+        r'''Is true when `argument` is a search tree with definition and
+        search options equal to those of this search tree. Otherwise false.
 
         Returns true or false.
         '''
         if type(self) == type(argument):
             if self.definition == argument.definition:
-                return True
+                if (self.bounded == argument.bounded and
+                    self.compact == argument.compact):
+                    if (self.maximum_explored_count ==
+                        argument.maximum_explored_count):
+                        return True
         return False
 
     def __hash__(self):
@@ -70,6 +140,19 @@ class SearchTree(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    def _find_compact_divisible_leaf_indices_and_subdivisions(
+        self,
+        compact_q_grid,
+        ):
+        indices, subdivisions = [], []
+        for i in compact_q_grid._find_misaligned_leaf_indices():
+            parentage_ratios = compact_q_grid._parentage_ratios[i]
+            leaf_subdivisions = self._find_leaf_subdivisions(parentage_ratios)
+            if leaf_subdivisions:
+                indices.append(i)
+                subdivisions.append(tuple(leaf_subdivisions))
+        return indices, subdivisions
+
     def _find_divisible_leaf_indices_and_subdivisions(self, q_grid):
         # TODO: This should actually check for all QEvents which fall
         # within the leaf's duration,
@@ -103,9 +186,114 @@ class SearchTree(AbjadObject):
     def _find_leaf_subdivisions(self, leaf):
         raise NotImplementedError
 
+    def _find_fixed_distance(self, q_grid, indices):
+        # proxies between leaf offsets keep their distance unless search
+        # subdivides leaf starting at left offset
+        indices = set(indices)
+        count, distance = 0, 0
+        for i, (leaf, offset) in enumerate(zip(q_grid.leaves, q_grid.offsets)):
+            for q_event_proxy in leaf.q_event_proxies:
+                count += 1
+                if q_event_proxy.offset < offset:
+                    index = i - 1
+                else:
+                    index = i
+                if index not in indices:
+                    distance += abs(q_event_proxy.offset - offset)
+        return distance, count
+
+    def _find_lower_bound(self, q_grid):
+        from abjad.tools import quantizationtools
+        if isinstance(q_grid, quantizationtools.CompactQGrid):
+            indices, _ = \
+                self._find_compact_divisible_leaf_indices_and_subdivisions(
+                    q_grid)
+            return q_grid._find_distance(indices)
+        indices, _ = self._find_divisible_leaf_indices_and_subdivisions(
+            q_grid)
+        distance, count = self._find_fixed_distance(q_grid, indices)
+        if count:
+            return distance / count
+        return None
+
+    def _find_subdivision_distances(self, q_grid, index, subdivision):
+        # total distance of proxies between leaf at index and next leaf
+        # once leaf is subdivided, and least total distance any further
+        # subdivision of new leaves can reach
+        import abjad
+        leaves, offsets = q_grid.leaves, q_grid.offsets
+        leaf = leaves[index]
+        start_offset, stop_offset = offsets[index], offsets[index + 1]
+        total = sum(subdivision)
+        new_offsets, are_divisible = [start_offset], []
+        partial_sum = 0
+        for x in subdivision:
+            parentage_ratios = leaf.parentage_ratios + (
+                (abjad.Duration(x), abjad.Duration(total)),
+                )
+            leaf_subdivisions = self._find_leaf_subdivisions(parentage_ratios)
+            are_divisible.append(bool(leaf_subdivisions))
+            partial_sum += x
+            new_offset = start_offset
+            new_offset += (stop_offset - start_offset) * partial_sum / total
+            new_offsets.append(new_offset)
+        q_event_proxies = leaf.succeeding_q_event_proxies
+        q_event_proxies += leaves[index + 1].preceding_q_event_proxies
+        distance, lower_bound = 0, 0
+        for q_event_proxy in q_event_proxies:
+            offset = q_event_proxy.offset
+            i = bisect.bisect_right(new_offsets, offset) - 1
+            proxy_distance = min(
+                offset - new_offsets[i],
+                new_offsets[i + 1] - offset,
+                )
+            distance += proxy_distance
+            if not are_divisible[i]:
+                lower_bound += proxy_distance
+        return distance, lower_bound
+
     def _generate_all_subdivision_commands(self, q_grid):
+        indices, subdivisions = \
+            self._find_divisible_leaf_indices_and_subdivisions(q_grid)
+        return self._make_subdivision_commands(indices, subdivisions)
+
+    def _generate_bounded_subdivision_commands(self, q_grid, best_distance):
         indices, subdivisions = \
             self._find_divisible_leaf_indices_and_subdivisions(q_grid)
+        if not indices:
+            return (), best_distance, 0
+        fixed_distance, count = self._find_fixed_distance(q_grid, indices)
+        options = []
+        for index, leaf_subdivisions in zip(indices, subdivisions):
+            leaf_options = []
+            for subdivision in leaf_subdivisions:
+                distance, lower_bound = self._find_subdivision_distances(
+                    q_grid,
+                    index,
+                    subdivision,
+                    )
+                leaf_options.append((subdivision, distance, lower_bound))
+            options.append(tuple(leaf_options))
+        # distance is sum of independent distances for each subdivided leaf
+        distance = fixed_distance
+        distance += sum(min(_[1] for _ in x) for x in options)
+        best_distance = min(best_distance, distance / count)
+        enumerator = mathtools.Enumerator(options)
+        commands, pruned_count = [], 0
+        for combination in enumerator.yield_outer_product():
+            lower_bound = fixed_distance + sum(_[2] for _ in combination)
+            if best_distance * count < lower_bound:
+                pruned_count += 1
+                continue
+            command = tuple(zip(indices, [_[0] for _ in combination]))
+            commands.append(command)
+        return tuple(commands), best_distance, pruned_count
+
+    @abc.abstractmethod
+    def _is_valid_definition(self, definition):
+        raise NotImplementedError
+
+    def _make_subdivision_commands(self, indices, subdivisions):
         if not indices:
             return ()
         enumerator = mathtools.Enumerator(subdivisions)
@@ -113,12 +301,48 @@ class SearchTree(AbjadObject):
         combinations = [tuple(_) for _ in combinations]
         return tuple(tuple(zip(indices, combo)) for combo in combinations)
 
-    @abc.abstractmethod
-    def _is_valid_definition(self, definition):
-        raise NotImplementedError
+    def _search(self, q_grid, best_distance):
+        from abjad.tools import quantizationtools
+        if isinstance(q_grid, quantizationtools.CompactQGrid):
+            # compact q-grids are cheap to make; bound checks them later
+            new_q_grids = self(q_grid)
+            for new_q_grid in new_q_grids:
+                best_distance = min(best_distance, new_q_grid.distance)
+            return new_q_grids, best_distance, 0
+        commands, best_distance, pruned_count = \
+            self._generate_bounded_subdivision_commands(q_grid, best_distance)
+        new_q_grids = self._subdivide(q_grid, commands)
+        return new_q_grids, best_distance, pruned_count
+
+    def _subdivide(self, q_grid, commands):
+        new_q_grids = []
+        for command in commands:
+            new_q_grid = copy.copy(q_grid)
+            q_events = new_q_grid.subdivide_leaves(command)
+            new_q_grid.fit_q_events(q_events)
+            new_q_grids.append(new_q_grid)
+        return new_q_grids
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def bounded(self):
+        r'''Is true when search skips ``QGrids`` whose distance and whose
+        subdivisions' distance exceed least distance found so far.
+
+        Returns true, false or none.
+        '''
+        return self._bounded
+
+    @property
+    def compact(self):
+        r'''Is true when search subdivides ``CompactQGrids`` instead of
+        ``QGrids``.
+
+        Returns true, false or none.
+        '''
+        return self._compact
+
     @abc.abstractproperty
     def default_definition(self):
         r'''The default search tree definition.
@@ -134,3 +358,11 @@ class SearchTree(AbjadObject):
         Returns dictionary.
         '''
         return self._definition
+
+    @property
+    def maximum_explored_count(self):
+        r'''Maximum number of ``QGrids`` search subdivides for each beat.
+
+        Returns positive integer or none.
+        '''
+        return self._maximum_explored_count
@@ -0,0 +1,425 @@
+import bisect
+import collections
+from abjad.tools.abctools import AbjadObject
+
+
+class StreamingQuantizer(AbjadObject):
+    r'''Streaming quantizer.
+
+    ..  container:: example
+
+        Quantizes ``QEvents`` as they arrive and notates each measure once
+        no later ``QEvent`` can fall in it:
+
+        >>> quantizer = abjad.quantizationtools.StreamingQuantizer()
+        >>> quantizer
+        StreamingQuantizer(lookahead_in_ms=Duration(0, 1))
+
+        >>> for offset, pitch in ((0, 0), (1000, 2), (3000, 4), (4000, 5)):
+        ...     q_event = abjad.quantizationtools.PitchedQEvent(
+        ...         offset,
+        ...         [pitch],
+        ...         )
+        ...     components = quantizer.push(q_event)
+        ...     print(offset, len(components))
+        ...
+        0 0
+        1000 0
+        3000 0
+        4000 1
+
+        >>> components = quantizer.finish(6000)
+        >>> len(components)
+        1
+
+        >>> abjad.f(quantizer.voice)
+        \new Voice {
+            { % measure
+                \time 4/4
+                \tempo 4=60
+                c'4
+                d'2
+                e'4
+            } % measure
+            { % measure
+                f'2
+                r4
+                r4
+            } % measure
+        }
+
+    ..  container:: example
+
+        Quantizes beat by beat with ``BeatwiseQSchema``:
+
+        >>> q_schema = abjad.quantizationtools.BeatwiseQSchema()
+        >>> quantizer = abjad.quantizationtools.StreamingQuantizer(
+        ...     q_schema=q_schema,
+        ...     )
+        >>> for offset, pitch in ((0, 0), (1500, 2)):
+        ...     q_event = abjad.quantizationtools.PitchedQEvent(
+        ...         offset,
+        ...         [pitch],
+        ...         )
+        ...     components = quantizer.push(q_event)
+        ...     print(offset, len(components))
+        ...
+        0 0
+        1500 1
+
+        >>> components = quantizer.advance(2000)
+        >>> len(components)
+        2
+
+        >>> components = quantizer.finish(2000)
+        >>> len(components)
+        0
+
+        >>> abjad.f(quantizer.voice)
+        \new Voice {
+            \tempo 4=60
+            c'4 ~
+            c'8
+            d'8
+        }
+
+    Takes ``PitchedQEvents`` and ``SilentQEvents`` with offsets in
+    milliseconds from start of stream. Makes beats or measures of
+    `q_schema` as stream reaches them. Quantizes and notates beat or measure
+    once stream has advanced `lookahead_in_ms` past its end; ``QEvents``
+    may arrive out of order by no more than `lookahead_in_ms`. Appends
+    notation to `voice` and ties notes across beats and measures notated
+    separately.
+
+    Keeps only beats and measures not yet notated, together with last beat
+    or measure and last leaf notated. Remove components no longer needed
+    from `voice` to keep notation bounded too.
+
+    Attack-point optimizer acts on each group of beats or measures notated
+    together.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_attach_tempos',
+        '_attack_point_optimizer',
+        '_cache',
+        '_clock',
+        '_grace_handler',
+        '_heuristic',
+        '_is_finished',
+        '_item_count',
+        '_item_offset',
+        '_items',
+        '_job_handler',
+        '_last_q_event',
+        '_lookahead_in_ms',
+        '_previous_item',
+        '_previous_leaf',
+        '_q_schema',
+        '_voice',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        q_schema=None,
+        grace_handler=None,
+        heuristic=None,
+        job_handler=None,
+        attack_point_optimizer=None,
+        attach_tempos=True,
+        cache=None,
+        lookahead_in_ms=None,
+        voice=None,
+        ):
+        import abjad
+        from abjad.tools import quantizationtools
+        if q_schema is None:
+            q_schema = quantizationtools.MeasurewiseQSchema()
+        assert isinstance(q_schema, quantizationtools.QSchema)
+        if grace_handler is None:
+            grace_handler = quantizationtools.ConcatenatingGraceHandler()
+        assert isinstance(grace_handler, quantizationtools.GraceHandler)
+        if heuristic is None:
+            heuristic = quantizationtools.DistanceHeuristic()
+        assert isinstance(heuristic, quantizationtools.Heuristic)
+        if job_handler is None:
+            job_handler = quantizationtools.SerialJobHandler()
+        assert isinstance(job_handler, quantizationtools.JobHandler)
+        if attack_point_optimizer is None:
+            attack_point_optimizer = \
+                quantizationtools.NaiveAttackPointOptimizer()
+        assert isinstance(
+            attack_point_optimizer, quantizationtools.AttackPointOptimizer)
+        if cache is not None:
+            assert isinstance(cache, quantizationtools.QuantizationJobCache)
+        lookahead_in_ms = abjad.Duration(lookahead_in_ms or 0)
+        assert 0 <= lookahead_in_ms, repr(lookahead_in_ms)
+        if voice is None:
+            voice = abjad.Voice()
+        assert isinstance(voice, abjad.Voice), repr(voice)
+        self._attach_tempos = bool(attach_tempos)
+        self._attack_point_optimizer = attack_point_optimizer
+        self._cache = cache
+        self._clock = abjad.Offset(0)
+        self._grace_handler = grace_handler
+        self._heuristic = heuristic
+        self._is_finished = False
+        self._item_count = 0
+        self._item_offset = abjad.Offset(0)
+        self._items = collections.deque()
+        self._job_handler = job_handler
+        self._last_q_event = None
+        self._lookahead_in_ms = lookahead_in_ms
+        self._previous_item = None
+        self._previous_leaf = None
+        self._q_schema = q_schema
+        self._voice = voice
+
+    ### PRIVATE METHODS ###
+
+    def _add_q_event(self, q_event):
+        beats = self.q_schema.target_class(list(self._items)).beats
+        offsets = [beat.offset_in_ms for beat in beats]
+        beat = beats[bisect.bisect(offsets, q_event.offset) - 1]
+        bisect.insort(beat.q_events, q_event)
+
+    def _append_items(self, offset, inclusive=False):
+        # makes beats or measures of q-schema until one contains offset
+        while (self._item_offset < offset or
+            (inclusive and self._item_offset == offset)):
+            item = self.q_schema._make_target_item(
+                self._item_count,
+                self._item_offset,
+                )
+            self._items.append(item)
+            self._item_count += 1
+            self._item_offset += item.duration_in_ms
+
+    def _get_format_specification(self):
+        import abjad
+        return abjad.FormatSpecification(
+            client=self,
+            repr_kwargs_names=['lookahead_in_ms'],
+            )
+
+    def _notate(self, items):
+        import abjad
+        if not items:
+            return []
+        q_target = self.q_schema.target_class(items)
+        voice = q_target._quantize(
+            attach_tempos=self.attach_tempos,
+            attack_point_optimizer=self.attack_point_optimizer,
+            cache=self.cache,
+            grace_handler=self.grace_handler,
+            heuristic=self.heuristic,
+            job_handler=self.job_handler,
+            previous_item=self._previous_item,
+            previous_leaf=self._previous_leaf,
+            )
+        continues = not q_target.beats[0].q_grid.leaves[0].q_event_proxies
+        components = list(voice[:])
+        leaves = abjad.select(components).leaves()
+        self.voice.extend(components)
+        previous_leaf = self._previous_leaf
+        if (continues and
+            previous_leaf is not None and
+            previous_leaf._get_leaf(1) is leaves[0]):
+            previous_tie = abjad.inspect(previous_leaf).get_spanner(abjad.Tie)
+            tie = abjad.inspect(leaves[0]).get_spanner(abjad.Tie)
+            if previous_tie is not None and tie is not None:
+                tie_leaves = list(tie.leaves)
+                tie._detach()
+                previous_tie._extend(tie_leaves)
+        self._previous_item = items[-1]
+        self._previous_leaf = leaves[-1]
+        return components
+
+    def _pop_finished_items(self):
+        items = []
+        while self._items:
+            item = self._items[0]
+            stop_offset = item.offset_in_ms + item.duration_in_ms
+            if self._clock < stop_offset + self.lookahead_in_ms:
+                break
+            items.append(self._items.popleft())
+        return items
+
+    ### PUBLIC METHODS ###
+
+    def advance(self, offset_in_ms):
+        r'''Advances stream to `offset_in_ms` without ``QEvent``.
+
+        Notates beats or measures stream leaves behind.
+
+        Returns list of components appended to voice.
+        '''
+        import abjad
+        assert not self.is_finished
+        offset_in_ms = abjad.Offset(offset_in_ms)
+        if offset_in_ms <= self._clock:
+            return []
+        self._clock = offset_in_ms
+        self._append_items(offset_in_ms)
+        return self._notate(self._pop_finished_items())
+
+    def finish(self, offset_in_ms=None):
+        r'''Ends stream at `offset_in_ms`.
+
+        Ends stream at latest offset of stream when `offset_in_ms` is
+        none. Notates remaining beats or measures.
+
+        Returns list of components appended to voice.
+        '''
+        import abjad
+        from abjad.tools import quantizationtools
+        assert not self.is_finished
+        if offset_in_ms is None:
+            offset_in_ms = self._clock
+        offset_in_ms = abjad.Offset(offset_in_ms)
+        if offset_in_ms < self._clock:
+            message = 'stream can not end at {} before offset {}.'
+            message = message.format(offset_in_ms, self._clock)
+            raise ValueError(message)
+        self._is_finished = True
+        if self._last_q_event is None:
+            return []
+        self._append_items(offset_in_ms)
+        while self._items and offset_in_ms <= self._items[-1].offset_in_ms:
+            self._items.pop()
+        # omit terminal q-event after silent q-event to prevent rest-tuplets
+        prototype = quantizationtools.SilentQEvent
+        if self._items and not isinstance(self._last_q_event, prototype):
+            terminal_q_event = quantizationtools.TerminalQEvent(offset_in_ms)
+            self._add_q_event(terminal_q_event)
+        items = list(self._items)
+        self._items.clear()
+        return self._notate(items)
+
+    def push(self, q_event):
+        r'''Adds `q_event` to stream.
+
+        Notates beats or measures stream leaves behind.
+
+        Returns list of components appended to voice.
+        '''
+        from abjad.tools import quantizationtools
+        assert not self.is_finished
+        prototype = (
+            quantizationtools.PitchedQEvent,
+            quantizationtools.SilentQEvent,
+            )
+        assert isinstance(q_event, prototype), repr(q_event)
+        offset = q_event.offset
+        minimum_offset = self._item_offset
+        if self._items:
+            minimum_offset = self._items[0].offset_in_ms
+        if offset < minimum_offset:
+            message = 'q-event offset {} precedes unnotated offset {}.'
+            message = message.format(offset, minimum_offset)
+            raise ValueError(message)
+        self._append_items(offset, inclusive=True)
+        self._add_q_event(q_event)
+        if (self._last_q_event is None or
+            self._last_q_event.offset <= offset):
+            self._last_q_event = q_event
+        self._clock = max(self._clock, offset)
+        return self._notate(self._pop_finished_items())
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def attach_tempos(self):
+        r'''Is true when quantizer attaches tempos to notation.
+
+        Returns true or false.
+        '''
+        return self._attach_tempos
+
+    @property
+    def attack_point_optimizer(self):
+        r'''Gets attack-point optimizer of quantizer.
+
+        Returns attack-point optimizer.
+        '''
+        return self._attack_point_optimizer
+
+    @property
+    def cache(self):
+        r'''Gets quantization job cache of quantizer.
+
+        Returns quantization job cache or none.
+        '''
+        return self._cache
+
+    @property
+    def grace_handler(self):
+        r'''Gets grace handler of quantizer.
+
+        Returns grace handler.
+        '''
+        return self._grace_handler
+
+    @property
+    def heuristic(self):
+        r'''Gets heuristic of quantizer.
+
+        Returns heuristic.
+        '''
+        return self._heuristic
+
+    @property
+    def is_finished(self):
+        r'''Is true when stream has ended. Otherwise false.
+
+        Returns true or false.
+        '''
+        return self._is_finished
+
+    @property
+    def job_handler(self):
+        r'''Gets job handler of quantizer.
+
+        Returns job handler.
+        '''
+        return self._job_handler
+
+    @property
+    def lookahead_in_ms(self):
+        r'''Gets time in milliseconds by which stream must pass end of beat
+        or measure before quantizer notates beat or measure.
+
+        Returns duration.
+        '''
+        return self._lookahead_in_ms
+
+    @property
+    def pending_duration_in_ms(self):
+        r'''Gets duration in milliseconds of beats and measures not yet
+        notated.
+
+        Returns duration.
+        '''
+        import abjad
+        return abjad.Duration(
+            sum(_.duration_in_ms for _ in self._items))
+
+    @property
+    def q_schema(self):
+        r'''Gets q-schema of quantizer.
+
+        Returns q-schema.
+        '''
+        return self._q_schema
+
+    @property
+    def voice(self):
+        r'''Gets voice to which quantizer appends notation.
+
+        Returns voice.
+        '''
+        return self._voice
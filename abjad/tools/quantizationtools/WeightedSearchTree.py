@@ -64,8 +64,20 @@ class WeightedSearchTree(SearchTree):
 
     ### INITIALIZER ###
 
-    def __init__(self, definition=None):
-        SearchTree.__init__(self, definition)
+    def __init__(
+        self,
+        definition=None,
+        bounded=None,
+        maximum_explored_count=None,
+        compact=None,
+        ):
+        SearchTree.__init__(
+            self,
+            definition=definition,
+            bounded=bounded,
+            maximum_explored_count=maximum_explored_count,
+            compact=compact,
+            )
         self._compositions = self._precompute_compositions()
         all_compositions = []
         for value in list(self._compositions.values()):
@@ -0,0 +1,49 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AttackPointOptimizer',
+    'BeatwiseQSchema',
+    'BeatwiseQSchemaItem',
+    'BeatwiseQTarget',
+    'CollapsingGraceHandler',
+    'CompactQGrid',
+    'ConcatenatingGraceHandler',
+    'DiscardingGraceHandler',
+    'DistanceHeuristic',
+    'GraceHandler',
+    'Heuristic',
+    'JobHandler',
+    'MeasurewiseAttackPointOptimizer',
+    'MeasurewiseQSchema',
+    'MeasurewiseQSchemaItem',
+    'MeasurewiseQTarget',
+    'NaiveAttackPointOptimizer',
+    'NullAttackPointOptimizer',
+    'ParallelJobHandler',
+    'ParallelJobHandlerWorker',
+    'PitchedQEvent',
+    'QEvent',
+    'QEventProxy',
+    'QEventSequence',
+    'QGrid',
+    'QGridContainer',
+    'QGridLeaf',
+    'QSchema',
+    'QSchemaItem',
+    'QTarget',
+    'QTargetBeat',
+    'QTargetMeasure',
+    'QuantizationJob',
+    'QuantizationJobCache',
+    'Quantizer',
+    'SearchTree',
+    'SerialJobHandler',
+    'SilentQEvent',
+    'StreamingQuantizer',
+    'TerminalQEvent',
+    'UnweightedSearchTree',
+    'WeightedSearchTree',
+    )
+
+packages = ()
@@ -0,0 +1,75 @@
+import pytest
+from abjad.tools import quantizationtools
+
+
+def test_quantizationtools_CompactQGrid_subdivide_leaves_01():
+    r'''Compact q-grid distance equals QGrid distance after each
+    subdivision.
+    '''
+
+    offsets = [0, 120, 260, 333, 510, 690, 875, 1000]
+    q_event_proxies = [
+        quantizationtools.QEventProxy(
+            quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+        for offset in offsets
+        ]
+    compact_q_grid = quantizationtools.CompactQGrid(q_event_proxies)
+    q_grid = quantizationtools.QGrid()
+    q_grid.fit_q_events(q_event_proxies)
+    assert compact_q_grid.distance == q_grid.distance
+
+    for pairs in (
+        [(0, (1, 1))],
+        [(0, (1, 1, 1)), (1, (1, 1))],
+        [(2, (2, 3)), (4, (1, 1))],
+        ):
+        compact_q_grid = compact_q_grid.subdivide_leaves(pairs)
+        q_grid = compact_q_grid.to_q_grid()
+        assert compact_q_grid.offsets == q_grid.offsets
+        assert compact_q_grid.distance == q_grid.distance
+
+
+def test_quantizationtools_CompactQGrid_subdivide_leaves_02():
+    r'''Subdivision leaves compact q-grid unchanged.
+    '''
+
+    q_event_proxies = [
+        quantizationtools.QEventProxy(
+            quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+        for offset in (0, 333, 500)
+        ]
+    compact_q_grid = quantizationtools.CompactQGrid(q_event_proxies)
+    new_compact_q_grid = compact_q_grid.subdivide_leaves([(0, (1, 1))])
+
+    assert compact_q_grid.leaf_numerators == (0, 1000)
+    assert compact_q_grid.denominator == 1000
+    assert new_compact_q_grid.leaf_numerators == (0, 500, 1000)
+    assert new_compact_q_grid.proxy_numerators is \
+        compact_q_grid.proxy_numerators
+
+
+def test_quantizationtools_CompactQGrid_subdivide_leaves_03(monkeypatch):
+    r'''Compact q-grid computes same distances with and without NumPy.
+    '''
+
+    pytest.importorskip('numpy')
+    import abjad.tools.quantizationtools.CompactQGrid as module
+    q_event_proxies = [
+        quantizationtools.QEventProxy(
+            quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+        for offset in (0, 120, 260, 333, 510, 690, 875)
+        ]
+    compact_q_grid = quantizationtools.CompactQGrid(q_event_proxies)
+    compact_q_grid = compact_q_grid.subdivide_leaves([(0, (1, 1, 1))])
+    assert compact_q_grid._uses_arrays()
+    distances = [
+        compact_q_grid._find_distance(),
+        compact_q_grid._find_distance([1]),
+        ]
+
+    monkeypatch.setattr(module, 'numpy', None)
+    assert not compact_q_grid._uses_arrays()
+    assert distances == [
+        compact_q_grid._find_distance(),
+        compact_q_grid._find_distance([1]),
+        ]
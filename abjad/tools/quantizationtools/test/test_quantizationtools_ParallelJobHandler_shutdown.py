@@ -0,0 +1,116 @@
+import abjad
+import gc
+import pickle
+import pytest
+from abjad.tools import quantizationtools
+
+
+class FailingJob(abjad.abctools.AbjadObject):
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self):
+        raise ValueError('failing job')
+
+
+class UnpicklableJob(abjad.abctools.AbjadObject):
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self.callback = lambda: None
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self):
+        self.callback()
+
+
+def make_jobs(job_count):
+    definition = {2: {2: None}, 3: None, 5: None}
+    search_tree = quantizationtools.UnweightedSearchTree(definition)
+    jobs = []
+    for job_id in range(job_count):
+        q_event_proxies = [
+            quantizationtools.QEventProxy(
+                quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+            for offset in (0, 250 + job_id, 600)
+            ]
+        job = quantizationtools.QuantizationJob(
+            job_id, search_tree, q_event_proxies)
+        jobs.append(job)
+    return jobs
+
+
+def test_quantizationtools_ParallelJobHandler_shutdown_01():
+    r'''Handler keeps workers across calls and returns jobs in order.
+    '''
+
+    job_handler = quantizationtools.ParallelJobHandler(
+        worker_count=2,
+        chunk_size=3,
+        )
+    with job_handler:
+        finished_jobs = job_handler(make_jobs(10))
+        workers = list(job_handler._workers)
+        assert len(workers) == 2
+        more_finished_jobs = job_handler(make_jobs(5))
+        assert job_handler._workers == workers
+
+    assert job_handler._workers == []
+    assert not any(_.is_alive() for _ in workers)
+    assert [_.job_id for _ in finished_jobs] == list(range(10))
+    assert [_.job_id for _ in more_finished_jobs] == list(range(5))
+
+    serial_jobs = quantizationtools.SerialJobHandler()(make_jobs(10))
+    for job, serial_job in zip(finished_jobs, serial_jobs):
+        assert [_.rtm_format for _ in job.q_grids] == \
+            [_.rtm_format for _ in serial_job.q_grids]
+        assert [_.distance for _ in job.q_grids] == \
+            [_.distance for _ in serial_job.q_grids]
+
+
+def test_quantizationtools_ParallelJobHandler_shutdown_02():
+    r'''Handler raises exception of failing job and stays usable.
+    '''
+
+    job_handler = quantizationtools.ParallelJobHandler(worker_count=2)
+    try:
+        with pytest.raises(ValueError):
+            job_handler([FailingJob()] + make_jobs(3))
+        finished_jobs = job_handler(make_jobs(3))
+        assert [_.job_id for _ in finished_jobs] == [0, 1, 2]
+    finally:
+        job_handler.shutdown()
+
+
+def test_quantizationtools_ParallelJobHandler_shutdown_03():
+    r'''Handler stops workers when garbage-collected without shutdown.
+    '''
+
+    job_handler = quantizationtools.ParallelJobHandler(worker_count=2)
+    finished_jobs = job_handler(make_jobs(3))
+    workers = list(job_handler._workers)
+    del job_handler
+    gc.collect()
+
+    assert [_.job_id for _ in finished_jobs] == [0, 1, 2]
+    assert not any(_.is_alive() for _ in workers)
+
+
+def test_quantizationtools_ParallelJobHandler_shutdown_04():
+    r'''Handler returns no jobs of earlier call that failed before all
+    chunks returned.
+    '''
+
+    jobs = make_jobs(2) + [UnpicklableJob()]
+    job_handler = quantizationtools.ParallelJobHandler(
+        worker_count=2,
+        chunk_size=1,
+        )
+    with job_handler:
+        with pytest.raises((AttributeError, pickle.PicklingError)):
+            job_handler(jobs)
+        finished_jobs = job_handler(make_jobs(5)[3:])
+
+    assert [_.job_id for _ in finished_jobs] == [3, 4]
@@ -0,0 +1,34 @@
+import abjad
+from abjad.tools import quantizationtools
+
+
+def test_quantizationtools_QTarget___call___01():
+    r'''Cache does not change notation and searches repeated beats once.
+    '''
+
+    milliseconds = [250, 250, 500, 333, 333, 334] * 4
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        milliseconds)
+    q_schema = quantizationtools.MeasurewiseQSchema()
+
+    q_target = q_schema(q_events.duration_in_ms)
+    result = q_target(q_events)
+    assert q_target.cache_hit_count == 0
+    assert q_target.cache_miss_count == 0
+    assert q_target.cache_hit_rate is None
+
+    cache = quantizationtools.QuantizationJobCache()
+    q_target = q_schema(q_events.duration_in_ms)
+    cached_result = q_target(q_events, cache=cache)
+    assert format(cached_result) == format(result)
+    assert q_target.cache_hit_count == 5
+    assert q_target.cache_miss_count == 3
+    assert q_target.cache_hit_rate == 5 / 8
+
+    q_target = q_schema(q_events.duration_in_ms)
+    cached_result = q_target(q_events, cache=cache)
+    assert format(cached_result) == format(result)
+    assert q_target.cache_hit_count == 8
+    assert q_target.cache_miss_count == 0
+    assert cache.hit_count == 13
+    assert cache.miss_count == 3
@@ -0,0 +1,156 @@
+import copy
+from abjad.tools import quantizationtools
+
+
+def make_q_event_proxies(offsets, start=0, pitch=0):
+    q_event_proxies = []
+    for i, offset in enumerate(offsets):
+        q_event = quantizationtools.PitchedQEvent(
+            start + offset, [pitch], index=i)
+        q_event_proxy = quantizationtools.QEventProxy(
+            q_event, start, start + 1000)
+        q_event_proxies.append(q_event_proxy)
+    return q_event_proxies
+
+
+def test_quantizationtools_QuantizationJobCache_fetch_01():
+    r'''Fetched QGrids equal searched QGrids.
+    '''
+
+    offsets = [0, 200, 250, 333, 400, 500, 600, 667, 750, 800]
+    definition = {2: {2: {2: None}, 3: None}, 5: None}
+    search_tree = quantizationtools.UnweightedSearchTree(definition)
+    cache = quantizationtools.QuantizationJobCache()
+    job = quantizationtools.QuantizationJob(
+        1, search_tree, make_q_event_proxies(offsets))
+    job()
+    cache.store(job)
+
+    q_event_proxies = make_q_event_proxies(offsets, start=3000, pitch=7)
+    searched_job = quantizationtools.QuantizationJob(
+        2, search_tree, q_event_proxies)
+    searched_job()
+    fetched_job = quantizationtools.QuantizationJob(
+        2, search_tree, q_event_proxies)
+
+    assert cache.fetch(fetched_job)
+    assert len(fetched_job.q_grids) == len(searched_job.q_grids)
+    pairs = zip(fetched_job.q_grids, searched_job.q_grids)
+    for fetched_q_grid, searched_q_grid in pairs:
+        assert fetched_q_grid.rtm_format == searched_q_grid.rtm_format
+        assert fetched_q_grid.distance == searched_q_grid.distance
+        for fetched_leaf, searched_leaf in zip(
+            fetched_q_grid.leaves,
+            searched_q_grid.leaves,
+            ):
+            fetched_proxies = fetched_leaf.q_event_proxies
+            searched_proxies = searched_leaf.q_event_proxies
+            assert sorted(fetched_proxies, key=id) == \
+                sorted(searched_proxies, key=id)
+
+
+def test_quantizationtools_QuantizationJobCache_fetch_02():
+    r'''Fetching copies stored QGrids.
+    '''
+
+    search_tree = quantizationtools.UnweightedSearchTree()
+    cache = quantizationtools.QuantizationJobCache()
+    job = quantizationtools.QuantizationJob(
+        1, search_tree, make_q_event_proxies([0, 500]))
+    job()
+    cache.store(job)
+
+    job_one = quantizationtools.QuantizationJob(
+        2, search_tree, make_q_event_proxies([0, 500], start=1000))
+    job_two = quantizationtools.QuantizationJob(
+        3, search_tree, make_q_event_proxies([0, 500], start=2000))
+    assert cache.fetch(job_one)
+    assert cache.fetch(job_two)
+
+    proxies_one = [
+        proxy
+        for q_grid in job_one.q_grids
+        for leaf in q_grid.leaves
+        for proxy in leaf.q_event_proxies
+        ]
+    assert set(proxies_one) == set(job_one.q_event_proxies)
+    assert not set(proxies_one) & set(job_two.q_event_proxies)
+
+
+def test_quantizationtools_QuantizationJobCache_fetch_03():
+    r'''Key depends on search tree and offsets only.
+    '''
+
+    search_tree = quantizationtools.UnweightedSearchTree()
+    other_search_tree = quantizationtools.UnweightedSearchTree({2: None})
+    cache = quantizationtools.QuantizationJobCache()
+    job = quantizationtools.QuantizationJob(
+        1, search_tree, make_q_event_proxies([0, 250, 250]))
+    job()
+    cache.store(job)
+
+    job = quantizationtools.QuantizationJob(
+        1, search_tree, make_q_event_proxies([0, 250], pitch=3))
+    assert cache.fetch(job)
+    job = quantizationtools.QuantizationJob(
+        1, search_tree, make_q_event_proxies([0, 300]))
+    assert not cache.fetch(job)
+    job = quantizationtools.QuantizationJob(
+        1, other_search_tree, make_q_event_proxies([0, 250]))
+    assert not cache.fetch(job)
+
+    assert cache.hit_count == 1
+    assert cache.miss_count == 2
+    assert cache.hit_rate == 1 / 3
+
+
+def test_quantizationtools_QuantizationJobCache_fetch_04():
+    r'''Cache evicts least recently used entries.
+    '''
+
+    search_tree = quantizationtools.UnweightedSearchTree({2: None})
+    cache = quantizationtools.QuantizationJobCache(maximum_size=2)
+    jobs = []
+    for offset in (100, 200, 300):
+        job = quantizationtools.QuantizationJob(
+            1, search_tree, make_q_event_proxies([0, offset]))
+        job()
+        jobs.append(job)
+
+    cache.store(jobs[0])
+    cache.store(jobs[1])
+    assert cache.fetch(copy.copy(jobs[0]))
+    cache.store(jobs[2])
+
+    assert len(cache) == 2
+    assert cache.fetch(copy.copy(jobs[0]))
+    assert not cache.fetch(copy.copy(jobs[1]))
+    assert cache.fetch(copy.copy(jobs[2]))
+
+
+def test_quantizationtools_QuantizationJobCache_fetch_05():
+    r'''Bounded search depends on count of QEventProxies at each offset:
+    key counts QEventProxies at each offset for bounded search trees.
+    '''
+
+    search_tree = quantizationtools.UnweightedSearchTree(bounded=True)
+    cache = quantizationtools.QuantizationJobCache()
+    job = quantizationtools.QuantizationJob(
+        1, search_tree, make_q_event_proxies([0, 50, 100]))
+    job()
+    cache.store(job)
+
+    q_event_proxies = make_q_event_proxies([0, 50, 100, 100])
+    searched_job = quantizationtools.QuantizationJob(
+        2, search_tree, q_event_proxies)
+    searched_job()
+    fetched_job = quantizationtools.QuantizationJob(
+        2, search_tree, q_event_proxies)
+
+    assert [_.rtm_format for _ in job.q_grids] != \
+        [_.rtm_format for _ in searched_job.q_grids]
+    assert not cache.fetch(fetched_job)
+    cache.store(searched_job)
+    assert cache.fetch(fetched_job)
+    assert [_.rtm_format for _ in fetched_job.q_grids] == \
+        [_.rtm_format for _ in searched_job.q_grids]
@@ -0,0 +1,40 @@
+import os
+from abjad.tools import quantizationtools
+
+
+def test_quantizationtools_QuantizationJobCache_save_01(tmpdir):
+    r'''Cache loads saved entries from path.
+    '''
+
+    path = os.path.join(str(tmpdir), 'cache', 'q_grids.pickle')
+    search_tree = quantizationtools.UnweightedSearchTree()
+    q_event = quantizationtools.PitchedQEvent(250, [0])
+    q_event_proxy = quantizationtools.QEventProxy(q_event, 0, 1000)
+    job = quantizationtools.QuantizationJob(1, search_tree, [q_event_proxy])
+    job()
+
+    cache = quantizationtools.QuantizationJobCache(path=path)
+    assert len(cache) == 0
+    cache.store(job)
+    cache.save()
+    assert os.path.isfile(path)
+
+    cache = quantizationtools.QuantizationJobCache(path=path)
+    assert len(cache) == 1
+    fetched_job = quantizationtools.QuantizationJob(
+        2, search_tree, [q_event_proxy])
+    assert cache.fetch(fetched_job)
+    assert [_.rtm_format for _ in fetched_job.q_grids] == \
+        [_.rtm_format for _ in job.q_grids]
+
+
+def test_quantizationtools_QuantizationJobCache_save_02(tmpdir):
+    r'''Cache ignores unreadable file.
+    '''
+
+    path = os.path.join(str(tmpdir), 'q_grids.pickle')
+    with open(path, 'w') as file_pointer:
+        file_pointer.write('not a pickle')
+
+    cache = quantizationtools.QuantizationJobCache(path=path)
+    assert len(cache) == 0
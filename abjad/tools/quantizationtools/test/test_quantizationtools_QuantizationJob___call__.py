@@ -60,3 +60,119 @@ def test_quantizationtools_QuantizationJob___call___01():
         '(1 ((1 ((1 (1 1)) (1 (1 1)))) (1 (1 1 1))))',
         '(1 ((1 ((1 (1 1)) (1 (1 1)))) (1 ((1 (1 1)) (1 (1 1))))))'
         ], rtm_formats
+
+
+def test_quantizationtools_QuantizationJob___call___02():
+    r'''Bounded search keeps QGrids with least distance only and selects
+    same QGrid as exhaustive search.
+    '''
+
+    offset_lists = [
+        [0, 120, 260, 333, 510, 690, 875],
+        [0, 90, 400, 410, 650, 800],
+        [0, 250, 500, 750],
+        [60, 180, 590, 930],
+        ]
+    search_trees = [
+        quantizationtools.UnweightedSearchTree(
+            {2: {2: {2: None}, 3: None}, 3: {2: None}, 5: None},
+            ),
+        quantizationtools.WeightedSearchTree({
+            'divisors': (2, 3, 5),
+            'max_depth': 2,
+            'max_divisions': 2,
+            }),
+        ]
+
+    def select(q_grids):
+        q_grids = sorted(q_grids, key=lambda x: (x.distance, len(x.leaves)))
+        return q_grids[0]
+
+    for offsets in offset_lists:
+        q_event_proxies = [
+            quantizationtools.QEventProxy(
+                quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+            for offset in offsets
+            ]
+        for search_tree in search_trees:
+            job = quantizationtools.QuantizationJob(
+                1, search_tree, q_event_proxies)
+            job()
+            bounded_search_tree = type(search_tree)(
+                definition=search_tree.definition,
+                bounded=True,
+                )
+            bounded_job = quantizationtools.QuantizationJob(
+                1, bounded_search_tree, q_event_proxies)
+            bounded_job()
+            assert job.pruned_count == 0
+            assert len(job.q_grids) == job.explored_count
+            assert bounded_job.explored_count <= job.explored_count
+            best_q_grid = select(job.q_grids)
+            assert all(
+                _.distance == best_q_grid.distance
+                for _ in bounded_job.q_grids
+                )
+            bounded_best_q_grid = select(bounded_job.q_grids)
+            assert bounded_best_q_grid.rtm_format == best_q_grid.rtm_format
+
+
+def test_quantizationtools_QuantizationJob___call___03():
+    r'''Search subdivides no more than maximum explored count of QGrids.
+    '''
+
+    offsets = [0, 120, 260, 333, 510, 690, 875]
+    q_event_proxies = [
+        quantizationtools.QEventProxy(
+            quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+        for offset in offsets
+        ]
+    search_tree = quantizationtools.UnweightedSearchTree(
+        {2: {2: {2: None}, 3: None}, 3: {2: None}, 5: None},
+        maximum_explored_count=5,
+        )
+    job = quantizationtools.QuantizationJob(1, search_tree, q_event_proxies)
+    job()
+
+    assert job.explored_count == 5
+    assert 0 < job.pruned_count
+    assert 5 < len(job.q_grids)
+
+
+def test_quantizationtools_QuantizationJob___call___04():
+    r'''Compact search keeps same QGrids as ordinary search.
+    '''
+
+    offset_lists = [
+        [0, 120, 260, 333, 510, 690, 875],
+        [0, 90, 400, 410, 650, 800],
+        [60, 180, 590, 930],
+        ]
+    definition = {2: {2: {2: None}, 3: None}, 3: {2: None}, 5: None}
+
+    for offsets in offset_lists:
+        q_event_proxies = [
+            quantizationtools.QEventProxy(
+                quantizationtools.PitchedQEvent(offset, [0]), 0, 1000)
+            for offset in offsets
+            ]
+        for bounded in (None, True):
+            search_tree = quantizationtools.UnweightedSearchTree(
+                definition,
+                bounded=bounded,
+                )
+            compact_search_tree = quantizationtools.UnweightedSearchTree(
+                definition,
+                bounded=bounded,
+                compact=True,
+                )
+            job = quantizationtools.QuantizationJob(
+                1, search_tree, q_event_proxies)
+            job()
+            compact_job = quantizationtools.QuantizationJob(
+                1, compact_search_tree, q_event_proxies)
+            compact_job()
+            assert [_.rtm_format for _ in compact_job.q_grids] == \
+                [_.rtm_format for _ in job.q_grids]
+            assert [_.distance for _ in compact_job.q_grids] == \
+                [_.distance for _ in job.q_grids]
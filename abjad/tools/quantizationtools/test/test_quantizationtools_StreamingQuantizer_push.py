@@ -0,0 +1,110 @@
+import abjad
+import pytest
+from abjad.tools import quantizationtools
+
+
+def make_q_events():
+    offsets_and_pitches = [
+        (0, 0), (333, None), (500, 2), (1250, 4), (1250, 7),
+        (2900, None), (3500, 5), (4090, 9), (6200, 11), (7500, None),
+        (8000, 12), (8250, 0),
+        ]
+    q_events = []
+    for offset, pitch in offsets_and_pitches:
+        if pitch is None:
+            q_event = quantizationtools.SilentQEvent(offset)
+        else:
+            q_event = quantizationtools.PitchedQEvent(offset, [pitch])
+        q_events.append(q_event)
+    q_events.append(quantizationtools.TerminalQEvent(9700))
+    return q_events
+
+
+def make_q_schemas():
+    search_tree = quantizationtools.UnweightedSearchTree(
+        {2: {2: None}, 3: None, 5: None},
+        )
+    return [
+        quantizationtools.MeasurewiseQSchema(
+            {'tempo': ((1, 4), 78), 'time_signature': (2, 4)},
+            {'tempo': ((1, 8), 57), 'time_signature': (5, 4)},
+            search_tree=search_tree,
+            ),
+        quantizationtools.BeatwiseQSchema(
+            {2: {'tempo': ((1, 4), 120)}, 5: {'beatspan': (1, 8)}},
+            search_tree=search_tree,
+            ),
+        ]
+
+
+def test_quantizationtools_StreamingQuantizer_push_01():
+    r'''Streaming quantizer notates QEvents like quantizer.
+
+    Uses null attack-point optimizer because attack-point optimizer acts on
+    each group of beats notated together.
+    '''
+
+    q_events = make_q_events()
+    attack_point_optimizer = quantizationtools.NullAttackPointOptimizer()
+    for q_schema in make_q_schemas():
+        result = quantizationtools.Quantizer()(
+            quantizationtools.QEventSequence(q_events),
+            q_schema=q_schema,
+            attack_point_optimizer=attack_point_optimizer,
+            )
+        for lookahead_in_ms in (None, 700):
+            quantizer = quantizationtools.StreamingQuantizer(
+                q_schema=q_schema,
+                attack_point_optimizer=attack_point_optimizer,
+                lookahead_in_ms=lookahead_in_ms,
+                )
+            components = []
+            for q_event in q_events[:-1]:
+                components.extend(quantizer.push(q_event))
+            components.extend(quantizer.finish(q_events[-1].offset))
+            assert quantizer.is_finished
+            assert components == quantizer.voice[:]
+            assert format(quantizer.voice) == format(result)
+
+
+def test_quantizationtools_StreamingQuantizer_push_02():
+    r'''Streaming quantizer keeps only beats within lookahead and accepts
+    QEvents out of order within lookahead.
+    '''
+
+    q_events = make_q_events()
+    q_events[6], q_events[7] = q_events[7], q_events[6]
+    q_schema = make_q_schemas()[1]
+    attack_point_optimizer = quantizationtools.NullAttackPointOptimizer()
+    quantizer = quantizationtools.StreamingQuantizer(
+        q_schema=q_schema,
+        attack_point_optimizer=attack_point_optimizer,
+        lookahead_in_ms=1000,
+        )
+    for q_event in q_events[:-1]:
+        quantizer.push(q_event)
+        assert quantizer.pending_duration_in_ms <= 2500
+    quantizer.finish(q_events[-1].offset)
+
+    result = quantizationtools.Quantizer()(
+        quantizationtools.QEventSequence(make_q_events()),
+        q_schema=q_schema,
+        attack_point_optimizer=attack_point_optimizer,
+        )
+    assert format(quantizer.voice) == format(result)
+
+
+def test_quantizationtools_StreamingQuantizer_push_03():
+    r'''Streaming quantizer raises value error on QEvent in notated beat.
+    '''
+
+    quantizer = quantizationtools.StreamingQuantizer(
+        q_schema=quantizationtools.BeatwiseQSchema(),
+        )
+    quantizer.push(quantizationtools.PitchedQEvent(0, [0]))
+    quantizer.push(quantizationtools.PitchedQEvent(2500, [2]))
+    assert abjad.inspect(quantizer.voice).get_duration() == \
+        abjad.Duration(2, 4)
+
+    with pytest.raises(ValueError):
+        quantizer.push(quantizationtools.PitchedQEvent(1500, [4]))
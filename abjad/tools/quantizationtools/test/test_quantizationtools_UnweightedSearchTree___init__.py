@@ -13,3 +13,26 @@ def test_quantizationtools_UnweightedSearchTree___init___02():
     definition = {2: None, 3: {2: None}}
     search_tree = quantizationtools.UnweightedSearchTree(definition)
     assert search_tree.definition == definition
+
+
+def test_quantizationtools_UnweightedSearchTree___init___03():
+
+    search_tree = quantizationtools.UnweightedSearchTree(
+        bounded=True,
+        maximum_explored_count=10,
+        )
+    assert search_tree.bounded is True
+    assert search_tree.maximum_explored_count == 10
+    assert search_tree != quantizationtools.UnweightedSearchTree()
+    assert search_tree == quantizationtools.UnweightedSearchTree(
+        bounded=True,
+        maximum_explored_count=10,
+        )
+
+
+def test_quantizationtools_UnweightedSearchTree___init___04():
+
+    search_tree = quantizationtools.UnweightedSearchTree(compact=True)
+    assert search_tree.compact is True
+    assert search_tree != quantizationtools.UnweightedSearchTree()
+    assert repr(search_tree).endswith('compact=True)')
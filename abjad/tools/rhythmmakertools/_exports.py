@@ -0,0 +1,28 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AccelerandoRhythmMaker',
+    'BeamSpecifier',
+    'BurnishSpecifier',
+    'DurationSpecifier',
+    'EvenDivisionRhythmMaker',
+    'EvenRunRhythmMaker',
+    'InciseSpecifier',
+    'IncisedRhythmMaker',
+    'InterpolationSpecifier',
+    'NoteRhythmMaker',
+    'PartitionTable',
+    'RhythmMaker',
+    'RotationCounter',
+    'SilenceMask',
+    'SkipRhythmMaker',
+    'SustainMask',
+    'Talea',
+    'TaleaRhythmMaker',
+    'TieSpecifier',
+    'TupletRhythmMaker',
+    'TupletSpecifier',
+    )
+
+packages = ()
@@ -169,7 +169,7 @@ class RhythmTreeContainer(RhythmTreeMixin, TreeContainer):
         from abjad.tools.rhythmtreetools.RhythmTreeParser \
             import RhythmTreeParser
         if isinstance(argument, str):
-            argument = RhythmTreeParser()(argument)
+            argument = RhythmTreeParser._call_pooled(argument)
             assert 1 == len(argument) and isinstance(argument[0], type(self))
             argument = argument[0]
         container = type(self)(
@@ -365,7 +365,7 @@ class RhythmTreeContainer(RhythmTreeMixin, TreeContainer):
 
         if isinstance(i, int):
             if isinstance(argument, str):
-                argument = RhythmTreeParser()(argument)[0]
+                argument = RhythmTreeParser._call_pooled(argument)[0]
                 assert len(argument) == 1
                 argument = argument[0]
             else:
@@ -377,10 +377,10 @@ class RhythmTreeContainer(RhythmTreeMixin, TreeContainer):
             self._children.insert(i, argument)
         else:
             if isinstance(argument, str):
-                argument = RhythmTreeParser()(argument)
+                argument = RhythmTreeParser._call_pooled(argument)
             elif isinstance(argument, list) and len(argument) == 1 and \
                 isinstance(argument[0], str):
-                argument = RhythmTreeParser()(argument[0])
+                argument = RhythmTreeParser._call_pooled(argument[0])
             else:
                 assert all(isinstance(x, self._node_class) for x in argument)
             if i.start == i.stop and i.start is not None \
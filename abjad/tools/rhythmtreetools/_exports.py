@@ -0,0 +1,12 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'RhythmTreeContainer',
+    'RhythmTreeLeaf',
+    'RhythmTreeMixin',
+    'RhythmTreeParser',
+    'parse_rtm_syntax',
+    )
+
+packages = ()
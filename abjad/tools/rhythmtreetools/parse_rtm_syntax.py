@@ -49,7 +49,7 @@ def parse_rtm_syntax(rtm):
     '''
     from abjad.tools import rhythmtreetools
 
-    result = rhythmtreetools.RhythmTreeParser()(rtm)
+    result = rhythmtreetools.RhythmTreeParser._call_pooled(rtm)
 
     con = scoretools.Container()
 
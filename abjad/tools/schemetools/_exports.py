@@ -0,0 +1,16 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Scheme',
+    'SchemeAssociativeList',
+    'SchemeColor',
+    'SchemeMoment',
+    'SchemePair',
+    'SchemeSymbol',
+    'SchemeVector',
+    'SchemeVectorConstant',
+    'SpacingVector',
+    )
+
+packages = ()
@@ -35,14 +35,11 @@ class Chord(Leaf):
     def __init__(self, *arguments):
         import abjad
         from abjad.ly import drums
-        from abjad.tools.topleveltools import parse
         assert len(arguments) in (0, 1, 2)
         self._note_heads = abjad.NoteHeadList(client=self)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = [parsed[0]]
+            parser = abjad.lilypondparsertools.SimpleLeafParser()
+            arguments = [parser(arguments[0])]
         are_cautionary = []
         are_forced = []
         are_parenthesized = []
@@ -390,6 +387,7 @@ class Chord(Leaf):
         if isinstance(note_heads, str):
             note_heads = note_heads.split()
         self.note_heads.extend(note_heads)
+        self._bump_format_version()
 
     @property
     def written_duration(self):
@@ -12,6 +12,10 @@ class Component(AbjadObject):
 
     __slots__ = (
         '_dependent_wrappers',
+        '_effective_indicator_index',
+        '_format_bundle',
+        '_format_bundle_key',
+        '_format_version',
         '_indicator_wrappers',
         '_indicators_are_current',
         '_is_forbidden_to_update',
@@ -28,6 +32,7 @@ class Component(AbjadObject):
         '_stop_offset',
         '_stop_offset_in_seconds',
         '_timespan',
+        '_update_state',
         )
 
     _is_counttime_component = False
@@ -38,6 +43,10 @@ class Component(AbjadObject):
     def __init__(self, name=None):
         import abjad
         self._dependent_wrappers = []
+        self._effective_indicator_index = None
+        self._format_bundle = None
+        self._format_bundle_key = None
+        self._format_version = 0
         self._indicator_wrappers = []
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
@@ -53,6 +62,7 @@ class Component(AbjadObject):
         self._stop_offset = None
         self._stop_offset_in_seconds = None
         self._timespan = abjad.Timespan()
+        self._update_state = None
         self._name = None
         if name is not None:
             self.name = name  # name must be setup *after* parent
@@ -133,6 +143,31 @@ class Component(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    def _add_to_effective_indicator_index(self, wrapper, dependent=False):
+        r'''Inserts `wrapper` into cached effective indicator index.
+
+        Set `dependent` to true when `wrapper` is effective in component
+        rather than attached to component.
+        '''
+        index = self._effective_indicator_index
+        if not index or wrapper.is_annotation:
+            return
+        offset = wrapper._get_start_offset_without_update()
+        for prototype, (offsets, wrappers) in list(index.items()):
+            if not isinstance(wrapper.indicator, prototype):
+                continue
+            if offset is None:
+                del(index[prototype])
+                continue
+            i = bisect.bisect_left(offsets, offset)
+            if i < len(offsets) and offsets[i] == offset:
+                # dependent wrapper may displace first wrapper at offset
+                if dependent:
+                    del(index[prototype])
+                continue
+            offsets.insert(i, offset)
+            wrappers.insert(i, wrapper)
+
     def _as_graphviz_node(self):
         import abjad
         score_index = abjad.inspect(self).get_parentage().score_index
@@ -158,6 +193,28 @@ class Component(AbjadObject):
         node.append(table)
         return node
 
+    def _bump_format_version(self):
+        r'''Invalidates cached format bundle of component and of leaves
+        sharing spanners with component.
+        '''
+        self._format_version += 1
+        for spanner in self._spanners:
+            spanner._format_version += 1
+
+    def _bump_score_format_version(self):
+        r'''Invalidates cached format bundles of every component in score of
+        component.
+        '''
+        component = self
+        while True:
+            parent = component._parent
+            if parent is None:
+                parent = getattr(component, '_carrier', None)
+            if parent is None:
+                break
+            component = parent
+        component._format_version += 1
+
     def _cache_named_children(self):
         name_dictionary = {}
         if hasattr(self, '_named_children'):
@@ -324,44 +381,78 @@ class Component(AbjadObject):
                     return indicator
                 else:
                     return
-        # gather candidate wrappers
-        self._update_now(indicators=True)
-        candidate_wrappers = {}
+        # indices are valid only while offsets are current
+        self._update_now(offsets=True, indicators=True)
+        indices = []
         for parent in abjad.inspect(self).get_parentage(
             include_self=True,
             grace_notes=True,
             ):
-            #print('PARENT', parent)
-            #print('DEP', parent._dependent_wrappers)
-            #print('DIR', parent._indicator_wrappers)
-            #print()
-            for wrapper in parent._dependent_wrappers:
-                if wrapper.is_annotation:
-                    continue
-                if isinstance(wrapper.indicator, prototype):
-                    offset = wrapper.start_offset
-                    candidate_wrappers.setdefault(offset, []).append(wrapper)
-            for wrapper in parent._indicator_wrappers:
-                if wrapper.is_annotation:
-                    continue
-                if isinstance(wrapper.indicator, prototype):
-                    offset = wrapper.start_offset
-                    candidate_wrappers.setdefault(offset, []).append(wrapper)
-        if not candidate_wrappers:
+            offsets, wrappers = parent._get_effective_indicator_index(
+                prototype)
+            if offsets:
+                indices.append((offsets, wrappers))
+        if not indices:
             return
         # elect most recent candidate wrapper
-        all_offsets = sorted(candidate_wrappers)
         start_offset = abjad.inspect(self).get_timespan().start_offset
-        index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
-        if index < 0:
-            return
-        elif len(candidate_wrappers) <= index:
+        n = int(n)
+        wrapper = None
+        if n == 0:
+            # nearest parent wins ties
+            wrapper_offset = None
+            for offsets, wrappers in indices:
+                index = bisect.bisect(offsets, start_offset) - 1
+                if index < 0:
+                    continue
+                if wrapper_offset is None or wrapper_offset < offsets[index]:
+                    wrapper_offset = offsets[index]
+                    wrapper = wrappers[index]
+        else:
+            candidate_wrappers = {}
+            for offsets, wrappers in indices:
+                for offset, wrapper_ in zip(offsets, wrappers):
+                    candidate_wrappers.setdefault(offset, wrapper_)
+            all_offsets = sorted(candidate_wrappers)
+            index = bisect.bisect(all_offsets, start_offset) - 1 + n
+            if 0 <= index < len(all_offsets):
+                wrapper = candidate_wrappers[all_offsets[index]]
+        if wrapper is None:
             return
-        wrapper = candidate_wrappers[all_offsets[index]][0]
         if unwrap:
             return wrapper.indicator
         return wrapper
 
+    def _get_effective_indicator_index(self, prototype):
+        r'''Gets sorted start offsets and wrappers of nonannotation
+        indicators of `prototype` attached to component or effective in
+        component.
+
+        Keeps first wrapper at each offset. Index is cached per prototype
+        until wrappers attach, detach or change offset.
+
+        Returns pair of lists.
+        '''
+        index = self._effective_indicator_index
+        if index is None:
+            index = self._effective_indicator_index = {}
+        try:
+            return index[prototype]
+        except KeyError:
+            pass
+        wrappers_by_offset = {}
+        for wrappers in (self._dependent_wrappers, self._indicator_wrappers):
+            for wrapper in wrappers:
+                if wrapper.is_annotation:
+                    continue
+                if isinstance(wrapper.indicator, prototype):
+                    offset = wrapper.start_offset
+                    wrappers_by_offset.setdefault(offset, wrapper)
+        offsets = sorted(wrappers_by_offset)
+        wrappers = [wrappers_by_offset[_] for _ in offsets]
+        index[prototype] = (offsets, wrappers)
+        return offsets, wrappers
+
     def _get_effective_staff(self):
         import abjad
         staff_change = self._get_effective(abjad.StaffChange)
@@ -526,19 +617,17 @@ class Component(AbjadObject):
         import abjad
         assert abjad.mathtools.is_integer_equivalent(n)
         def next(component):
-            if component is not None:
-                for parent in abjad.inspect(component).get_parentage(
-                    include_self=True):
-                    next_sibling = parent._get_sibling(1)
-                    if next_sibling is not None:
-                        return next_sibling
+            while component is not None:
+                next_sibling = component._get_sibling(1)
+                if next_sibling is not None:
+                    return next_sibling
+                component = component._parent
         def previous(component):
-            if component is not None:
-                for parent in abjad.inspect(component).get_parentage(
-                    include_self=True):
-                    next_sibling = parent._get_sibling(-1)
-                    if next_sibling is not None:
-                        return next_sibling
+            while component is not None:
+                next_sibling = component._get_sibling(-1)
+                if next_sibling is not None:
+                    return next_sibling
+                component = component._parent
         result = self
         if 0 < n:
             for i in range(n):
@@ -589,18 +678,12 @@ class Component(AbjadObject):
     def _get_sibling(self, n):
         if n == 0:
             return self
-        elif 0 < n:
-            if self._parent is not None:
-                if not self._parent.is_simultaneous:
-                    index = self._parent.index(self)
-                    if index + n < len(self._parent):
-                        return self._parent[index + n]
-        elif n < 0:
-            if self._parent is not None:
-                if not self._parent.is_simultaneous:
-                    index = self._parent.index(self)
-                    if 0 <= index + n:
-                        return self._parent[index + n]
+        parent = self._parent
+        if parent is None or parent.is_simultaneous:
+            return
+        index = parent.index(self) + n
+        if 0 <= index < len(parent._components):
+            return parent._components[index]
 
     def _get_spanner(self, prototype=None):
         spanners = self._get_spanners(prototype=prototype)
@@ -755,6 +838,24 @@ class Component(AbjadObject):
             else:
                 break
 
+    def _remove_from_effective_indicator_index(self, wrapper):
+        r'''Removes `wrapper` from cached effective indicator index.
+        '''
+        index = self._effective_indicator_index
+        if not index or wrapper.is_annotation:
+            return
+        offset = wrapper._get_start_offset_without_update()
+        for prototype, (offsets, wrappers) in list(index.items()):
+            if not isinstance(wrapper.indicator, prototype):
+                continue
+            if offset is None:
+                del(index[prototype])
+                continue
+            i = bisect.bisect_left(offsets, offset)
+            if i < len(offsets) and wrappers[i] is wrapper:
+                # other wrappers may start at same offset
+                del(index[prototype])
+
     def _remove_from_parent(self):
         import abjad
         self._update_later(offsets=True)
@@ -762,8 +863,10 @@ class Component(AbjadObject):
             for wrapper in parent._dependent_wrappers[:]:
                 if wrapper.component is self:
                     parent._dependent_wrappers.remove(wrapper)
+                    parent._remove_from_effective_indicator_index(wrapper)
         if self._parent is not None:
             self._parent._components.remove(self)
+            self._parent._component_indices = None
         self._parent = None
 
     def _remove_named_children_from_parentage(self, name_dictionary):
@@ -872,13 +975,20 @@ class Component(AbjadObject):
             return components + [self]
 
     def _update_later(self, offsets=False, offsets_in_seconds=False):
-        import abjad
         assert offsets or offsets_in_seconds
-        for component in abjad.inspect(self).get_parentage(include_self=True):
+        component = self
+        while component is not None:
+            # structural change invalidates format bundles everywhere in score
+            component._format_version += 1
             if offsets:
                 component._offsets_are_current = False
             elif offsets_in_seconds:
                 component._offsets_in_seconds_are_current = False
+            # follow grace containers to carrier so that score root is marked
+            parent = component._parent
+            if parent is None:
+                parent = getattr(component, '_carrier', None)
+            component = parent
 
     def _update_measure_numbers(self):
         import abjad
@@ -900,6 +1010,27 @@ class Component(AbjadObject):
             indicators=indicators,
             )
 
+    def _write_format_pieces(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        for piece in self._get_format_pieces(strict=strict):
+            write(indent + piece)
+
+    def _write_lilypond_format(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        string = self._get_lilypond_format(strict=strict)
+        for line in string.split('\n'):
+            write(indent + line)
+
     ### PUBLIC PROPERTIES ###
 
     @property
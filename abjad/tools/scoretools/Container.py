@@ -157,6 +157,7 @@ class Container(Component):
     __documentation_section__ = 'Containers'
 
     __slots__ = (
+        '_component_indices',
         '_components',
         '_formatter',
         '_named_children',
@@ -171,6 +172,7 @@ class Container(Component):
     def __init__(self, components=None, is_simultaneous=None, name=None):
         components = components or []
         Component.__init__(self, name=name)
+        self._component_indices = None
         self._named_children = {}
         self._is_simultaneous = None
         self._initialize_components(components)
@@ -187,11 +189,7 @@ class Container(Component):
         if isinstance(argument, str):
             return argument in self._named_children
         else:
-            for component in self.components:
-                if component is argument:
-                    return True
-            else:
-                return False
+            return self._get_component_index(argument) is not None
 
     def __delitem__(self, i):
         r'''Deletes components(s) at index `i` in container.
@@ -273,6 +271,7 @@ class Container(Component):
         if not self.is_simultaneous:
             components._withdraw_from_crossing_spanners()
         components._set_parents(None)
+        self._component_indices = None
 
     def __getitem__(self, argument):
         r'''Gets item or slice identified by `argument`.
@@ -497,6 +496,7 @@ class Container(Component):
         for component in contents:
             component._set_parent(None)
         self._components[:] = []
+        self._component_indices = None
         return contents
 
     def _format_after_slot(self, bundle):
@@ -528,19 +528,8 @@ class Container(Component):
         return self._format_slot_contributions_with_indent(result)
 
     def _format_content_pieces(self, strict=False):
-        import abjad
-        indent = abjad.LilyPondFormatManager.indent
         result = []
-        format_specification = 'lilypond'
-        if strict:
-            format_specification += ':strict'
-        for component in self.components:
-            string = component.__format__(
-                format_specification=format_specification
-                )
-            parts = string.split('\n')
-            result.extend(parts)
-        result = [indent + _ for _ in result]
+        self._write_content_pieces(result.append, strict=strict)
         return result
 
     def _format_contents_slot(self, bundle, strict=False):
@@ -616,6 +605,28 @@ class Container(Component):
             return '{ }'
         return '{{ {} }}'.format(self._get_contents_summary())
 
+    def _get_component_index(self, component):
+        r'''Gets index of `component` from cached child indices.
+
+        Verifies cached index against components and rebuilds cache once
+        when cache is stale.
+
+        Returns nonnegative integer or none.
+        '''
+        components = self._components
+        indices = self._component_indices
+        if indices is not None:
+            index = indices.get(id(component))
+            if (index is not None and
+                index < len(components) and
+                components[index] is component):
+                return index
+        indices = {id(_): i for i, _ in enumerate(components)}
+        self._component_indices = indices
+        index = indices.get(id(component))
+        if index is not None and components[index] is component:
+            return index
+
     def _get_contents_duration(self):
         import abjad
         if self.is_simultaneous:
@@ -778,6 +789,7 @@ class Container(Component):
             components = components_
         if self._all_are_orphan_components(components):
             self._components = list(components)
+            self._component_indices = None
             self[:]._set_parents(self)
         elif isinstance(components, str):
             parsed = self._parse_string(components)
@@ -845,9 +857,14 @@ class Container(Component):
         import abjad
         user_input = string.strip()
         if user_input.startswith('abj:'):
-            parser = abjad.lilypondparsertools.ReducedLyParser()
-            parsed = parser(user_input[4:])
-            if parser._toplevel_component_count == 1:
+            class_ = abjad.lilypondparsertools.ReducedLyParser
+            parser = class_._check_out()
+            try:
+                parsed = parser(user_input[4:])
+                count = parser._toplevel_component_count
+            finally:
+                parser._check_in()
+            if count == 1:
                 parent = abjad.inspect(parsed).get_parentage().parent
                 if parent is None:
                     parsed = Container([parsed])
@@ -941,9 +958,17 @@ class Container(Component):
             selection = abjad.select(argument)
             if selection.are_contiguous_logical_voice():
                 selection._withdraw_from_crossing_spanners()
+        appending = start == len(self._components)
         self._components.__setitem__(slice(start, start), argument)
         for component in argument:
             component._set_parent(self)
+        indices = self._component_indices
+        if indices is not None and appending:
+            # appending leaves indices of existing components intact
+            for i, component in enumerate(argument, start):
+                indices[id(component)] = i
+        else:
+            self._component_indices = None
         for spanner, index in spanners_receipt:
             for component in reversed(argument):
                 # attach spanners only to leaves
@@ -1009,6 +1034,7 @@ class Container(Component):
         parent, start, stop = selection._get_parent_and_start_stop_indices()
         if parent is not None:
             parent._components.__setitem__(slice(start, stop + 1), nonempty_halves)
+            parent._component_indices = None
             for part in nonempty_halves:
                 part._set_parent(parent)
         else:
@@ -1231,6 +1257,128 @@ class Container(Component):
         # return list-wrapped halves of container
         return [left_container], [right_container]
 
+    def _write_content_pieces(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        strings=None,
+        ):
+        r'''Writes contents of container.
+
+        Formats staves of simultaneous container in `workers` processes
+        when `workers` is greater than 1; `strings` then maps ids of staves
+        to formatted staves while nested simultaneous containers write.
+        '''
+        import abjad
+        indent += abjad.LilyPondFormatManager.indent
+        if (strings is None and
+            workers is not None and
+            1 < workers and
+            self.is_simultaneous):
+            strings = abjad.LilyPondFormatManager._format_in_parallel(
+                self,
+                workers,
+                strict=strict,
+                )
+        for component in self.components:
+            if strings is None:
+                component._write_lilypond_format(
+                    write,
+                    indent=indent,
+                    strict=strict,
+                    workers=workers,
+                    )
+            elif id(component) in strings:
+                for line in strings[id(component)].split('\n'):
+                    write(indent + line)
+            else:
+                # nested simultaneous container wraps formatted staves
+                component._write_format_component(
+                    write,
+                    indent,
+                    strict,
+                    True,
+                    strings=strings,
+                    )
+
+    def _write_format_component(
+        self,
+        write,
+        indent,
+        strict,
+        split,
+        workers=None,
+        strings=None,
+        ):
+        import abjad
+        bundle = abjad.LilyPondFormatManager.bundle_format_contributions(self)
+        slots = (
+            self._format_absolute_before_slot(bundle),
+            self._format_before_slot(bundle),
+            self._format_open_brackets_slot(bundle),
+            self._format_opening_slot(bundle),
+            )
+        self._write_slots(slots, write, indent, split)
+        self._write_content_pieces(
+            write,
+            indent=indent,
+            strict=strict,
+            workers=workers,
+            strings=strings,
+            )
+        slots = (
+            self._format_closing_slot(bundle),
+            self._format_close_brackets_slot(bundle),
+            self._format_after_slot(bundle),
+            self._format_absolute_after_slot(bundle),
+            )
+        self._write_slots(slots, write, indent, split)
+
+    def _write_format_pieces(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        self._write_format_component(
+            write,
+            indent,
+            strict,
+            False,
+            workers=workers,
+            )
+
+    def _write_lilypond_format(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        self._update_now(indicators=True)
+        self._write_format_component(
+            write,
+            indent,
+            strict,
+            True,
+            workers=workers,
+            )
+
+    @staticmethod
+    def _write_slots(slots, write, indent, split):
+        for slot in slots:
+            for contributor, contribution in slot:
+                for line in contribution:
+                    # nested contributions split like formatted strings
+                    if split and '\n' in line:
+                        for line_ in line.split('\n'):
+                            write(indent + line_)
+                    else:
+                        write(indent + line)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1513,13 +1661,12 @@ class Container(Component):
 
         Returns nonnegative integer.
         '''
-        for i, element in enumerate(self.components):
-            if element is component:
-                return i
-        else:
+        index = self._get_component_index(component)
+        if index is None:
             message = 'component {!r} not in Abjad container {!r}.'
             message = message.format(component, self)
             raise ValueError(message)
+        return index
 
     def insert(self, i, component, fracture_spanners=False):
         r'''Inserts `component` at index `i` in container.
@@ -1642,6 +1789,7 @@ class Container(Component):
         assert isinstance(component, abjad.Component)
         component._set_parent(self)
         self._components.insert(i, component)
+        self._component_indices = None
         previous_leaf = component._get_leaf(-1)
         if previous_leaf:
             for spanner in abjad.inspect(previous_leaf).get_spanners():
@@ -1772,6 +1920,7 @@ class Container(Component):
         '''
         import abjad
         self._components.reverse()
+        self._component_indices = None
         self._update_later(offsets=True)
         descendants = abjad.inspect(self).get_descendants()
         spanners = abjad.inspect(descendants).get_spanners()
@@ -213,6 +213,7 @@ class Context(Container):
         else:
             argument = str(argument)
         self._context_name = argument
+        self._bump_format_version()
 
     @property
     def lilypond_context(self):
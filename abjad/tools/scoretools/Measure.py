@@ -49,7 +49,7 @@ class Measure(Container):
         self._automatically_adjust_time_signature = False
         time_signature = time_signature or abjad.TimeSignature((4, 4))
         time_signature = abjad.TimeSignature(time_signature)
-        self.implicit_scaling = bool(implicit_scaling)
+        self._implicit_scaling = bool(implicit_scaling)
         Container.__init__(self, components)
         self._always_format_time_signature = False
         self._measure_number = None
@@ -296,26 +296,8 @@ class Measure(Container):
             return abjad.TimeSignature(duration)
 
     def _format_content_pieces(self, strict=False):
-        import abjad
         result = []
-        if (self.has_non_power_of_two_denominator and
-            type(self) is Measure and
-            self.implicit_scaling):
-            indent = abjad.LilyPondFormatManager.indent
-            string = "{}\\scaleDurations #'({} . {}) {{"
-            string = string.format(
-                indent,
-                self.implied_prolation.numerator,
-                self.implied_prolation.denominator,
-                )
-            result.append(string)
-            pieces = Container._format_content_pieces(self, strict=strict)
-            pieces = [indent + _ for _ in pieces]
-            result.extend(pieces)
-            result.append(indent + '}')
-        else:
-            result.extend(
-                Container._format_content_pieces(self, strict=strict))
+        self._write_content_pieces(result.append, strict=strict)
         return result
 
     def _format_opening_slot(self, bundle):
@@ -413,6 +395,59 @@ class Measure(Container):
         if new_time_signature.has_non_power_of_two_denominator:
             self.implicit_scaling = True
 
+    def _write_content_pieces(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        strings=None,
+        ):
+        import abjad
+        if (self.has_non_power_of_two_denominator and
+            type(self) is Measure and
+            self.implicit_scaling):
+            indent += abjad.LilyPondFormatManager.indent
+            string = "{}\\scaleDurations #'({} . {}) {{"
+            string = string.format(
+                indent,
+                self.implied_prolation.numerator,
+                self.implied_prolation.denominator,
+                )
+            write(string)
+            Container._write_content_pieces(
+                self,
+                write,
+                indent=indent,
+                strict=strict,
+                workers=workers,
+                )
+            write(indent + '}')
+        else:
+            Container._write_content_pieces(
+                self,
+                write,
+                indent=indent,
+                strict=strict,
+                workers=workers,
+                )
+
+    def _write_lilypond_format(
+        self,
+        write,
+        indent='',
+        strict=False,
+        workers=None,
+        ):
+        self._check_duration()
+        self._write_format_component(
+            write,
+            indent,
+            strict,
+            True,
+            workers=workers,
+            )
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -438,6 +473,7 @@ class Measure(Container):
     def always_format_time_signature(self, argument):
         assert isinstance(argument, bool)
         self._always_format_time_signature = argument
+        self._bump_format_version()
 
     @property
     def automatically_adjust_time_signature(self):
@@ -533,6 +569,7 @@ class Measure(Container):
     def implicit_scaling(self, argument):
         assert isinstance(argument, bool)
         self._implicit_scaling = argument
+        self._update_later(offsets=True)
 
     @property
     def implied_prolation(self):
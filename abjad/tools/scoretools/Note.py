@@ -38,10 +38,8 @@ class Note(Leaf):
         from abjad.ly import drums
         assert len(arguments) in (0, 1, 2)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = [parsed[0]]
+            parser = abjad.lilypondparsertools.SimpleLeafParser()
+            arguments = [parser(arguments[0])]
         is_cautionary = False
         is_forced = False
         is_parenthesized = False
@@ -200,6 +198,7 @@ class Note(Leaf):
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._bump_format_version()
 
     @property
     def written_duration(self):
@@ -359,3 +359,5 @@ class NoteHead(AbjadObject):
         from abjad.tools import pitchtools
         written_pitch = pitchtools.NamedPitch(argument)
         self._written_pitch = written_pitch
+        if self._client is not None:
+            self._client._bump_format_version()
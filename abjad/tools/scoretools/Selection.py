@@ -1226,6 +1226,7 @@ class Selection(AbjadValueObject):
             spanner_components = crossing_spanner.leaves[:]
             for component in components_including_children:
                 if component in spanner_components:
+                    component._bump_format_version()
                     crossing_spanner._leaves.remove(component)
                     component._spanners.discard(crossing_spanner)
 
@@ -30,10 +30,8 @@ class Skip(Leaf):
         input_leaf = None
         written_duration = None
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            input_leaf = parsed[0]
+            parser = abjad.lilypondparsertools.SimpleLeafParser()
+            input_leaf = parser(arguments[0])
             written_duration = input_leaf.written_duration
         elif len(arguments) == 1 and isinstance(arguments[0], Leaf):
             written_duration = arguments[0].written_duration
@@ -917,6 +917,7 @@ class Tuplet(Container):
             raise ValueError(message)
         if 0 < rational:
             self._multiplier = rational
+            self._update_later(offsets=True)
         else:
             message = 'tuplet multiplier must be positive: {!r}.'
             message = message.format(argument)
@@ -0,0 +1,44 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AcciaccaturaContainer',
+    'AfterGraceContainer',
+    'AppoggiaturaContainer',
+    'Chord',
+    'Cluster',
+    'Component',
+    'Container',
+    'Context',
+    'Descendants',
+    'DrumNoteHead',
+    'GraceContainer',
+    'Inspection',
+    'Iteration',
+    'Label',
+    'Leaf',
+    'LeafMaker',
+    'Lineage',
+    'LogicalTie',
+    'Measure',
+    'MeasureMaker',
+    'MultimeasureRest',
+    'Mutation',
+    'Note',
+    'NoteHead',
+    'NoteHeadList',
+    'NoteMaker',
+    'Parentage',
+    'Rest',
+    'Run',
+    'Score',
+    'Selection',
+    'Skip',
+    'Staff',
+    'StaffGroup',
+    'Tuplet',
+    'VerticalMoment',
+    'Voice',
+    )
+
+packages = ()
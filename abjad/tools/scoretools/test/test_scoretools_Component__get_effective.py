@@ -0,0 +1,91 @@
+import abjad
+import platform
+import pytest
+
+
+def test_scoretools_Component__get_effective_01():
+    r'''Effective indicator index updates after attach and detach.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    assert abjad.inspect(staff[1]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+
+    abjad.detach(abjad.Clef, staff[2])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+
+    abjad.detach(abjad.Clef, staff[0])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) is None
+
+
+def test_scoretools_Component__get_effective_02():
+    r'''Effective indicator index updates after offsets change.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Dynamic('p'), staff[0])
+    abjad.attach(abjad.Dynamic('f'), staff[2])
+    assert abjad.inspect(staff[1]).get_effective(abjad.Dynamic) == \
+        abjad.Dynamic('p')
+
+    staff[0].written_duration = abjad.Duration(1, 2)
+    staff.insert(2, abjad.Note("g'8"))
+    assert abjad.inspect(staff[2]).get_effective(abjad.Dynamic) == \
+        abjad.Dynamic('p')
+    assert abjad.inspect(staff[4]).get_effective(abjad.Dynamic) == \
+        abjad.Dynamic('f')
+
+    staff[1:3] = []
+    assert abjad.inspect(staff[1]).get_effective(abjad.Dynamic) == \
+        abjad.Dynamic('f')
+
+
+def test_scoretools_Component__get_effective_03():
+    r'''Gets previous and next effective indicators across parentage.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    abjad.attach(abjad.Clef('treble'), staff[3])
+
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef, n=-1) == \
+        abjad.Clef('alto')
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef, n=1) == \
+        abjad.Clef('treble')
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef, n=2) is None
+    assert abjad.inspect(staff[0]).get_effective(abjad.Clef, n=-1) is None
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_scoretools_Component__get_effective_04():
+    r'''Cost of getting effective indicator grows only logarithmically with
+    number of indicators in context.
+    '''
+
+    counts = []
+    for note_count in (10, 1000):
+        staff = abjad.Staff(note_count * abjad.Note("c'8"))
+        for note in staff:
+            abjad.attach(abjad.Dynamic('p'), note)
+        leaf = staff[note_count // 2]
+        abjad.inspect(leaf).get_effective(abjad.Dynamic)
+        count = abjad.IOManager.count_function_calls(
+            'abjad.inspect(leaf).get_effective(abjad.Dynamic)',
+            globals(),
+            locals(),
+            )
+        counts.append(count)
+
+    assert counts[1] < 1.5 * counts[0]
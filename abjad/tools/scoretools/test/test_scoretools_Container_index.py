@@ -1,4 +1,6 @@
 import abjad
+import platform
+import pytest
 
 
 def test_scoretools_Container_index_01():
@@ -11,3 +13,73 @@ def test_scoretools_Container_index_01():
     assert container.index(container[1]) == 1
     assert container.index(container[2]) == 2
     assert container.index(container[3]) == 3
+
+
+def test_scoretools_Container_index_02():
+    r'''Cached child indices follow insert, delete, pop and reverse.
+    '''
+
+    container = abjad.Container("c'4 d'4 e'4 f'4")
+    notes = container[:]
+    assert [container.index(_) for _ in notes] == [0, 1, 2, 3]
+
+    note = abjad.Note("g'4")
+    container.insert(1, note)
+    assert container.index(note) == 1
+    assert container.index(notes[3]) == 4
+
+    del(container[0])
+    assert container.index(note) == 0
+    assert container.index(notes[1]) == 1
+
+    container.pop(0)
+    assert container.index(notes[1]) == 0
+
+    container.reverse()
+    assert container.index(notes[3]) == 0
+    assert container.index(notes[1]) == 2
+
+    container.append(note)
+    assert container.index(note) == 3
+
+    container[1:1] = [abjad.Note("a'4")]
+    assert container.index(note) == 4
+
+
+def test_scoretools_Container_index_03():
+    r'''Raises value error on component not in container.
+    '''
+
+    container = abjad.Container("c'4 d'4")
+    note = abjad.Note("e'4")
+
+    assert pytest.raises(ValueError, container.index, note)
+
+    container.append(note)
+    assert container.index(note) == 2
+
+    container.remove(note)
+    assert pytest.raises(ValueError, container.index, note)
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_scoretools_Container_index_04():
+    r'''Sibling lookup costs the same in short and long containers.
+    '''
+
+    short_voice = abjad.Voice(10 * abjad.Note("c'16"))
+    long_voice = abjad.Voice(1000 * abjad.Note("c'16"))
+    counts = []
+    for voice in (short_voice, long_voice):
+        note = voice[-2]
+        count = abjad.IOManager.count_function_calls(
+            'note._get_sibling(1); note._get_sibling(-1)',
+            globals(),
+            locals(),
+            )
+        counts.append(count)
+
+    assert counts[0] == counts[1]
@@ -0,0 +1,16 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'GroupedRhythmicStavesScoreTemplate',
+    'GroupedStavesScoreTemplate',
+    'Path',
+    'PianoStaffSegmentMaker',
+    'ScoreTemplate',
+    'SegmentMaker',
+    'StringOrchestraScoreTemplate',
+    'StringQuartetScoreTemplate',
+    'TwoStaffPianoScoreTemplate',
+    )
+
+packages = ()
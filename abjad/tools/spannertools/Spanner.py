@@ -15,6 +15,7 @@ class Spanner(AbjadObject):
 
     __slots__ = (
         '_contiguity_constraint',
+        '_format_version',
         '_ignore_attachment_test',
         '_ignore_before_attach',
         '_indicator_wrappers',
@@ -33,6 +34,7 @@ class Spanner(AbjadObject):
         ):
         overrides = overrides or {}
         self._contiguity_constraint = 'logical voice'
+        self._format_version = 0
         self._apply_overrides(overrides)
         self._ignore_attachment_test = None
         self._ignore_before_attach = None
@@ -136,6 +138,7 @@ class Spanner(AbjadObject):
             if not leaves.are_contiguous_logical_voice():
                 raise Exception(leaves)
         leaf._spanners.add(self)
+        leaf._bump_format_version()
         self._leaves.append(leaf)
 
     def _append_left(self, leaf):
@@ -144,17 +147,20 @@ class Spanner(AbjadObject):
         leaves = abjad.select(leaves)
         assert leaves.are_contiguous_logical_voice()
         leaf._spanners.add(self)
+        leaf._bump_format_version()
         self._leaves.insert(0, leaf)
 
     def _apply_overrides(self, overrides):
         import abjad
-        namespace = abjad.__dict__.copy()
+        namespace = None
         manager = abjad.override(self)
         for key, value in overrides.items():
             grob_name, attribute = key.split('__', 1)
             grob_manager = getattr(manager, grob_name)
             if isinstance(value, str):
                 if 'markuptools' in value or 'schemetools' in value:
+                    if namespace is None:
+                        namespace = abjad.ImportManager.get_namespace(abjad)
                     value = eval(value, namespace, namespace)
             setattr(grob_manager, attribute, value)
 
@@ -200,6 +206,9 @@ class Spanner(AbjadObject):
     def _before_attach(self, argument):
         pass
 
+    def _bump_format_version(self):
+        self._format_version += 1
+
     def _block_all_leaves(self):
         r'''Not composer-safe.
         '''
@@ -209,6 +218,7 @@ class Spanner(AbjadObject):
     def _block_leaf(self, leaf):
         r'''Not composer-safe.
         '''
+        leaf._bump_format_version()
         leaf._spanners.remove(self)
 
     def _constrain_contiguity(self):
@@ -477,6 +487,7 @@ class Spanner(AbjadObject):
             message = message.format(leaf)
             raise Exception(message)
         leaf._spanners.add(self)
+        leaf._bump_format_version()
         self._leaves.insert(i, leaf)
 
     def _is_exterior_leaf(self, leaf):
@@ -538,6 +549,7 @@ class Spanner(AbjadObject):
         for i, leaf_ in enumerate(self.leaves):
             if leaf_ is leaf:
                 self._leaves.pop(i)
+                self._format_version += 1
                 break
         else:
             message = '{!r} not in spanner.'
@@ -558,6 +570,7 @@ class Spanner(AbjadObject):
         method to reverse mapping elements.
         '''
         self._leaves.reverse()
+        self._format_version += 1
 
     def _sever_all_leaves(self):
         r'''Not composer-safe.
@@ -593,6 +606,7 @@ class Spanner(AbjadObject):
         r'''Not composer-safe.
         '''
         leaf._spanners.add(self)
+        leaf._bump_format_version()
 
     def _unconstrain_contiguity(self):
         r'''Not composer-safe.
@@ -0,0 +1,31 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'Beam',
+    'BowContactSpanner',
+    'ClefSpanner',
+    'ComplexBeam',
+    'ComplexTrillSpanner',
+    'DuratedComplexBeam',
+    'GeneralizedBeam',
+    'Glissando',
+    'Hairpin',
+    'HiddenStaffSpanner',
+    'HorizontalBracketSpanner',
+    'MeasuredComplexBeam',
+    'MetronomeMarkSpanner',
+    'MultipartBeam',
+    'OctavationSpanner',
+    'PhrasingSlur',
+    'PianoPedalSpanner',
+    'Slur',
+    'Spanner',
+    'StaffLinesSpanner',
+    'StemTremoloSpanner',
+    'TextSpanner',
+    'Tie',
+    'TrillSpanner',
+    )
+
+packages = ()
@@ -314,10 +314,22 @@ class AbjadConfiguration(Configuration):
         '''
         return self._settings['composer_website']
 
+    @property
+    def lilypond_log_directory(self):
+        r'''Gets LilyPond log directory.
+
+        Holds one log file for each LilyPond run.
+
+        Returns string.
+        '''
+        return os.path.join(self.abjad_output_directory, 'lilypond_logs')
+
     @property
     def lilypond_log_file_path(self):
         r'''Gets LilyPond log file path.
 
+        Holds log of LilyPond run that finished last.
+
         Returns string.
         '''
         return os.path.join(self.abjad_output_directory, 'lily.log')
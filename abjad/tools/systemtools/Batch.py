@@ -0,0 +1,185 @@
+from .ForbidUpdate import ForbidUpdate
+
+
+class Batch(ForbidUpdate):
+    r'''A context manager for attaching many indicators at once.
+
+    ..  container:: example
+
+        Forbids score updates and queues indicators attached inside `with`
+        block. Updates score once on exit and then attaches queued
+        indicators in order:
+
+        >>> staff = abjad.Staff("c'8 d'8 e'8 f'8")
+        >>> with abjad.Batch(component=staff):
+        ...     for note in staff:
+        ...         note.written_duration = abjad.Duration(1, 16)
+        ...         abjad.attach(abjad.Articulation('.'), note)
+        ...     abjad.attach(abjad.Dynamic('p'), staff[0])
+        ...
+
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff {
+                c'16 -\staccato \p
+                d'16 -\staccato
+                e'16 -\staccato
+                f'16 -\staccato
+            }
+
+    ..  container:: example
+
+        Checks queued indicators for duplicates on exit exactly as
+        ``abjad.attach()`` does:
+
+        >>> staff = abjad.Staff("c'8 d'8 e'8 f'8")
+        >>> with abjad.Batch(component=staff):
+        ...     abjad.attach(abjad.Clef('alto'), staff[0])
+        ...     abjad.attach(abjad.Clef('bass'), staff[0])
+        ...
+        Traceback (most recent call last):
+            ...
+        Exception: Can not attach ...
+
+        Indicators queued before the failing indicator remain attached:
+
+        >>> abjad.inspect(staff[0]).get_indicators(abjad.Clef)
+        (Clef('alto'),)
+
+    Queued indicators are not visible to inspection until exit. Detaching
+    inside `with` block removes queued indicators, too. Discards queued
+    indicators when `with` block raises an exception.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Context managers'
+
+    __slots__ = (
+        '_wrappers',
+        '_wrappers_by_component',
+        )
+
+    _active_batches = []
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        component=None,
+        update_on_enter=True,
+        update_on_exit=None,
+        ):
+        ForbidUpdate.__init__(
+            self,
+            component=component,
+            update_on_enter=update_on_enter,
+            update_on_exit=update_on_exit,
+            )
+        self._wrappers = []
+        self._wrappers_by_component = {}
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        r'''Enters context manager.
+
+        Returns context manager.
+        '''
+        ForbidUpdate.__enter__(self)
+        if self.component is not None:
+            Batch._active_batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r'''Exits context manager.
+
+        Returns none.
+        '''
+        if self.component is None:
+            return
+        batches = Batch._active_batches
+        for i, batch in enumerate(batches):
+            if batch is self:
+                del(batches[i])
+                break
+        outer_batch = self._find_batch(self.component)
+        if (outer_batch is None or
+            outer_batch.component is not self.component):
+            ForbidUpdate.__exit__(self, exc_type, exc_value, traceback)
+        wrappers = self._wrappers
+        self._wrappers = []
+        self._wrappers_by_component = {}
+        if exc_type is not None:
+            return
+        if outer_batch is not None:
+            for wrapper in wrappers:
+                if wrapper.component is not None:
+                    outer_batch._queue(wrapper)
+            return
+        self.component._update_now(offsets=True, indicators=True)
+        for wrapper in wrappers:
+            component = wrapper.component
+            if component is not None:
+                wrapper._bind_to_component(component)
+
+    ### PRIVATE METHODS ###
+
+    def _detach(self, prototype, component):
+        r'''Detaches queued indicators matching `prototype` from
+        `component`.
+
+        Returns list of detached items.
+        '''
+        wrappers = self._wrappers_by_component.get(id(component), [])
+        result = []
+        for wrapper in wrappers:
+            if wrapper.component is not component:
+                continue
+            if isinstance(prototype, type):
+                if isinstance(wrapper, prototype):
+                    item = wrapper
+                elif isinstance(wrapper.indicator, prototype):
+                    item = wrapper.indicator
+                else:
+                    continue
+            elif wrapper == prototype:
+                item = wrapper
+            elif wrapper.indicator == prototype:
+                item = wrapper.indicator
+            else:
+                continue
+            # unbound wrappers are skipped on exit
+            wrapper._component = None
+            result.append(item)
+        return result
+
+    @staticmethod
+    def _find_batch(component):
+        r'''Finds innermost active batch whose component is `component` or
+        contains `component`.
+
+        Returns batch or none.
+        '''
+        import abjad
+        if not Batch._active_batches:
+            return
+        if not isinstance(component, abjad.Component):
+            return
+        for batch in reversed(Batch._active_batches):
+            node = component
+            while node is not None:
+                if node is batch.component:
+                    return batch
+                parent = node._parent
+                if parent is None:
+                    parent = getattr(node, '_carrier', None)
+                node = parent
+
+    def _queue(self, wrapper):
+        self._wrappers.append(wrapper)
+        key = id(wrapper.component)
+        self._wrappers_by_component.setdefault(key, []).append(wrapper)
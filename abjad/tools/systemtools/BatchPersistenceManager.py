@@ -0,0 +1,291 @@
+import concurrent.futures
+import os
+import shutil
+import tempfile
+from abjad.tools import abctools
+
+
+class BatchPersistenceManager(abctools.AbjadObject):
+    r'''Batch persistence manager.
+
+    ..  container:: example
+
+        >>> staves = [
+        ...     abjad.Staff("c'4 e'4 d'4 f'4"),
+        ...     abjad.Staff("d'4 f'4 e'4 g'4"),
+        ...     ]
+        >>> abjad.persist_many(staves)
+        BatchPersistenceManager(clients=(Staff("c'4 e'4 d'4 f'4"), Staff("d'4 f'4 e'4 g'4")))
+
+    ..  container:: example
+
+        Renders PDFs with two LilyPond processes at once:
+
+        >>> results = abjad.persist_many(staves).as_pdf( # doctest: +SKIP
+        ...     workers=2,
+        ...     )
+
+    Formats clients one after another in this process. Renders each
+    LilyPond file with a LilyPond render server while later clients format.
+    Returns one tuple for each client, exactly as persistence manager does.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_clients',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, clients=None):
+        self._clients = tuple(clients or ())
+
+    ### PRIVATE METHODS ###
+
+    def _get_file_paths(self, file_paths):
+        if file_paths is None:
+            return [None] * len(self.clients)
+        file_paths = list(file_paths)
+        assert len(file_paths) == len(self.clients), repr(file_paths)
+        return file_paths
+
+    def _render(
+        self,
+        write,
+        finish,
+        render_cache,
+        render_server,
+        workers,
+        flags=None,
+        ):
+        import abjad
+        server = render_server
+        if server is None:
+            # one file per process spreads files over workers and gives
+            # rendering time of each file
+            server = abjad.LilyPondRenderServer(
+                batch_size=1,
+                worker_count=workers or 1,
+                )
+        try:
+            jobs = []
+            for i, client in enumerate(self.clients):
+                manager = abjad.PersistenceManager(client)
+                # job starts with path to render
+                job = write(i, manager)
+                key, future = None, None
+                if render_cache is not None:
+                    key = render_cache.get_key(
+                        job[0],
+                        flags,
+                        server._get_lilypond_path(),
+                        )
+                    if render_cache.fetch(key, job[0]) is not None:
+                        key = None
+                        future = concurrent.futures.Future()
+                        future.set_result(abjad.LilyPondRenderResult(
+                            ly_path=job[0],
+                            exit_code=0,
+                            log='',
+                            elapsed_time=0.0,
+                            ))
+                if future is None:
+                    future = server.submit(job[0], flags=flags)
+                jobs.append((manager, job, key, future))
+            results = []
+            for manager, job, key, future in jobs:
+                render_result = future.result()
+                if key is not None and render_result.success:
+                    render_cache.store(key, render_result)
+                result = finish(manager, job, render_result)
+                results.append(result)
+        finally:
+            if render_server is None:
+                server.shutdown()
+        return tuple(results)
+
+    ### PUBLIC METHODS ###
+
+    def as_midi(
+        self,
+        midi_file_paths=None,
+        remove_ly=False,
+        render_cache=None,
+        render_server=None,
+        workers=None,
+        **keywords
+        ):
+        r'''Persists clients as MIDI files.
+
+        Autogenerates file paths when `midi_file_paths` is none.
+
+        Runs up to `workers` LilyPond processes at once, one for each file.
+        Renders with `render_server` when `render_server` is not none; server
+        may render several files with one LilyPond process, and rendering
+        time is then wall time of that process. Copies output from
+        `render_cache` when `render_cache` is not none and contains output for
+        same LilyPond input.
+
+        Returns tuple of output path, elapsed formatting time and elapsed
+        rendering time for each client.
+        '''
+        midi_file_paths = self._get_file_paths(midi_file_paths)
+
+        def write(i, manager):
+            return manager._write_midi_ly(midi_file_paths[i], **keywords)
+
+        def finish(manager, job, render_result):
+            ly_file_path, formatting_time = job
+            if remove_ly:
+                os.remove(ly_file_path)
+            return (
+                manager._get_midi_file_path(ly_file_path),
+                formatting_time,
+                render_result.elapsed_time,
+                )
+
+        return self._render(
+            write,
+            finish,
+            render_cache,
+            render_server,
+            workers,
+            )
+
+    def as_pdf(
+        self,
+        pdf_file_paths=None,
+        illustrate_function=None,
+        remove_ly=False,
+        render_cache=None,
+        render_server=None,
+        strict=False,
+        workers=None,
+        **keywords
+        ):
+        r'''Persists clients as PDFs.
+
+        Autogenerates file paths when `pdf_file_paths` is none.
+
+        Runs up to `workers` LilyPond processes at once, one for each file.
+        Renders with `render_server` when `render_server` is not none; server
+        may render several files with one LilyPond process, and rendering
+        time is then wall time of that process. Copies output from
+        `render_cache` when `render_cache` is not none and contains output for
+        same LilyPond input.
+
+        Returns tuple of output path, elapsed formatting time, elapsed
+        rendering time and success for each client.
+        '''
+        pdf_file_paths = self._get_file_paths(pdf_file_paths)
+
+        def write(i, manager):
+            return manager._write_pdf_ly(
+                pdf_file_paths[i],
+                illustrate_function=illustrate_function,
+                strict=strict,
+                **keywords
+                )
+
+        def finish(manager, job, render_result):
+            ly_file_path, formatting_time = job
+            if remove_ly:
+                os.remove(ly_file_path)
+            return (
+                '{}.pdf'.format(os.path.splitext(ly_file_path)[0]),
+                formatting_time,
+                render_result.elapsed_time,
+                render_result.success,
+                )
+
+        return self._render(
+            write,
+            finish,
+            render_cache,
+            render_server,
+            workers,
+            )
+
+    def as_png(
+        self,
+        png_file_paths=None,
+        remove_ly=False,
+        illustrate_function=None,
+        render_cache=None,
+        render_server=None,
+        workers=None,
+        **keywords
+        ):
+        r'''Persists clients as PNGs.
+
+        Autogenerates file paths when `png_file_paths` is none.
+
+        Runs up to `workers` LilyPond processes at once, one for each file.
+        Renders with `render_server` when `render_server` is not none; server
+        may render several files with one LilyPond process, and rendering
+        time is then wall time of that process. Copies output from
+        `render_cache` when `render_cache` is not none and contains output for
+        same LilyPond input.
+
+        Returns tuple of output paths, elapsed formatting time, elapsed
+        rendering time and success for each client.
+        '''
+        png_file_paths = self._get_file_paths(png_file_paths)
+        temporary_directories = []
+
+        def write(i, manager):
+            ly_file_path, formatting_time = manager._write_png_ly(
+                png_file_paths[i],
+                illustrate_function=illustrate_function,
+                **keywords
+                )
+            file_name = os.path.basename(ly_file_path)
+            for directory in temporary_directories:
+                path = os.path.join(directory, file_name)
+                if not os.path.exists(path):
+                    break
+            else:
+                directory = tempfile.mkdtemp()
+                temporary_directories.append(directory)
+                path = os.path.join(directory, file_name)
+            shutil.copy(ly_file_path, path)
+            return path, ly_file_path, formatting_time
+
+        def finish(manager, job, render_result):
+            path, ly_file_path, formatting_time = job
+            png_file_paths = manager._move_png_files(
+                path,
+                os.path.dirname(ly_file_path),
+                )
+            if remove_ly:
+                os.remove(ly_file_path)
+            return (
+                png_file_paths,
+                formatting_time,
+                render_result.elapsed_time,
+                render_result.success,
+                )
+
+        try:
+            return self._render(
+                write,
+                finish,
+                render_cache,
+                render_server,
+                workers,
+                flags='--png',
+                )
+        finally:
+            for directory in temporary_directories:
+                shutil.rmtree(directory)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def clients(self):
+        r'''Gets clients of batch persistence manager.
+
+        Returns tuple.
+        '''
+        return self._clients
@@ -1,11 +1,16 @@
+import asyncio
 import datetime
 import os
 import pathlib
 import platform
 import re
+import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+import weakref
 from abjad.tools.abctools import AbjadObject
 from io import StringIO
 
@@ -20,6 +25,16 @@ class IOManager(AbjadObject):
 
     __slots__ = ()
 
+    _lilypond_log_count = 100
+
+    _lilypond_output_suffix_regex = re.compile(
+        r'(-page\d+)?\.(eps|midi?|pdf|png|svg)\Z'
+        )
+
+    _lilypond_process_count = os.cpu_count() or 1
+
+    _lilypond_semaphores = weakref.WeakKeyDictionary()
+
     ### PRIVATE METHODS ###
 
     @staticmethod
@@ -37,6 +52,116 @@ class IOManager(AbjadObject):
             input(message)
             os.makedirs(directory)
 
+    @staticmethod
+    def _find_lilypond_output_paths(ly_path, start_time, previous_stats=None):
+        r'''Finds files LilyPond wrote for `ly_path` since `start_time`.
+
+        Skips files whose stats equal `previous_stats` taken before LilyPond
+        started: LilyPond left these files untouched.
+        '''
+        previous_stats = previous_stats or {}
+        output_paths = []
+        for path, stat in IOManager._get_lilypond_output_stats(
+            ly_path).items():
+            # allow for coarse file system timestamps
+            if stat[1] < (int(start_time) - 1) * 10 ** 9:
+                continue
+            if previous_stats.get(path) == stat:
+                continue
+            output_paths.append(path)
+        return tuple(sorted(output_paths))
+
+    @staticmethod
+    def _find_lilypond_path():
+        import abjad
+        lilypond_path = abjad.abjad_configuration.get('lilypond_path')
+        if not lilypond_path:
+            lilypond_path = abjad.IOManager.find_executable('lilypond')
+            if lilypond_path:
+                lilypond_path = lilypond_path[0]
+            else:
+                lilypond_path = 'lilypond'
+        return lilypond_path
+
+    @staticmethod
+    def _get_lilypond_output_stats(ly_path):
+        r'''Gets inode, modification time in nanoseconds and size of each
+        LilyPond output file of `ly_path`.
+
+        Returns dictionary keyed to paths.
+        '''
+        directory, file_name = os.path.split(os.path.abspath(ly_path))
+        base = os.path.splitext(file_name)[0]
+        stats = {}
+        for file_name in os.listdir(directory):
+            if not file_name.startswith(base):
+                continue
+            regex = IOManager._lilypond_output_suffix_regex
+            if not regex.match(file_name, len(base)):
+                continue
+            path = os.path.join(directory, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    @staticmethod
+    def _get_lilypond_semaphore():
+        loop = asyncio.get_event_loop()
+        semaphore = IOManager._lilypond_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(IOManager._lilypond_process_count)
+            IOManager._lilypond_semaphores[loop] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _make_lilypond_command(ly_path, flags=None, lilypond_path=None):
+        if lilypond_path is None:
+            lilypond_path = IOManager._find_lilypond_path()
+        lilypond_base, extension = os.path.splitext(ly_path)
+        command = [lilypond_path]
+        command.extend(shlex.split(flags or ''))
+        command.extend(['-dno-point-and-click', '-o', lilypond_base, ly_path])
+        return command
+
+    @staticmethod
+    def _make_lilypond_result(
+        ly_path,
+        stdout,
+        stderr,
+        exit_code,
+        start_time,
+        elapsed_time,
+        previous_stats=None,
+        ):
+        import abjad
+        stdout = stdout.decode('utf-8', 'replace')
+        stderr = stderr.decode('utf-8', 'replace')
+        postscript_path = ly_path.replace('.ly', '.ps')
+        try:
+            os.remove(postscript_path)
+        except OSError:
+            pass
+        log = stdout + stderr
+        log_file_path = IOManager._write_lilypond_log(ly_path, log)
+        output_paths = IOManager._find_lilypond_output_paths(
+            ly_path,
+            start_time,
+            previous_stats=previous_stats,
+            )
+        return abjad.LilyPondRenderResult(
+            ly_path=ly_path,
+            exit_code=exit_code,
+            log=log,
+            elapsed_time=elapsed_time,
+            log_file_path=log_file_path,
+            output_paths=output_paths,
+            stderr=stderr,
+            stdout=stdout,
+            )
+
     @staticmethod
     def _make_score_package(
         score_package_path,
@@ -144,6 +269,45 @@ class IOManager(AbjadObject):
         for line in lines:
             print(line.center(80))
 
+    @staticmethod
+    def _write_lilypond_log(ly_path, log):
+        import abjad
+        directory = abjad.abjad_configuration.lilypond_log_directory
+        os.makedirs(directory, exist_ok=True)
+        now = datetime.datetime.now()
+        base = os.path.splitext(os.path.basename(ly_path))[0]
+        prefix = '{}-{}-'.format(now.strftime('%Y%m%d-%H%M%S'), base)
+        file_descriptor, log_file_path = tempfile.mkstemp(
+            dir=directory,
+            prefix=prefix,
+            suffix='.log',
+            )
+        with os.fdopen(file_descriptor, 'w') as file_pointer:
+            file_pointer.write(now.strftime('%c') + '\n')
+            file_pointer.write(log)
+        # replace last log in one step so concurrent runs never interleave
+        last_log_file_path = abjad.abjad_configuration.lilypond_log_file_path
+        file_descriptor, path = tempfile.mkstemp(
+            dir=os.path.dirname(last_log_file_path),
+            suffix='.log',
+            )
+        os.close(file_descriptor)
+        shutil.copyfile(log_file_path, path)
+        os.replace(path, last_log_file_path)
+        file_names = [_ for _ in os.listdir(directory) if _.endswith('.log')]
+        if IOManager._lilypond_log_count < len(file_names):
+            paths = [os.path.join(directory, _) for _ in file_names]
+            try:
+                paths.sort(key=os.path.getmtime)
+            except OSError:
+                return log_file_path
+            for path in paths[:-IOManager._lilypond_log_count]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        return log_file_path
+
     ### PUBLIC METHODS ###
 
     @staticmethod
@@ -672,54 +836,43 @@ class IOManager(AbjadObject):
     def run_lilypond(ly_path, flags=None, lilypond_path=None):
         r'''Runs LilyPond on `ly_path`.
 
-        Writes redirected output of Unix ``date`` to top line of LilyPond log
-        file.
+        Captures LilyPond output and writes it with date to new log file in
+        LilyPond log directory. Keeps most recent log files only. Copies log
+        to LilyPond log file, too.
 
-        Then appends redirected output of LilyPond output to the LilyPond log
-        file.
+        Safe to call from many threads and processes at once.
 
-        Returns none.
+        Returns LilyPond render result. Render result is true when LilyPond
+        exits without error.
         '''
-        import abjad
         ly_path = str(ly_path)
-        lilypond_path = abjad.abjad_configuration.get('lilypond_path')
-        if not lilypond_path:
-            lilypond_path = abjad.IOManager.find_executable('lilypond')
-            if lilypond_path:
-                lilypond_path = lilypond_path[0]
-            else:
-                lilypond_path = 'lilypond'
-        lilypond_base, extension = os.path.splitext(ly_path)
-        flags = flags or ''
-        date = datetime.datetime.now().strftime('%c')
-        log_file_path = abjad.abjad_configuration.lilypond_log_file_path
-        command = '{} {} -dno-point-and-click -o {} {}'.format(
-            lilypond_path,
-            flags,
-            lilypond_base,
+        command = IOManager._make_lilypond_command(
             ly_path,
+            flags,
+            lilypond_path,
             )
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            )
-        subprocess_output, _ = process.communicate()
-        subprocess_output = subprocess_output.decode('utf-8')
-        exit_code = process.returncode
-        with open(log_file_path, 'w') as file_pointer:
-            file_pointer.write(date + '\n')
-            file_pointer.write(subprocess_output)
-        postscript_path = ly_path.replace('.ly', '.ps')
+        previous_stats = IOManager._get_lilypond_output_stats(ly_path)
+        start_time = time.time()
         try:
-            os.remove(postscript_path)
-        except OSError:
-            pass
-        # TODO: maybe just 'return exit_code'?
-        if exit_code:
-            return False
-        return True
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                )
+            stdout, stderr = process.communicate()
+            exit_code = process.returncode
+        except OSError as e:
+            stdout, stderr, exit_code = b'', str(e).encode('utf-8'), 127
+        elapsed_time = time.time() - start_time
+        return IOManager._make_lilypond_result(
+            ly_path,
+            stdout,
+            stderr,
+            exit_code,
+            start_time,
+            elapsed_time,
+            previous_stats=previous_stats,
+            )
 
     @staticmethod
     def save_last_ly_as(file_path):
@@ -775,3 +928,9 @@ class IOManager(AbjadObject):
         Returns integer exit code.
         '''
         return subprocess.call(command, shell=True)
+
+
+if sys.version_info >= (3, 5):
+    from abjad.tools.systemtools import _coroutines
+    IOManager.run_lilypond_async = staticmethod(
+        _coroutines.run_lilypond_async)
@@ -1,4 +1,6 @@
+import importlib
 import os
+import sys
 import types
 from abjad.tools.abctools import AbjadObject
 
@@ -13,8 +15,102 @@ class ImportManager(AbjadObject):
 
     __slots__ = ()
 
+    _manifest_name = '_exports'
+
+    class _LazyPackage(types.ModuleType):
+        r'''Package that imports public names on first access.
+
+        Maps public names to (module name, attribute name) pairs in
+        `_lazy_index`; attribute name is none for subpackages.
+        '''
+
+        def __dir__(self):
+            names = set(self.__dict__)
+            names.update(self.__dict__.get('_lazy_index', ()))
+            return sorted(names)
+
+        def __getattr__(self, name):
+            index = self.__dict__.get('_lazy_index', {})
+            if name not in index:
+                message = 'module {!r} has no attribute {!r}.'
+                message = message.format(self.__name__, name)
+                raise AttributeError(message)
+            module_name, attribute_name = index[name]
+            value = importlib.import_module(module_name)
+            if attribute_name is not None:
+                value = getattr(value, attribute_name)
+            self.__dict__[name] = value
+            return value
+
+        def __setattr__(self, name, value):
+            # importing module X.py sets package attribute X to module;
+            # keep eponymous public datum instead
+            index = self.__dict__.get('_lazy_index', {})
+            if isinstance(value, types.ModuleType) and name in index:
+                module_name, attribute_name = index[name]
+                if (
+                    attribute_name is not None and
+                    value.__name__ == module_name
+                    ):
+                    value = getattr(value, attribute_name)
+            types.ModuleType.__setattr__(self, name, value)
+
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _get_export_names(path):
+        r'''Gets names of eponymous public modules and names of public
+        packages in the top level of `path` without importing anything.
+        '''
+        module_names, package_names = [], []
+        for element in sorted(os.listdir(path)):
+            if element.startswith(('.', '_')):
+                continue
+            element_path = os.path.join(path, element)
+            if os.path.isfile(element_path):
+                name, extension = os.path.splitext(element)
+                if extension in ('.py', '.pyx'):
+                    module_names.append(name)
+            elif os.path.isdir(element_path):
+                if element == 'test':
+                    continue
+                initializer_file_path = os.path.join(
+                    element_path,
+                    '__init__.py',
+                    )
+                if os.path.exists(initializer_file_path):
+                    package_names.append(element)
+        return tuple(module_names), tuple(package_names)
+
+    @staticmethod
+    def _get_lazy_index(path, package_name, ignored_names=None):
+        r'''Maps public names of package to (module name, attribute name)
+        pairs without importing anything but the export manifest.
+
+        Lists `path` when package has no export manifest.
+        '''
+        manifest_name = '.'.join((package_name, ImportManager._manifest_name))
+        try:
+            manifest = importlib.import_module(manifest_name)
+            module_names = manifest.modules
+            package_names = manifest.packages
+        except (AttributeError, ImportError):
+            module_names, package_names = \
+                ImportManager._get_export_names(path)
+        ignored_names = ignored_names or ()
+        index = {}
+        for name in module_names:
+            if name in ignored_names:
+                continue
+            module_name = '.'.join((package_name, name))
+            index[name] = (module_name, name)
+        for name in package_names:
+            if name in ignored_names:
+                continue
+            module_name = '.'.join((package_name, name))
+            index[name] = (module_name, None)
+        return index
+
     @staticmethod
     def _get_public_function_names_in_module(module_file):
         r'''Collects and returns all public functions defined in
@@ -70,6 +166,23 @@ class ImportManager(AbjadObject):
                     for public_name in public_names:
                         namespace[public_name.__name__] = public_name
 
+    @staticmethod
+    def _install_lazy_package(path, namespace, ignored_names=None):
+        module = sys.modules[namespace['__name__']]
+        index = ImportManager._get_lazy_index(
+            path,
+            module.__name__,
+            ignored_names=ignored_names,
+            )
+        try:
+            module.__class__ = ImportManager._LazyPackage
+        except TypeError:
+            # Python versions before 3.5 do not allow module class change
+            return False
+        namespace['_lazy_index'] = index
+        namespace['__all__'] = sorted(index)
+        return True
+
     @staticmethod
     def _split_package_path(path):
         outer, inner = path, None
@@ -81,6 +194,25 @@ class ImportManager(AbjadObject):
 
     ### PUBLIC METHODS ###
 
+    @staticmethod
+    def get_namespace(module):
+        r'''Gets copy of namespace of `module` after importing all lazily
+        imported names.
+
+        ..  container:: example
+
+            >>> namespace = abjad.ImportManager.get_namespace(abjad)
+            >>> namespace['Note'] is abjad.Note
+            True
+
+        Returns dictionary.
+        '''
+        namespace = vars(module)
+        for name in dir(module):
+            if name not in namespace:
+                getattr(module, name)
+        return namespace.copy()
+
     @staticmethod
     def import_material_packages(
         path,
@@ -176,7 +308,10 @@ class ImportManager(AbjadObject):
             namespace = namespace.__dict__
         package_path = ImportManager._split_package_path(path)
         for element in sorted(os.listdir(path)):
-            if ignored_names and element in ignored_names:
+            if ignored_names and (
+                element in ignored_names or
+                os.path.splitext(element)[0] in ignored_names
+                ):
                 continue
             if os.path.isfile(os.path.join(path, element)):
                 if element.startswith('_'):
@@ -230,6 +365,7 @@ class ImportManager(AbjadObject):
         namespace,
         delete_systemtools=True,
         ignored_names=None,
+        lazy=False,
         ):
         r'''Imports public names from `path` into `namespace`.
 
@@ -237,7 +373,26 @@ class ImportManager(AbjadObject):
         public classes and functions on startup.
 
         The function will work for any package laid out like Abjad packages.
+
+        Set `lazy` to true to defer importing each public name until first
+        accessed. Lazy packages export only eponymous public names: module
+        ``Foo.py`` contributes ``Foo`` and subpackage ``foo`` contributes
+        ``foo``. Lazy packages read public names from the package export
+        manifest written by ``write_export_manifest()`` and list `path` only
+        when the package has no export manifest. Imports eagerly when the
+        package module does not allow lazy loading.
         '''
+        if lazy and ImportManager._install_lazy_package(
+            path,
+            namespace,
+            ignored_names=ignored_names,
+            ):
+            if delete_systemtools:
+                if 'systemtools' in namespace:
+                    del(namespace['systemtools'])
+            if ImportManager.__name__ in namespace:
+                del(namespace[ImportManager.__name__])
+            return
         ImportManager.import_public_names_from_path_into_namespace(
             path,
             namespace,
@@ -249,3 +404,40 @@ class ImportManager(AbjadObject):
                 del(namespace['systemtools'])
         if ImportManager.__name__ in namespace:
             del(namespace[ImportManager.__name__])
+
+    @staticmethod
+    def write_export_manifest(path):
+        r'''Writes export manifest of package at `path`.
+
+        Lazy packages read public names from export manifest instead of
+        listing package directory at import. This lets frozen and zipped
+        packages import lazily.
+
+        Rewrite export manifest after adding, removing or renaming public
+        modules or packages.
+
+        Returns export manifest file path.
+        '''
+        module_names, package_names = ImportManager._get_export_names(path)
+        lines = [
+            '# generated by ImportManager.write_export_manifest();',
+            '# do not edit by hand',
+            ]
+        for variable_name, names in (
+            ('modules', module_names),
+            ('packages', package_names),
+            ):
+            lines.append('')
+            if not names:
+                lines.append('{} = ()'.format(variable_name))
+                continue
+            lines.append('{} = ('.format(variable_name))
+            for name in names:
+                lines.append("    '{}',".format(name))
+            lines.append('    )')
+        lines.append('')
+        file_name = '{}.py'.format(ImportManager._manifest_name)
+        file_path = os.path.join(path, file_name)
+        with open(file_path, 'w') as file_pointer:
+            file_pointer.write('\n'.join(lines))
+        return file_path
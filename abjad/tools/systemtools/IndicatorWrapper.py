@@ -310,6 +310,10 @@ class IndicatorWrapper(AbjadValueObject):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            correct_effective_context._add_to_effective_indicator_index(
+                self,
+                dependent=True,
+                )
         self._effective_context = correct_effective_context
         self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
@@ -326,7 +330,27 @@ class IndicatorWrapper(AbjadValueObject):
         self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
             self._component._update_later(offsets_in_seconds=True)
+        if self._changes_duration():
+            self._component._update_later(offsets=True)
         component._indicator_wrappers.append(self)
+        component._bump_format_version()
+        if isinstance(component, abjad.Component):
+            component._add_to_effective_indicator_index(self)
+            # spanners anywhere in score may read context-scoped indicators
+            if self.context is not None:
+                component._bump_score_format_version()
+
+    def _changes_duration(self):
+        import abjad
+        prototype = (
+            abjad.Multiplier,
+            abjad.NonreducedFraction,
+            abjad.TimeSignature,
+            )
+        return (
+            isinstance(self.indicator, prototype) and
+            isinstance(self.component, abjad.Component)
+            )
 
     def _detach(self):
         self._unbind_component()
@@ -412,6 +436,11 @@ class IndicatorWrapper(AbjadValueObject):
         result = [r'%%% {} %%%'.format(_) for _ in result]
         return result
 
+    def _get_start_offset_without_update(self):
+        if self._synthetic_offset is not None:
+            return self._synthetic_offset
+        return getattr(self._component, '_start_offset', None)
+
     def _is_formattable_for_component(self, component):
         import abjad
         if self.is_annotation:
@@ -439,11 +468,22 @@ class IndicatorWrapper(AbjadValueObject):
         return False
 
     def _unbind_component(self):
+        import abjad
         component = self.component
         if component is not None:
             if hasattr(component, '_indicator_wrappers'):
                 if self in component._indicator_wrappers:
-                    component._indicator_wrappers.remove(self)
+                    # removes equal wrapper when self is not yet bound
+                    i = component._indicator_wrappers.index(self)
+                    wrapper = component._indicator_wrappers.pop(i)
+                    component._bump_format_version()
+                    if isinstance(component, abjad.Component):
+                        component._remove_from_effective_indicator_index(
+                            wrapper)
+                        if wrapper.context is not None:
+                            component._bump_score_format_version()
+            if self._changes_duration():
+                component._update_later(offsets=True)
         self._component = None
 
     def _unbind_effective_context(self):
@@ -453,6 +493,7 @@ class IndicatorWrapper(AbjadValueObject):
                 effective_context._dependent_wrappers.remove(self)
             except ValueError:
                 pass
+            effective_context._remove_from_effective_indicator_index(self)
         self._effective_context = None
 
     def _update_effective_context(self):
@@ -1,3 +1,6 @@
+import multiprocessing
+import pickle
+import threading
 from abjad.tools.abctools import AbjadObject
 
 
@@ -11,6 +14,10 @@ class LilyPondFormatManager(AbjadObject):
 
     __slots__ = ()
 
+    _parallel_lock = threading.Lock()
+
+    _parallel_root = None
+
     lilypond_color_constants = (
         'black',
         'blue',
@@ -93,6 +100,112 @@ class LilyPondFormatManager(AbjadObject):
             )
         return indicators
 
+    @staticmethod
+    def _format_in_parallel(container, workers, strict=False):
+        r'''Formats staves of simultaneous `container` in `workers`
+        processes.
+
+        Staves are children of `container` and children of nested
+        simultaneous containers. Settles offsets and indicators of score
+        first so that staves format in context without settling again.
+        Forked processes inherit settled score; other processes unpickle it.
+
+        Returns dictionary of formatted staves keyed to ids of staves.
+        '''
+        import abjad
+        components = []
+
+        def collect(container):
+            for component in container:
+                if (isinstance(component, abjad.Container) and
+                    component.is_simultaneous):
+                    collect(component)
+                else:
+                    components.append(component)
+
+        collect(container)
+        if not components:
+            return {}
+        root = abjad.inspect(container).get_parentage().root
+        root._update_now(offsets=True, indicators=True)
+        paths = []
+        for component in components:
+            path = []
+            while component is not root:
+                path.append(component._parent.index(component))
+                component = component._parent
+            paths.append(tuple(reversed(path)))
+        count = min(workers, len(components))
+        context = multiprocessing.get_context()
+        with LilyPondFormatManager._parallel_lock:
+            if context.get_start_method() == 'fork':
+                string = None
+                LilyPondFormatManager._parallel_root = root
+            else:
+                string = pickle.dumps(root)
+            jobs = [(string, paths[i::count], strict) for i in range(count)]
+            try:
+                with context.Pool(count) as pool:
+                    results = pool.map(
+                        LilyPondFormatManager._format_in_process,
+                        jobs,
+                        )
+            finally:
+                LilyPondFormatManager._parallel_root = None
+        strings = {}
+        for i, strings_ in enumerate(results):
+            for component, string in zip(components[i::count], strings_):
+                strings[id(component)] = string
+        return strings
+
+    @staticmethod
+    def _format_in_process(job):
+        string, paths, strict = job
+        if string is None:
+            root = LilyPondFormatManager._parallel_root
+        else:
+            root = pickle.loads(string)
+        strings = []
+        for path in paths:
+            component = root
+            for index in path:
+                component = component[index]
+            strings.append(component._get_lilypond_format(strict=strict))
+        return strings
+
+    @staticmethod
+    def _get_bundle_key(component):
+        r'''Gets key of format bundle of `component`.
+
+        Key changes whenever `component`, any of its parents or any spanner
+        attaching to them changes format version, and whenever grob
+        overrides or context settings of any of these change. Parents
+        include carriers of grace containers, so that bumping format version
+        of score root invalidates every bundle in score.
+        '''
+        key = []
+        parent = component
+        while parent is not None:
+            key.append(id(parent))
+            key.append(parent._format_version)
+            for spanner in parent._spanners:
+                key.append(id(spanner))
+                key.append(spanner._format_version)
+                manager = spanner._lilypond_grob_name_manager
+                if manager is not None:
+                    key.append(manager._get_attribute_tuples())
+            if parent._parent is None:
+                parent = getattr(parent, '_carrier', None)
+            else:
+                parent = parent._parent
+        manager = component._lilypond_grob_name_manager
+        if manager is not None:
+            key.append(manager._get_attribute_tuples())
+        manager = component._lilypond_setting_name_manager
+        if manager is not None:
+            key.append(tuple(manager._get_attribute_tuples()))
+        return tuple(key)
+
     @staticmethod
     def _populate_context_setting_format_contributions(component, bundle):
         import abjad
@@ -284,10 +397,16 @@ class LilyPondFormatManager(AbjadObject):
     def bundle_format_contributions(component):
         r'''Gets all format contributions for `component`.
 
+        Caches bundle on `component` until `component`, its parentage or its
+        spanners change.
+
         Returns LilyPond format bundle.
         '''
         import abjad
         manager = LilyPondFormatManager
+        key = manager._get_bundle_key(component)
+        if component._format_bundle_key == key:
+            return component._format_bundle
         bundle = abjad.LilyPondFormatBundle()
         manager._populate_indicator_format_contributions(component, bundle)
         manager._populate_spanner_format_contributions(component, bundle)
@@ -297,6 +416,8 @@ class LilyPondFormatManager(AbjadObject):
         manager._populate_grob_revert_format_contributions(component, bundle)
         bundle.alphabetize()
         bundle.make_immutable()
+        component._format_bundle = bundle
+        component._format_bundle_key = manager._get_bundle_key(component)
         return bundle
 
     @staticmethod
@@ -0,0 +1,291 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class LilyPondRenderCache(AbjadObject):
+    r'''LilyPond render cache.
+
+    ..  container:: example
+
+        >>> cache = abjad.LilyPondRenderCache()
+        >>> cache.maximum_size
+        268435456
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> abjad.persist(staff).as_pdf( # doctest: +SKIP
+        ...     render_cache=cache,
+        ...     )
+
+    Stores LilyPond output under a hash of LilyPond input, LilyPond flags and
+    LilyPond version. Copies stored output next to LilyPond files with the
+    same hash instead of running LilyPond again.
+
+    Keeps each entry in its own directory under `directory`. Evicts least
+    recently used entries when total size exceeds `maximum_size` bytes.
+    Processes may share one cache directory.
+
+    Clean cache from command line with ``ajv render-cache``.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'LilyPond rendering'
+
+    __slots__ = (
+        '_directory',
+        '_hit_count',
+        '_lock',
+        '_maximum_size',
+        '_miss_count',
+        )
+
+    _lilypond_versions = {}
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory=None, maximum_size=2 ** 28):
+        import abjad
+        if directory is None:
+            directory = os.path.join(
+                abjad.abjad_configuration.abjad_output_directory,
+                'render_cache',
+                )
+        self._directory = os.path.abspath(os.path.expanduser(directory))
+        self._hit_count = 0
+        self._lock = threading.Lock()
+        self._maximum_size = int(maximum_size)
+        self._miss_count = 0
+
+    ### PRIVATE METHODS ###
+
+    def _get_entries(self):
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith('tmp') or not os.path.isdir(path):
+                continue
+            try:
+                size = sum(
+                    os.path.getsize(os.path.join(path, _))
+                    for _ in os.listdir(path)
+                    )
+                entries.append((os.path.getmtime(path), size, path))
+            except OSError:
+                continue
+        entries.sort()
+        return entries
+
+    def _get_format_specification(self):
+        import abjad
+        return abjad.FormatSpecification(
+            client=self,
+            repr_kwargs_names=['maximum_size'],
+            )
+
+    @classmethod
+    def _get_lilypond_version(class_, lilypond_path):
+        if lilypond_path not in class_._lilypond_versions:
+            try:
+                output = subprocess.check_output(
+                    [lilypond_path, '--version'],
+                    stderr=subprocess.STDOUT,
+                    )
+                output = output.decode('utf-8', 'replace')
+                version = output.splitlines()[0].strip()
+            except (IndexError, OSError, subprocess.CalledProcessError):
+                version = ''
+            class_._lilypond_versions[lilypond_path] = version
+        return class_._lilypond_versions[lilypond_path]
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        r'''Removes all entries from cache.
+
+        Returns none.
+        '''
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def fetch(self, key, ly_file_path):
+        r'''Copies output stored under `key` next to `ly_file_path`.
+
+        Names output after `ly_file_path`.
+
+        Returns tuple of output paths when cache contains `key`.
+
+        Returns none when cache does not contain `key`.
+        '''
+        path = os.path.join(self.directory, key)
+        directory, file_name = os.path.split(ly_file_path)
+        base = os.path.splitext(file_name)[0]
+        output_paths = []
+        try:
+            for suffix in sorted(os.listdir(path)):
+                output_path = os.path.join(directory, base + suffix)
+                shutil.copyfile(os.path.join(path, suffix), output_path)
+                output_paths.append(output_path)
+            os.utime(path, None)
+        except OSError:
+            with self._lock:
+                self._miss_count += 1
+            return None
+        with self._lock:
+            self._hit_count += 1
+        return tuple(output_paths)
+
+    def get_key(self, ly_file_path, flags=None, lilypond_path=None):
+        r'''Gets cache key of `ly_file_path` rendered with LilyPond `flags`
+        by LilyPond executable at `lilypond_path`.
+
+        ..  container:: example
+
+            >>> import os
+            >>> cache = abjad.LilyPondRenderCache()
+            >>> with abjad.TemporaryDirectory() as directory:
+            ...     ly_file_path = os.path.join(directory, 'test.ly')
+            ...     with open(ly_file_path, 'w') as file_pointer:
+            ...         _ = file_pointer.write("{ c'4 }")
+            ...     key = cache.get_key(ly_file_path, lilypond_path='lilypond')
+            ...     png_key = cache.get_key(
+            ...         ly_file_path,
+            ...         flags='--png',
+            ...         lilypond_path='lilypond',
+            ...         )
+            ...
+            >>> len(key)
+            64
+            >>> key == png_key
+            False
+
+        Uses Abjad configuration or ``lilypond`` on path when `lilypond_path`
+        is none.
+
+        Returns string.
+        '''
+        import abjad
+        if lilypond_path is None:
+            lilypond_path = abjad.IOManager._find_lilypond_path()
+        version = self._get_lilypond_version(lilypond_path)
+        hash_ = hashlib.sha256()
+        hash_.update(version.encode('utf-8'))
+        hash_.update(b'\0')
+        hash_.update((flags or '').encode('utf-8'))
+        hash_.update(b'\0')
+        with open(ly_file_path, 'rb') as file_pointer:
+            hash_.update(file_pointer.read())
+        return hash_.hexdigest()
+
+    def prune(self, maximum_size=None):
+        r'''Evicts least recently used entries until cache is no larger than
+        `maximum_size` bytes.
+
+        Uses maximum size of cache when `maximum_size` is none.
+
+        Returns number of evicted entries.
+        '''
+        if maximum_size is None:
+            maximum_size = self.maximum_size
+        entries = self._get_entries()
+        size = sum(_[1] for _ in entries)
+        count = 0
+        for _, entry_size, path in entries:
+            if size <= maximum_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            size -= entry_size
+            count += 1
+        return count
+
+    def store(self, key, render_result):
+        r'''Stores output of `render_result` under `key`.
+
+        Stores only files LilyPond wrote in render, not older output files
+        named after same LilyPond file. Then evicts least recently used
+        entries.
+
+        Returns true when cache stores output.
+        '''
+        base = os.path.splitext(os.path.basename(render_result.ly_path))[0]
+        output_paths = sorted(render_result.output_paths or ())
+        if not output_paths:
+            return False
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        temporary_directory = tempfile.mkdtemp(dir=self.directory)
+        for output_path in output_paths:
+            suffix = os.path.basename(output_path)[len(base):]
+            shutil.copyfile(
+                output_path,
+                os.path.join(temporary_directory, suffix),
+                )
+        try:
+            os.rename(temporary_directory, os.path.join(self.directory, key))
+        except OSError:
+            # another process stored same key
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+        self.prune()
+        return True
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self):
+        r'''Gets directory of cache.
+
+        Defaults to ``render_cache`` in Abjad output directory.
+
+        Returns string.
+        '''
+        return self._directory
+
+    @property
+    def entry_count(self):
+        r'''Gets number of entries in cache.
+
+        Returns nonnegative integer.
+        '''
+        return len(self._get_entries())
+
+    @property
+    def hit_count(self):
+        r'''Gets number of fetches that found output in cache.
+
+        Returns nonnegative integer.
+        '''
+        return self._hit_count
+
+    @property
+    def maximum_size(self):
+        r'''Gets maximum size of cache in bytes.
+
+        Returns nonnegative integer.
+        '''
+        return self._maximum_size
+
+    @property
+    def miss_count(self):
+        r'''Gets number of fetches that found no output in cache.
+
+        Returns nonnegative integer.
+        '''
+        return self._miss_count
+
+    @property
+    def size(self):
+        r'''Gets size of cache in bytes.
+
+        Returns nonnegative integer.
+        '''
+        return sum(_[1] for _ in self._get_entries())
@@ -0,0 +1,155 @@
+from abjad.tools.abctools.AbjadValueObject import AbjadValueObject
+
+
+class LilyPondRenderResult(AbjadValueObject):
+    r'''LilyPond render result.
+
+    ..  container:: example
+
+        >>> result = abjad.LilyPondRenderResult(
+        ...     ly_path='/path/to/score.ly',
+        ...     exit_code=0,
+        ...     log="Processing `/path/to/score.ly'\n",
+        ...     )
+        >>> result
+        LilyPondRenderResult(exit_code=0, ly_path='/path/to/score.ly')
+
+        >>> result.success
+        True
+
+    Returned by ``IOManager.run_lilypond()`` and by LilyPond render server
+    for each rendered LilyPond file. True when LilyPond rendered file without
+    error.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'LilyPond rendering'
+
+    __slots__ = (
+        '_elapsed_time',
+        '_exit_code',
+        '_log',
+        '_log_file_path',
+        '_ly_path',
+        '_output_paths',
+        '_stderr',
+        '_stdout',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        ly_path=None,
+        exit_code=None,
+        log=None,
+        elapsed_time=None,
+        log_file_path=None,
+        output_paths=None,
+        stderr=None,
+        stdout=None,
+        ):
+        self._ly_path = ly_path
+        self._exit_code = exit_code
+        self._log = log
+        self._elapsed_time = elapsed_time
+        self._log_file_path = log_file_path
+        if output_paths is not None:
+            output_paths = tuple(output_paths)
+        self._output_paths = output_paths
+        self._stderr = stderr
+        self._stdout = stdout
+
+    ### SPECIAL METHODS ###
+
+    def __bool__(self):
+        r'''Is true when LilyPond rendered file without error.
+
+        Returns true or false.
+        '''
+        return self.success
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        import abjad
+        return abjad.FormatSpecification(
+            client=self,
+            repr_kwargs_names=['exit_code', 'ly_path'],
+            )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def elapsed_time(self):
+        r'''Gets wall time in seconds of LilyPond process that rendered file.
+
+        Returns float or none.
+        '''
+        return self._elapsed_time
+
+    @property
+    def exit_code(self):
+        r'''Gets exit code of LilyPond for rendered file.
+
+        Returns integer.
+        '''
+        return self._exit_code
+
+    @property
+    def log(self):
+        r'''Gets standard output and standard error of LilyPond for rendered
+        file.
+
+        Returns string.
+        '''
+        return self._log
+
+    @property
+    def log_file_path(self):
+        r'''Gets path of log file written for rendered file.
+
+        Returns string or none.
+        '''
+        return self._log_file_path
+
+    @property
+    def ly_path(self):
+        r'''Gets path of rendered LilyPond file.
+
+        Returns string.
+        '''
+        return self._ly_path
+
+    @property
+    def output_paths(self):
+        r'''Gets paths of files LilyPond wrote for rendered file.
+
+        Returns tuple of strings or none.
+        '''
+        return self._output_paths
+
+    @property
+    def stderr(self):
+        r'''Gets standard error of LilyPond for rendered file.
+
+        Returns string or none.
+        '''
+        return self._stderr
+
+    @property
+    def stdout(self):
+        r'''Gets standard output of LilyPond process that rendered file.
+
+        Returns string or none.
+        '''
+        return self._stdout
+
+    @property
+    def success(self):
+        r'''Is true when LilyPond rendered file without error.
+
+        Returns true or false.
+        '''
+        return self.exit_code == 0
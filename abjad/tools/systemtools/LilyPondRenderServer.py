@@ -0,0 +1,321 @@
+import collections
+import concurrent.futures
+import os
+import re
+import shlex
+import subprocess
+import threading
+import time
+from abjad.tools.abctools.ContextManager import ContextManager
+
+
+class LilyPondRenderServer(ContextManager):
+    r'''LilyPond render server.
+
+    ..  container:: example
+
+        Renders LilyPond files queued from any thread:
+
+        >>> server = abjad.LilyPondRenderServer(worker_count=2)
+        >>> with server: # doctest: +SKIP
+        ...     futures = [server.submit(_) for _ in ly_paths]
+        ...     results = [_.result() for _ in futures]
+        ...
+
+        >>> server
+        LilyPondRenderServer(batch_size=16, worker_count=2)
+
+    ..  container:: example
+
+        Persistence manager renders with server:
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> abjad.persist(staff).as_pdf( # doctest: +SKIP
+        ...     render_server=server,
+        ...     )
+
+    Starting LilyPond costs more than rendering small files. Workers take
+    every queued job that shares flags and output directory with the next
+    job, up to `batch_size` jobs, and render them with a single LilyPond
+    process. Workers start at first submission and stop on exit or shutdown.
+
+    Results are LilyPond render results for each file with exit code,
+    LilyPond output, log file path and output paths. Writes one log file for
+    each file to LilyPond log directory.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'LilyPond rendering'
+
+    __slots__ = (
+        '_batch_size',
+        '_condition',
+        '_is_shut_down',
+        '_jobs',
+        '_lilypond_path',
+        '_workers',
+        '_worker_count',
+        )
+
+    _failed_files_regex = re.compile(
+        r'^fatal error: failed files: (.*)$',
+        re.MULTILINE,
+        )
+
+    _processing_regex = re.compile(r'''^Processing [`'"](.+)['"]\s*$''')
+
+    ### INITIALIZER ###
+
+    def __init__(self, batch_size=16, lilypond_path=None, worker_count=1):
+        batch_size = int(batch_size)
+        assert 0 < batch_size, repr(batch_size)
+        worker_count = int(worker_count)
+        assert 0 < worker_count, repr(worker_count)
+        self._batch_size = batch_size
+        self._condition = threading.Condition()
+        self._is_shut_down = False
+        self._jobs = collections.deque()
+        self._lilypond_path = lilypond_path
+        self._workers = []
+        self._worker_count = worker_count
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        r'''Enters LilyPond render server.
+
+        Returns LilyPond render server.
+        '''
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r'''Exits LilyPond render server.
+
+        Renders queued jobs and stops workers.
+
+        Returns none.
+        '''
+        self.shutdown()
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        import abjad
+        return abjad.FormatSpecification(
+            client=self,
+            repr_kwargs_names=['batch_size', 'worker_count'],
+            )
+
+    def _get_lilypond_path(self):
+        import abjad
+        if self.lilypond_path is not None:
+            return self.lilypond_path
+        return abjad.IOManager._find_lilypond_path()
+
+    def _get_next_batch(self):
+        with self._condition:
+            while not self._jobs and not self._is_shut_down:
+                self._condition.wait()
+            if not self._jobs:
+                return None
+            job = self._jobs.popleft()
+            batch = [job]
+            ly_paths = set([job[0]])
+            key = job[1:3]
+            for other_job in list(self._jobs):
+                if len(batch) == self.batch_size:
+                    break
+                if other_job[1:3] != key or other_job[0] in ly_paths:
+                    continue
+                self._jobs.remove(other_job)
+                batch.append(other_job)
+                ly_paths.add(other_job[0])
+            return batch
+
+    def _make_results(
+        self,
+        ly_paths,
+        stdout,
+        stderr,
+        exit_code,
+        start_time,
+        elapsed_time,
+        previous_stats,
+        ):
+        import abjad
+        preamble, logs, log = [], {}, None
+        for line in stderr.splitlines(True):
+            if self._failed_files_regex.match(line):
+                continue
+            match = self._processing_regex.match(line)
+            if match is not None:
+                path = os.path.abspath(match.group(1))
+                log = logs.setdefault(path, [])
+            if log is None:
+                preamble.append(line)
+            else:
+                log.append(line)
+        failed_paths = None
+        match = self._failed_files_regex.search(stderr)
+        if match is not None:
+            failed_paths = shlex.split(match.group(1))
+            failed_paths = set(os.path.abspath(_) for _ in failed_paths)
+        results = []
+        for ly_path, previous_stats_ in zip(ly_paths, previous_stats):
+            job_stderr = ''.join(preamble + logs.get(ly_path, []))
+            if failed_paths is not None:
+                job_exit_code = int(ly_path in failed_paths)
+            elif ly_path in logs:
+                job_exit_code = exit_code
+            else:
+                job_exit_code = exit_code or 1
+            log = stdout + job_stderr
+            log_file_path = abjad.IOManager._write_lilypond_log(ly_path, log)
+            output_paths = abjad.IOManager._find_lilypond_output_paths(
+                ly_path,
+                start_time,
+                previous_stats=previous_stats_,
+                )
+            result = abjad.LilyPondRenderResult(
+                ly_path=ly_path,
+                exit_code=job_exit_code,
+                log=log,
+                elapsed_time=elapsed_time,
+                log_file_path=log_file_path,
+                output_paths=output_paths,
+                stderr=job_stderr,
+                stdout=stdout,
+                )
+            results.append(result)
+        return results
+
+    def _render(self, batch):
+        import abjad
+        jobs = [_ for _ in batch if _[3].set_running_or_notify_cancel()]
+        if not jobs:
+            return
+        ly_paths = [_[0] for _ in jobs]
+        flags, directory = jobs[0][1:3]
+        command = [self._get_lilypond_path()]
+        command.extend(shlex.split(flags))
+        command.extend(['-dno-point-and-click', '-o', directory])
+        command.extend(ly_paths)
+        try:
+            previous_stats = [
+                abjad.IOManager._get_lilypond_output_stats(_)
+                for _ in ly_paths
+                ]
+            start_time = time.time()
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                )
+            stdout, stderr = process.communicate()
+            elapsed_time = time.time() - start_time
+            for ly_path in ly_paths:
+                postscript_path = os.path.splitext(ly_path)[0] + '.ps'
+                try:
+                    os.remove(postscript_path)
+                except OSError:
+                    pass
+            results = self._make_results(
+                ly_paths,
+                stdout.decode('utf-8', 'replace'),
+                stderr.decode('utf-8', 'replace'),
+                process.returncode,
+                start_time,
+                elapsed_time,
+                previous_stats,
+                )
+        except Exception as e:
+            for job in jobs:
+                job[3].set_exception(e)
+            return
+        for job, result in zip(jobs, results):
+            job[3].set_result(result)
+
+    def _start_workers(self):
+        while len(self._workers) < self.worker_count:
+            worker = threading.Thread(target=self._work)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            batch = self._get_next_batch()
+            if batch is None:
+                return
+            self._render(batch)
+
+    ### PUBLIC METHODS ###
+
+    def render(self, ly_path, flags=None):
+        r'''Renders `ly_path` and waits for result.
+
+        Returns LilyPond render result.
+        '''
+        return self.submit(ly_path, flags=flags).result()
+
+    def shutdown(self):
+        r'''Renders queued jobs and stops workers.
+
+        Server restarts workers at next submission.
+
+        Returns none.
+        '''
+        with self._condition:
+            self._is_shut_down = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+        with self._condition:
+            self._workers = []
+            self._is_shut_down = False
+
+    def submit(self, ly_path, flags=None):
+        r'''Queues `ly_path` for rendering with LilyPond `flags`.
+
+        LilyPond writes output next to `ly_path`.
+
+        Returns future of LilyPond render result.
+        '''
+        ly_path = os.path.abspath(os.path.expanduser(str(ly_path)))
+        flags = flags or ''
+        directory = os.path.dirname(ly_path)
+        future = concurrent.futures.Future()
+        with self._condition:
+            self._jobs.append((ly_path, flags, directory, future))
+            self._start_workers()
+            self._condition.notify()
+        return future
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def batch_size(self):
+        r'''Gets maximum number of files rendered by one LilyPond process.
+
+        Returns positive integer.
+        '''
+        return self._batch_size
+
+    @property
+    def lilypond_path(self):
+        r'''Gets LilyPond executable of server.
+
+        Uses Abjad configuration or ``lilypond`` on path when none.
+
+        Returns string or none.
+        '''
+        return self._lilypond_path
+
+    @property
+    def worker_count(self):
+        r'''Gets number of LilyPond processes server runs at once.
+
+        Returns positive integer.
+        '''
+        return self._worker_count
@@ -1,7 +1,9 @@
 import os
 import re
 import shutil
+import sys
 import tempfile
+import uuid
 from abjad.tools import abctools
 
 
@@ -31,6 +33,112 @@ class PersistenceManager(abctools.AbjadObject):
     def __init__(self, client=None):
         self._client = client
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_ly_file_path(file_path):
+        if file_path is None:
+            return None
+        file_path = os.path.expanduser(str(file_path))
+        without_extension = os.path.splitext(file_path)[0]
+        return '{}.ly'.format(without_extension)
+
+    @staticmethod
+    def _get_midi_file_path(ly_file_path):
+        if os.name == 'nt':
+            extension = 'mid'
+        else:
+            extension = 'midi'
+        return '{}.{}'.format(os.path.splitext(ly_file_path)[0], extension)
+
+    def _move_png_files(self, ly_file_path, directory):
+        source_directory, file_name = os.path.split(ly_file_path)
+        base = os.path.splitext(file_name)[0]
+        png_file_paths = []
+        for file_name in os.listdir(source_directory):
+            if not file_name.endswith('.png'):
+                continue
+            if (
+                file_name != base + '.png' and
+                not file_name.startswith(base + '-page')
+                ):
+                continue
+            source_png_file_path = os.path.join(source_directory, file_name)
+            target_png_file_path = os.path.join(directory, file_name)
+            shutil.move(source_png_file_path, target_png_file_path)
+            png_file_paths.append(target_png_file_path)
+        if 1 < len(png_file_paths):
+            png_file_paths.sort(
+                key=lambda x: int(self._png_page_pattern.match(x).groups()[0]),
+                )
+        return tuple(png_file_paths)
+
+    @staticmethod
+    def _run_lilypond(
+        ly_file_path,
+        flags=None,
+        render_cache=None,
+        render_server=None,
+        ):
+        from abjad.tools import systemtools
+        if render_cache is not None:
+            if render_server is None:
+                lilypond_path = systemtools.IOManager._find_lilypond_path()
+            else:
+                lilypond_path = render_server._get_lilypond_path()
+            key = render_cache.get_key(ly_file_path, flags, lilypond_path)
+            if render_cache.fetch(key, ly_file_path) is not None:
+                return True
+        if render_server is None:
+            result = systemtools.IOManager.run_lilypond(
+                ly_file_path,
+                flags=flags,
+                )
+        else:
+            result = render_server.render(ly_file_path, flags=flags)
+        success = result.success
+        if render_cache is not None and success:
+            render_cache.store(key, result)
+        return success
+
+    def _write_midi_ly(self, midi_file_path=None, **keywords):
+        from abjad.tools import lilypondfiletools
+        assert hasattr(self._client, '__illustrate__')
+        illustration = self._client.__illustrate__(**keywords)
+        assert hasattr(illustration, 'score_block')
+        block = lilypondfiletools.Block(name='midi')
+        illustration.score_block.items.append(block)
+        ly_file_path = self._get_ly_file_path(midi_file_path)
+        return type(self)(illustration).as_ly(ly_file_path, **keywords)
+
+    def _write_pdf_ly(
+        self,
+        pdf_file_path=None,
+        illustrate_function=None,
+        **keywords
+        ):
+        if illustrate_function is None:
+            assert hasattr(self._client, '__illustrate__'), repr(self._client)
+        return self.as_ly(
+            self._get_ly_file_path(pdf_file_path),
+            illustrate_function=illustrate_function,
+            **keywords
+            )
+
+    def _write_png_ly(
+        self,
+        png_file_path=None,
+        illustrate_function=None,
+        **keywords
+        ):
+        if illustrate_function is None:
+            assert hasattr(self._client, '__illustrate__')
+        return self.as_ly(
+            self._get_ly_file_path(png_file_path),
+            illustrate_function=illustrate_function,
+            **keywords
+            )
+
     ### PUBLIC METHODS ###
 
     def as_ly(
@@ -38,6 +146,7 @@ class PersistenceManager(abctools.AbjadObject):
         ly_file_path=None,
         illustrate_function=None,
         strict=False,
+        workers=None,
         **keywords
         ):
         r'''Persists client as LilyPond file.
@@ -53,6 +162,15 @@ class PersistenceManager(abctools.AbjadObject):
             '/Users/josiah/Desktop/test.ly'
             0.04491996765136719
 
+        Writes LilyPond files to disk line by line as they format; elapsed
+        formatting time then includes time spent writing. Writes to temporary
+        file next to `ly_file_path` and replaces `ly_file_path` only when
+        formatting succeeds.
+
+        Set `workers` to an integer greater than 1 to format the staves of
+        simultaneous containers in that many processes. Output is the same
+        as serial output.
+
         Returns output path and elapsed formatting time when LilyPond output is
         written.
         '''
@@ -71,7 +189,30 @@ class PersistenceManager(abctools.AbjadObject):
             ly_file_path = str(ly_file_path)
             ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith('.ly'), ly_file_path
+        directory = os.path.dirname(ly_file_path)
+        abjad.IOManager._ensure_directory_existence(directory)
         timer = abjad.Timer()
+        if isinstance(lilypond_file, abjad.LilyPondFile):
+            # stream format to file without building whole string
+            temporary_path = '{}.{}.tmp'.format(
+                ly_file_path,
+                uuid.uuid4().hex,
+                )
+            try:
+                with open(temporary_path, 'x') as file_pointer:
+                    with timer:
+                        lilypond_file._write_lilypond_format(
+                            file_pointer,
+                            strict=strict,
+                            workers=workers,
+                            )
+                os.replace(temporary_path, ly_file_path)
+            except BaseException:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+                raise
+            abjad_formatting_time = timer.elapsed_time
+            return ly_file_path, abjad_formatting_time
         with timer:
             format_specification = 'lilypond'
             if strict:
@@ -80,13 +221,18 @@ class PersistenceManager(abctools.AbjadObject):
                 format_specification=format_specification
                 )
         abjad_formatting_time = timer.elapsed_time
-        directory = os.path.dirname(ly_file_path)
-        abjad.IOManager._ensure_directory_existence(directory)
         with open(ly_file_path, 'w') as file_pointer:
             file_pointer.write(string)
         return ly_file_path, abjad_formatting_time
 
-    def as_midi(self, midi_file_path=None, remove_ly=False, **keywords):
+    def as_midi(
+        self,
+        midi_file_path=None,
+        remove_ly=False,
+        render_cache=None,
+        render_server=None,
+        **keywords
+        ):
         r'''Persists client as MIDI file.
 
         Autogenerates file path when `midi_file_path` is none.
@@ -101,36 +247,25 @@ class PersistenceManager(abctools.AbjadObject):
             0.07831692695617676
             1.0882699489593506
 
+        Renders with `render_server` when `render_server` is not none.
+        Copies output from `render_cache` when `render_cache` is not none and
+        contains output for same LilyPond input.
+
         Returns output path, elapsed formatting time and elapsed rendering
         time.
         '''
-        from abjad.tools import lilypondfiletools
         from abjad.tools import systemtools
-        assert hasattr(self._client, '__illustrate__')
-        illustration = self._client.__illustrate__(**keywords)
-        assert hasattr(illustration, 'score_block')
-        block = lilypondfiletools.Block(name='midi')
-        illustration.score_block.items.append(block)
-        if midi_file_path is not None:
-            midi_file_path = os.path.expanduser(midi_file_path)
-            without_extension = os.path.splitext(midi_file_path)[0]
-            ly_file_path = '{}.ly'.format(without_extension)
-        else:
-            ly_file_path = None
-        result = type(self)(illustration).as_ly(ly_file_path, **keywords)
+        result = self._write_midi_ly(midi_file_path, **keywords)
         ly_file_path, abjad_formatting_time = result
         timer = systemtools.Timer()
         with timer:
-            systemtools.IOManager.run_lilypond(ly_file_path)
+            self._run_lilypond(
+                ly_file_path,
+                render_cache=render_cache,
+                render_server=render_server,
+                )
         lilypond_rendering_time = timer.elapsed_time
-        if os.name == 'nt':
-            extension = 'mid'
-        else:
-            extension = 'midi'
-        midi_file_path = '{}.{}'.format(
-            os.path.splitext(ly_file_path)[0],
-            extension,
-            )
+        midi_file_path = self._get_midi_file_path(ly_file_path)
         if remove_ly:
             os.remove(ly_file_path)
         return midi_file_path, abjad_formatting_time, lilypond_rendering_time
@@ -185,7 +320,10 @@ class PersistenceManager(abctools.AbjadObject):
         pdf_file_path=None,
         illustrate_function=None,
         remove_ly=False,
+        render_cache=None,
+        render_server=None,
         strict=False,
+        workers=None,
         **keywords
         ):
         r'''Persists client as PDF.
@@ -202,23 +340,19 @@ class PersistenceManager(abctools.AbjadObject):
             0.047142982482910156
             0.7839350700378418
 
+        Renders with `render_server` when `render_server` is not none.
+        Copies output from `render_cache` when `render_cache` is not none and
+        contains output for same LilyPond input.
+
         Returns output path, elapsed formatting time and elapsed rendering
         time when PDF output is written.
         '''
         from abjad.tools import systemtools
-        if illustrate_function is None:
-            assert hasattr(self._client, '__illustrate__'), repr(self._client)
-        if pdf_file_path is not None:
-            pdf_file_path = str(pdf_file_path)
-            pdf_file_path = os.path.expanduser(pdf_file_path)
-            without_extension = os.path.splitext(pdf_file_path)[0]
-            ly_file_path = '{}.ly'.format(without_extension)
-        else:
-            ly_file_path = None
-        result = self.as_ly(
-            ly_file_path,
+        result = self._write_pdf_ly(
+            pdf_file_path,
             illustrate_function=illustrate_function,
             strict=strict,
+            workers=workers,
             **keywords
             )
         ly_file_path, abjad_formatting_time = result
@@ -226,7 +360,11 @@ class PersistenceManager(abctools.AbjadObject):
         pdf_file_path = '{}.pdf'.format(without_extension)
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(ly_file_path)
+            success = self._run_lilypond(
+                ly_file_path,
+                render_cache=render_cache,
+                render_server=render_server,
+                )
         lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
@@ -242,6 +380,8 @@ class PersistenceManager(abctools.AbjadObject):
         png_file_path=None,
         remove_ly=False,
         illustrate_function=None,
+        render_cache=None,
+        render_server=None,
         **keywords
         ):
         r'''Persists client as PNG.
@@ -276,69 +416,48 @@ class PersistenceManager(abctools.AbjadObject):
 
         Autogenerates file path when `png_file_path` is none.
 
+        Renders with `render_server` when `render_server` is not none.
+        Copies output from `render_cache` when `render_cache` is not none and
+        contains output for same LilyPond input.
+
         Returns output path(s), elapsed formatting time and elapsed rendering
         time.
         '''
         from abjad.tools import systemtools
-        if illustrate_function is None:
-            assert hasattr(self._client, '__illustrate__')
-        if png_file_path is not None:
-            png_file_path = os.path.expanduser(png_file_path)
-            without_extension = os.path.splitext(png_file_path)[0]
-            ly_file_path = '{}.ly'.format(without_extension)
-        else:
-            ly_file_path = None
-        result = self.as_ly(
-            ly_file_path,
+        result = self._write_png_ly(
+            png_file_path,
             illustrate_function=illustrate_function,
             **keywords
             )
-
         ly_file_path, abjad_formatting_time = result
-
-        original_directory = os.path.split(ly_file_path)[0]
-        original_ly_file_path = ly_file_path
         temporary_directory = tempfile.mkdtemp()
         temporary_ly_file_path = os.path.join(
             temporary_directory,
             os.path.split(ly_file_path)[1],
             )
-        shutil.copy(original_ly_file_path, temporary_ly_file_path)
+        shutil.copy(ly_file_path, temporary_ly_file_path)
 
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(
+            success = self._run_lilypond(
                 temporary_ly_file_path,
                 flags='--png',
+                render_cache=render_cache,
+                render_server=render_server,
                 )
         lilypond_rendering_time = timer.elapsed_time
 
-        png_file_paths = []
-        for file_name in os.listdir(temporary_directory):
-            if not file_name.endswith('.png'):
-                continue
-            source_png_file_path = os.path.join(
-                temporary_directory,
-                file_name,
-                )
-            target_png_file_path = os.path.join(
-                original_directory,
-                file_name,
-                )
-            shutil.move(source_png_file_path, target_png_file_path)
-            png_file_paths.append(target_png_file_path)
+        png_file_paths = self._move_png_files(
+            temporary_ly_file_path,
+            os.path.split(ly_file_path)[0],
+            )
         shutil.rmtree(temporary_directory)
 
         if remove_ly:
             os.remove(ly_file_path)
 
-        if 1 < len(png_file_paths):
-            png_file_paths.sort(
-                key=lambda x: int(self._png_page_pattern.match(x).groups()[0]),
-                )
-
         return (
-            tuple(png_file_paths),
+            png_file_paths,
             abjad_formatting_time,
             lilypond_rendering_time,
             success,
@@ -353,3 +472,12 @@ class PersistenceManager(abctools.AbjadObject):
         Returns component or selection.
         '''
         return self._client
+
+
+if sys.version_info >= (3, 5):
+    from abjad.tools.systemtools import _coroutines
+    PersistenceManager._run_lilypond_async = staticmethod(
+        _coroutines._run_lilypond_async)
+    PersistenceManager.as_midi_async = _coroutines.as_midi_async
+    PersistenceManager.as_pdf_async = _coroutines.as_pdf_async
+    PersistenceManager.as_png_async = _coroutines.as_png_async
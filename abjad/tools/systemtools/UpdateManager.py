@@ -47,6 +47,15 @@ class UpdateManager(AbjadObject):
             )
         return components
 
+    @staticmethod
+    def _set_offsets(component, start_offset, stop_offset):
+        # effective indicator index caches offsets of wrappers in subtree
+        component._effective_indicator_index = None
+        component._start_offset = start_offset
+        component._stop_offset = stop_offset
+        component._timespan._start_offset = start_offset
+        component._timespan._stop_offset = stop_offset
+
     def _update_all_indicators(self, score_root):
         r'''Updating indicators does not update offsets.
         On the other hand, getting an effective indicator does update
@@ -61,64 +70,11 @@ class UpdateManager(AbjadObject):
                     indicator._update_effective_context()
             component._indicators_are_current = True
 
-    @staticmethod
-    def _update_all_leaf_indices_and_measure_numbers(score_root):
-        r'''Call only when updating offsets.
-        No separate state flags exist for leaf indices or measure numbers.
-        '''
-        from abjad.tools import scoretools
-        from abjad.tools.topleveltools import iterate
-        if isinstance(score_root, scoretools.Context):
-            contexts = iterate(score_root).components(scoretools.Context)
-            for context in contexts:
-                for leaf_index, leaf in enumerate(iterate(context).leaves()):
-                    leaf._leaf_index = leaf_index
-                for measure_index, measure in enumerate(
-                    iterate(context).components(scoretools.Measure)):
-                    measure_number = measure_index + 1
-                    measure._measure_number = measure_number
-        else:
-            for leaf_index, leaf in enumerate(iterate(score_root).leaves()):
-                leaf._leaf_index = leaf_index
-            for measure_index, measure in enumerate(
-                iterate(score_root).components(scoretools.Measure)):
-                measure_number = measure_index + 1
-                measure._measure_number = measure_number
-
-    def _update_all_offsets(self, score_root):
-        r'''Updating offsets does not update indicators.
-        Updating offsets does not update offsets in seconds.
-        '''
-        for component in self._iterate_entire_score(score_root):
-            self._update_component_offsets(component)
-            component._offsets_are_current = True
-
     def _update_all_offsets_in_seconds(self, score_root):
         for component in self._iterate_entire_score(score_root):
             self._update_component_offsets_in_seconds(component)
             component._offsets_in_seconds_are_current = True
 
-    @classmethod
-    def _update_component_offsets(class_, component):
-        import abjad
-        if isinstance(component._parent, abjad.GraceContainer):
-            pair = class_._get_grace_note_offsets(component)
-            start_offset, stop_offset = pair
-        elif isinstance(component._parent, abjad.AfterGraceContainer):
-            pair = class_._get_after_grace_note_offsets(component)
-            start_offset, stop_offset = pair
-        else:
-            previous = component._get_nth_component_in_time_order_from(-1)
-            if previous is not None:
-                start_offset = previous._stop_offset
-            else:
-                start_offset = abjad.Offset(0)
-            stop_offset = start_offset + component._get_duration()
-        component._start_offset = start_offset
-        component._stop_offset = stop_offset
-        component._timespan._start_offset = start_offset
-        component._timespan._stop_offset = stop_offset
-
     @staticmethod
     def _update_component_offsets_in_seconds(component):
         import abjad
@@ -140,6 +96,75 @@ class UpdateManager(AbjadObject):
         except MissingMetronomeMarkError:
             pass
 
+    def _update_dirty_offsets(self, score_root):
+        r'''Updates start offsets, stop offsets, leaf indices and measure
+        numbers of components marked stale since the last update.
+
+        Walks score once depth first, carrying running offset, prolation
+        and leaf and measure counts down the stack. Skips clean subtrees
+        whose start offset, leaf index and measure number are unchanged.
+        Update cost is therefore linear in the size of the score when
+        everything is stale and grows with the size of the edit otherwise.
+
+        Leaf indices and measure numbers count from the innermost context
+        when score root is a context; otherwise they count from score root.
+        '''
+        import abjad
+        root_is_context = isinstance(score_root, abjad.Context)
+        self._update_subtree_offsets(
+            score_root,
+            abjad.Offset(0),
+            abjad.Multiplier(1),
+            [0, 0],
+            (0, 0),
+            root_is_context,
+            )
+
+    def _update_grace_container_offsets(
+        self,
+        grace_container,
+        anchor_offset,
+        counts,
+        bases,
+        root_is_context,
+        ):
+        r'''Grace notes end at `anchor_offset` and are displaced by their
+        written durations.
+        '''
+        import abjad
+        grace_displacement = -sum(
+            [_.written_duration for _ in grace_container],
+            abjad.Duration(0),
+            )
+        # grace container itself keeps offsets relative to zero
+        self._set_offsets(
+            grace_container,
+            abjad.Offset(0),
+            abjad.Offset(-grace_displacement),
+            )
+        grace_container._offsets_are_current = True
+        for leaf in grace_container:
+            start_offset = abjad.Offset(
+                anchor_offset,
+                grace_displacement=grace_displacement,
+                )
+            grace_displacement += leaf.written_duration
+            stop_offset = abjad.Offset(
+                anchor_offset,
+                grace_displacement=grace_displacement,
+                )
+            self._set_offsets(leaf, start_offset, stop_offset)
+            leaf._leaf_index = counts[0] - bases[0]
+            leaf._offsets_are_current = True
+            leaf._update_state = (
+                root_is_context,
+                counts[0] - bases[0],
+                counts[1] - bases[1],
+                1,
+                0,
+                )
+            counts[0] += 1
+
     def _update_now(
         self,
         component,
@@ -165,60 +190,112 @@ class UpdateManager(AbjadObject):
             ) = self._get_score_tree_state_flags(parentage)
         score_root = parentage.root
         if offsets and not offsets_are_current:
-            self._update_all_offsets(score_root)
-            self._update_all_leaf_indices_and_measure_numbers(score_root)
+            self._update_dirty_offsets(score_root)
         if offsets_in_seconds and not offsets_in_seconds_are_current:
             self._update_all_offsets_in_seconds(score_root)
         if indicators and not indicators_are_current:
             self._update_all_indicators(score_root)
             self._update_all_offsets_in_seconds(score_root)
 
-    ### EXPERIMENTAL ###
+    def _update_subtree_offsets(
+        self,
+        component,
+        start_offset,
+        prolation,
+        counts,
+        bases,
+        root_is_context,
+        force=False,
+        ):
+        r'''Updates `component` and returns stop offset of `component`.
 
-    @staticmethod
-    def _get_after_grace_note_offsets(grace_note):
+        `prolation` is product of implied prolations of parents of
+        `component`; `counts` is a mutable pair of leaves and measures
+        counted so far; `bases` gives the counts at which the innermost
+        counting context started.
+        '''
         import abjad
-        after_grace_container = grace_note._parent
-        assert isinstance(after_grace_container, abjad.AfterGraceContainer)
-        carrier_leaf = after_grace_container._carrier
-        carrier_leaf_stop_offset = carrier_leaf._stop_offset
-        grace_displacement = -grace_note.written_duration
-        sibling = grace_note._get_sibling(1)
-        while sibling is not None:
-            grace_displacement -= sibling.written_duration
-            sibling = sibling._get_sibling(1)
-        start_offset = abjad.Offset(
-            carrier_leaf_stop_offset,
-            grace_displacement=grace_displacement,
+        is_counting_context = (
+            root_is_context and isinstance(component, abjad.Context)
             )
-        grace_displacement += grace_note.written_duration
-        stop_offset = abjad.Offset(
-            carrier_leaf_stop_offset,
-            grace_displacement=grace_displacement,
+        leaf_start = counts[0] - bases[0]
+        measure_start = counts[1] - bases[1]
+        state = component._update_state
+        if (not force and
+            state is not None and
+            component._offsets_are_current and
+            component._start_offset == start_offset and
+            state[0] == root_is_context and
+            (is_counting_context or state[1:3] == (leaf_start, measure_start))
+            ):
+            counts[0] += state[3]
+            counts[1] += state[4]
+            return component._stop_offset
+        initial_counts = tuple(counts)
+        if is_counting_context:
+            bases = initial_counts
+        if isinstance(component, abjad.Measure):
+            counts[1] += 1
+            component._measure_number = counts[1] - bases[1]
+        if isinstance(component, abjad.Leaf):
+            duration = prolation * component._get_preprolated_duration()
+            stop_offset = start_offset + duration
+            self._set_offsets(component, start_offset, stop_offset)
+            if component._grace_container is not None:
+                self._update_grace_container_offsets(
+                    component._grace_container,
+                    start_offset,
+                    counts,
+                    bases,
+                    root_is_context,
+                    )
+            component._leaf_index = counts[0] - bases[0]
+            counts[0] += 1
+            if component._after_grace_container is not None:
+                self._update_grace_container_offsets(
+                    component._after_grace_container,
+                    stop_offset,
+                    counts,
+                    bases,
+                    root_is_context,
+                    )
+        elif isinstance(component, abjad.Container):
+            implied_prolation = getattr(component, 'implied_prolation', None)
+            # prolation of tuplet or measure may have changed
+            force_children = force or (
+                implied_prolation is not None and
+                not component._offsets_are_current
+                )
+            if implied_prolation is not None:
+                prolation = prolation * implied_prolation
+            # stop offset of container derives from stop offsets of children
+            stop_offset = offset = start_offset
+            for child in component:
+                child_stop_offset = self._update_subtree_offsets(
+                    child,
+                    offset,
+                    prolation,
+                    counts,
+                    bases,
+                    root_is_context,
+                    force=force_children,
+                    )
+                if component.is_simultaneous:
+                    stop_offset = max(stop_offset, child_stop_offset)
+                else:
+                    stop_offset = offset = child_stop_offset
+            self._set_offsets(component, start_offset, stop_offset)
+        component._offsets_are_current = True
+        component._update_state = (
+            root_is_context,
+            leaf_start,
+            measure_start,
+            counts[0] - initial_counts[0],
+            counts[1] - initial_counts[1],
             )
-        return start_offset, stop_offset
+        return component._stop_offset
 
-    @staticmethod
-    def _get_grace_note_offsets(grace_note):
-        import abjad
-        grace_container = grace_note._parent
-        carrier_leaf = grace_container._carrier
-        carrier_leaf_start_offset = carrier_leaf._start_offset
-        grace_displacement = -grace_note.written_duration
-        sibling = grace_note._get_sibling(1)
-        while sibling is not None:
-            grace_displacement -= sibling.written_duration
-            sibling = sibling._get_sibling(1)
-        start_offset = abjad.Offset(
-            carrier_leaf_start_offset,
-            grace_displacement=grace_displacement,
-            )
-        grace_displacement += grace_note.written_duration
-        stop_offset = abjad.Offset(
-            carrier_leaf_start_offset,
-            grace_displacement=grace_displacement,
-            )
-        return start_offset, stop_offset
+    ### EXPERIMENTAL ###
 
     def _get_measure_start_offsets(self, component):
         import abjad
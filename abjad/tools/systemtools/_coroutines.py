@@ -0,0 +1,297 @@
+# Coroutines of IOManager and PersistenceManager. Uses Python 3.5 syntax;
+# IOManager and PersistenceManager import module only on Python 3.5 and
+# later.
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+
+async def run_lilypond_async(
+    ly_path,
+    flags=None,
+    lilypond_path=None,
+    semaphore=None,
+    ):
+    r'''Runs LilyPond on `ly_path` without blocking event loop.
+
+    ..  container:: example
+
+        >>> import asyncio
+        >>> semaphore = asyncio.Semaphore(2)
+        >>> coroutines = [ # doctest: +SKIP
+        ...     abjad.IOManager.run_lilypond_async(_, semaphore=semaphore)
+        ...     for _ in ly_paths
+        ...     ]
+        >>> loop = asyncio.get_event_loop() # doctest: +SKIP
+        >>> results = loop.run_until_complete( # doctest: +SKIP
+        ...     asyncio.gather(*coroutines)
+        ...     )
+
+    Runs no more LilyPond processes at once than `semaphore` allows.
+    Shares one semaphore with one slot for each CPU across event loop
+    when `semaphore` is none.
+
+    Kills LilyPond when caller cancels task.
+
+    Captures and logs LilyPond output like ``run_lilypond()``.
+
+    Returns LilyPond render result.
+    '''
+    from abjad.tools import systemtools
+    IOManager = systemtools.IOManager
+    ly_path = str(ly_path)
+    command = IOManager._make_lilypond_command(
+        ly_path,
+        flags,
+        lilypond_path,
+        )
+    if semaphore is None:
+        semaphore = IOManager._get_lilypond_semaphore()
+    async with semaphore:
+        previous_stats = IOManager._get_lilypond_output_stats(ly_path)
+        start_time = time.time()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+                )
+        except OSError as e:
+            stdout, stderr, exit_code = b'', str(e).encode('utf-8'), 127
+        else:
+            try:
+                stdout, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                try:
+                    process.kill()
+                except OSError:
+                    pass
+                await process.wait()
+                raise
+            exit_code = process.returncode
+        elapsed_time = time.time() - start_time
+    return IOManager._make_lilypond_result(
+        ly_path,
+        stdout,
+        stderr,
+        exit_code,
+        start_time,
+        elapsed_time,
+        previous_stats=previous_stats,
+        )
+
+
+async def _run_lilypond_async(
+    ly_file_path,
+    flags=None,
+    render_cache=None,
+    render_server=None,
+    semaphore=None,
+    ):
+    from abjad.tools import systemtools
+    if render_cache is not None:
+        if render_server is None:
+            lilypond_path = systemtools.IOManager._find_lilypond_path()
+        else:
+            lilypond_path = render_server._get_lilypond_path()
+        key = render_cache.get_key(ly_file_path, flags, lilypond_path)
+        if render_cache.fetch(key, ly_file_path) is not None:
+            return systemtools.LilyPondRenderResult(
+                ly_path=ly_file_path,
+                exit_code=0,
+                log='',
+                elapsed_time=0.0,
+                )
+    if render_server is None:
+        result = await systemtools.IOManager.run_lilypond_async(
+            ly_file_path,
+            flags=flags,
+            semaphore=semaphore,
+            )
+    else:
+        future = render_server.submit(ly_file_path, flags=flags)
+        result = await asyncio.wrap_future(future)
+    if render_cache is not None and result.success:
+        render_cache.store(key, result)
+    return result
+
+
+async def as_midi_async(
+    self,
+    midi_file_path=None,
+    remove_ly=False,
+    render_cache=None,
+    render_server=None,
+    semaphore=None,
+    **keywords
+    ):
+    r'''Persists client as MIDI file without blocking event loop while
+    LilyPond renders.
+
+    ..  container:: example
+
+        >>> import asyncio
+        >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
+        >>> loop = asyncio.get_event_loop() # doctest: +SKIP
+        >>> result = loop.run_until_complete( # doctest: +SKIP
+        ...     abjad.persist(staff).as_midi_async()
+        ...     )
+
+    Formats client in event loop thread. Runs no more LilyPond processes
+    at once than `semaphore` allows and kills LilyPond when caller
+    cancels task; see ``IOManager.run_lilypond_async()``.
+
+    Takes other keywords like ``as_midi()``.
+
+    Returns output path, elapsed formatting time and elapsed rendering
+    time.
+    '''
+    result = self._write_midi_ly(midi_file_path, **keywords)
+    ly_file_path, abjad_formatting_time = result
+    result = await self._run_lilypond_async(
+        ly_file_path,
+        render_cache=render_cache,
+        render_server=render_server,
+        semaphore=semaphore,
+        )
+    midi_file_path = self._get_midi_file_path(ly_file_path)
+    if remove_ly:
+        os.remove(ly_file_path)
+    return midi_file_path, abjad_formatting_time, result.elapsed_time
+
+
+async def as_pdf_async(
+    self,
+    pdf_file_path=None,
+    illustrate_function=None,
+    remove_ly=False,
+    render_cache=None,
+    render_server=None,
+    semaphore=None,
+    strict=False,
+    workers=None,
+    **keywords
+    ):
+    r'''Persists client as PDF without blocking event loop while
+    LilyPond renders.
+
+    ..  container:: example
+
+        >>> import asyncio
+        >>> staves = [
+        ...     abjad.Staff("c'4 e'4 d'4 f'4"),
+        ...     abjad.Staff("d'4 f'4 e'4 g'4"),
+        ...     ]
+        >>> semaphore = asyncio.Semaphore(2)
+        >>> coroutines = [ # doctest: +SKIP
+        ...     abjad.persist(_).as_pdf_async(semaphore=semaphore)
+        ...     for _ in staves
+        ...     ]
+        >>> loop = asyncio.get_event_loop() # doctest: +SKIP
+        >>> results = loop.run_until_complete( # doctest: +SKIP
+        ...     asyncio.gather(*coroutines)
+        ...     )
+
+    Formats client in event loop thread. Runs no more LilyPond processes
+    at once than `semaphore` allows and kills LilyPond when caller
+    cancels task; see ``IOManager.run_lilypond_async()``.
+
+    Takes other keywords like ``as_pdf()``.
+
+    Returns output path, elapsed formatting time, elapsed rendering time
+    and success.
+    '''
+    result = self._write_pdf_ly(
+        pdf_file_path,
+        illustrate_function=illustrate_function,
+        strict=strict,
+        workers=workers,
+        **keywords
+        )
+    ly_file_path, abjad_formatting_time = result
+    without_extension = os.path.splitext(ly_file_path)[0]
+    pdf_file_path = '{}.pdf'.format(without_extension)
+    result = await self._run_lilypond_async(
+        ly_file_path,
+        render_cache=render_cache,
+        render_server=render_server,
+        semaphore=semaphore,
+        )
+    if remove_ly:
+        os.remove(ly_file_path)
+    return (
+        pdf_file_path,
+        abjad_formatting_time,
+        result.elapsed_time,
+        result.success,
+        )
+
+
+async def as_png_async(
+    self,
+    png_file_path=None,
+    remove_ly=False,
+    illustrate_function=None,
+    render_cache=None,
+    render_server=None,
+    semaphore=None,
+    **keywords
+    ):
+    r'''Persists client as PNG without blocking event loop while
+    LilyPond renders.
+
+    ..  container:: example
+
+        >>> import asyncio
+        >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
+        >>> loop = asyncio.get_event_loop() # doctest: +SKIP
+        >>> result = loop.run_until_complete( # doctest: +SKIP
+        ...     abjad.persist(staff).as_png_async()
+        ...     )
+
+    Formats client in event loop thread. Runs no more LilyPond processes
+    at once than `semaphore` allows and kills LilyPond when caller
+    cancels task; see ``IOManager.run_lilypond_async()``.
+
+    Takes other keywords like ``as_png()``.
+
+    Returns output path(s), elapsed formatting time, elapsed rendering
+    time and success.
+    '''
+    result = self._write_png_ly(
+        png_file_path,
+        illustrate_function=illustrate_function,
+        **keywords
+        )
+    ly_file_path, abjad_formatting_time = result
+    temporary_directory = tempfile.mkdtemp()
+    try:
+        temporary_ly_file_path = os.path.join(
+            temporary_directory,
+            os.path.split(ly_file_path)[1],
+            )
+        shutil.copy(ly_file_path, temporary_ly_file_path)
+        result = await self._run_lilypond_async(
+            temporary_ly_file_path,
+            flags='--png',
+            render_cache=render_cache,
+            render_server=render_server,
+            semaphore=semaphore,
+            )
+        png_file_paths = self._move_png_files(
+            temporary_ly_file_path,
+            os.path.split(ly_file_path)[0],
+            )
+    finally:
+        shutil.rmtree(temporary_directory)
+    if remove_ly:
+        os.remove(ly_file_path)
+    return (
+        png_file_paths,
+        abjad_formatting_time,
+        result.elapsed_time,
+        result.success,
+        )
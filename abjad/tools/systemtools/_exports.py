@@ -0,0 +1,39 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AbjadConfiguration',
+    'Batch',
+    'BatchPersistenceManager',
+    'BenchmarkScoreMaker',
+    'Configuration',
+    'FilesystemState',
+    'ForbidUpdate',
+    'FormatSpecification',
+    'IOManager',
+    'ImportManager',
+    'IndicatorWrapper',
+    'LilyPondFormatBundle',
+    'LilyPondFormatManager',
+    'LilyPondRenderCache',
+    'LilyPondRenderResult',
+    'LilyPondRenderServer',
+    'NullContextManager',
+    'PersistenceManager',
+    'ProgressIndicator',
+    'RedirectedStreams',
+    'Signature',
+    'SlotContributions',
+    'StorageFormatManager',
+    'StorageFormatSpecification',
+    'TemporaryDirectory',
+    'TemporaryDirectoryChange',
+    'TestCase',
+    'TestManager',
+    'Timer',
+    'UpdateManager',
+    'WellformednessManager',
+    'run_abjad',
+    )
+
+packages = ()
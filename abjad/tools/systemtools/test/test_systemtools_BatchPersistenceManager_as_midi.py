@@ -0,0 +1,21 @@
+import abjad
+import os
+
+
+def test_systemtools_BatchPersistenceManager_as_midi_01(lilypond_stub):
+    r'''Persists each client as MIDI file.
+    '''
+
+    staves = [abjad.Staff("c'4 d'4"), abjad.Staff("e'4 f'4")]
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        midi_paths = [
+            os.path.join(directory, 'test-{}.midi'.format(i))
+            for i in range(len(staves))
+            ]
+        results = abjad.persist_many(staves).as_midi(
+            midi_paths,
+            render_server=server,
+            )
+        assert [_[0] for _ in results] == midi_paths
+        assert all(os.path.isfile(_) for _ in midi_paths)
@@ -0,0 +1,87 @@
+import abjad
+import os
+
+
+def test_systemtools_BatchPersistenceManager_as_pdf_01(lilypond_stub):
+    r'''Persists each client as PDF and returns results in client order.
+    '''
+
+    staves = [abjad.Staff("c'4 d'4"), abjad.Staff("e'4 f'4")] * 3
+    server = abjad.LilyPondRenderServer(
+        lilypond_path=lilypond_stub,
+        worker_count=2,
+        )
+    with abjad.TemporaryDirectory() as directory, server:
+        pdf_paths = [
+            os.path.join(directory, 'test-{}.pdf'.format(i))
+            for i in range(len(staves))
+            ]
+        results = abjad.persist_many(staves).as_pdf(
+            pdf_paths,
+            remove_ly=True,
+            render_server=server,
+            )
+        assert len(results) == len(staves)
+        for staff, pdf_path, result in zip(staves, pdf_paths, results):
+            assert result[0] == pdf_path
+            assert isinstance(result[1], float)
+            assert isinstance(result[2], float)
+            assert result[3] is True
+            with open(pdf_path) as file_pointer:
+                assert format(staff[0]) in file_pointer.read()
+        assert sorted(os.listdir(directory)) == sorted(
+            os.path.basename(_) for _ in pdf_paths)
+
+
+def test_systemtools_BatchPersistenceManager_as_pdf_02(lilypond_stub):
+    r'''Reports failure of each client separately.
+    '''
+
+    staves = [
+        abjad.Staff("c'4 d'4"),
+        abjad.Staff("c'4 d'4", name='error'),
+        abjad.Staff("e'4 f'4"),
+        ]
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        pdf_paths = [
+            os.path.join(directory, 'test-{}.pdf'.format(i))
+            for i in range(len(staves))
+            ]
+        results = abjad.persist_many(staves).as_pdf(
+            pdf_paths,
+            render_server=server,
+            )
+
+    assert [_[3] for _ in results] == [True, False, True]
+
+
+def test_systemtools_BatchPersistenceManager_as_pdf_03(
+    lilypond_stub,
+    monkeypatch,
+    ):
+    r'''Makes LilyPond render server with `workers` LilyPond processes when
+    render server is none. Renders each file with its own LilyPond process.
+    '''
+
+    staves = [abjad.Staff("c'4 d'4"), abjad.Staff("e'4 f'4")] * 2
+    monkeypatch.setitem(
+        abjad.abjad_configuration._settings,
+        'lilypond_path',
+        lilypond_stub,
+        )
+    with abjad.TemporaryDirectory() as directory:
+        pdf_paths = [
+            os.path.join(directory, 'test-{}.pdf'.format(i))
+            for i in range(len(staves))
+            ]
+        results = abjad.persist_many(staves).as_pdf(pdf_paths, workers=2)
+        assert all(os.path.isfile(_) for _ in pdf_paths)
+
+    assert [_[0] for _ in results] == pdf_paths
+    assert all(_[3] for _ in results)
+    path = os.path.join(os.path.dirname(lilypond_stub), 'invocations.txt')
+    with open(path) as file_pointer:
+        invocations = file_pointer.read().splitlines()
+    assert len(invocations) == len(staves)
+    assert all(_.count('.ly') == 1 for _ in invocations)
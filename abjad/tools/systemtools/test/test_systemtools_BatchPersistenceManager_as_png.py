@@ -0,0 +1,26 @@
+import abjad
+import os
+
+
+def test_systemtools_BatchPersistenceManager_as_png_01(lilypond_stub):
+    r'''Persists clients with same file name in different directories.
+    '''
+
+    staves = [abjad.Staff("c'4 d'4"), abjad.Staff("e'4 f'4")]
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        png_paths = [
+            os.path.join(directory, 'a', 'test.png'),
+            os.path.join(directory, 'b', 'test.png'),
+            ]
+        for png_path in png_paths:
+            os.mkdir(os.path.dirname(png_path))
+        results = abjad.persist_many(staves).as_png(
+            png_paths,
+            render_server=server,
+            )
+        for staff, png_path, result in zip(staves, png_paths, results):
+            assert result[0] == (png_path,)
+            assert result[3] is True
+            with open(png_path) as file_pointer:
+                assert format(staff[0]) in file_pointer.read()
@@ -0,0 +1,125 @@
+import abjad
+import platform
+import pytest
+
+
+def test_systemtools_Batch___exit___01():
+    r'''Attaches queued indicators in order on exit.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with abjad.Batch(component=staff):
+        abjad.attach(abjad.Clef('alto'), staff[0])
+        abjad.attach(abjad.Dynamic('p'), staff[0])
+        abjad.attach(abjad.Dynamic('f'), staff[2])
+        assert not abjad.inspect(staff[0]).get_indicators()
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            \clef "alto"
+            c'8 \p
+            d'8
+            e'8 \f
+            f'8
+        }
+        '''
+        )
+    assert abjad.inspect(staff[3]).get_effective(abjad.Dynamic) == \
+        abjad.Dynamic('f')
+    assert not staff._is_forbidden_to_update
+
+
+def test_systemtools_Batch___exit___02():
+    r'''Raises same exception as unbatched attach.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    with pytest.raises(Exception) as unbatched_info:
+        abjad.attach(abjad.Clef('bass'), staff[0])
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with pytest.raises(Exception) as batched_info:
+        with abjad.Batch(component=staff):
+            abjad.attach(abjad.Clef('alto'), staff[0])
+            abjad.attach(abjad.Clef('bass'), staff[0])
+            abjad.attach(abjad.Dynamic('p'), staff[1])
+
+    assert str(batched_info.value) == str(unbatched_info.value)
+    assert abjad.inspect(staff[0]).get_indicators() == (abjad.Clef('alto'),)
+    assert not abjad.inspect(staff[1]).get_indicators()
+
+
+def test_systemtools_Batch___exit___03():
+    r'''Detaches queued indicators inside batch.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Articulation('>'), staff[0])
+    with abjad.Batch(component=staff):
+        abjad.attach(abjad.Articulation('.'), staff[0])
+        abjad.attach(abjad.Dynamic('p'), staff[1])
+        result = abjad.detach(abjad.Articulation, staff[0])
+        assert result == (abjad.Articulation('>'), abjad.Articulation('.'))
+        abjad.attach(abjad.Articulation('-'), staff[0])
+
+    assert abjad.inspect(staff[0]).get_indicators() == \
+        (abjad.Articulation('-'),)
+    assert abjad.inspect(staff[1]).get_indicators() == (abjad.Dynamic('p'),)
+
+
+def test_systemtools_Batch___exit___04():
+    r'''Inner batch hands queued indicators to outer batch.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with abjad.Batch(component=staff):
+        with abjad.Batch(component=staff):
+            abjad.attach(abjad.Dynamic('p'), staff[0])
+        assert staff._is_forbidden_to_update
+        assert not abjad.inspect(staff[0]).get_indicators()
+
+    assert abjad.inspect(staff[0]).get_indicators() == (abjad.Dynamic('p'),)
+
+
+def test_systemtools_Batch___exit___05():
+    r'''Discards queued indicators when block raises exception.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with pytest.raises(ZeroDivisionError):
+        with abjad.Batch(component=staff):
+            abjad.attach(abjad.Dynamic('p'), staff[0])
+            1 / 0
+
+    assert not abjad.inspect(staff[0]).get_indicators()
+    assert not staff._is_forbidden_to_update
+    abjad.attach(abjad.Dynamic('f'), staff[0])
+    assert abjad.inspect(staff[0]).get_indicators() == (abjad.Dynamic('f'),)
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_systemtools_Batch___exit___06():
+    r'''Cost of editing and attaching in batch is linear in number of notes.
+    '''
+
+    counts = []
+    for note_count in (20, 80):
+        staff = abjad.Staff(note_count * abjad.Note("c'8"))
+        abjad.inspect(staff).get_timespan()
+        count = abjad.IOManager.count_function_calls(
+            'with abjad.Batch(component=staff):\n'
+            '    for note in staff:\n'
+            '        note.written_duration = abjad.Duration(1, 16)\n'
+            '        abjad.attach(abjad.Dynamic("p"), note)\n',
+            globals(),
+            locals(),
+            fixed_point=False,
+            )
+        counts.append(count)
+
+    assert counts[1] < 5 * counts[0]
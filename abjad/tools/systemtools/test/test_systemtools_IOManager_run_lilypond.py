@@ -0,0 +1,123 @@
+import abjad
+import os
+import pytest
+import threading
+
+
+@pytest.fixture
+def output_directory(monkeypatch, tmpdir):
+    directory = str(tmpdir.mkdir('output'))
+    monkeypatch.setitem(
+        abjad.abjad_configuration._settings,
+        'abjad_output_directory',
+        directory,
+        )
+    return directory
+
+
+def _write_ly_file(directory, name, string="{ c'4 }"):
+    ly_path = os.path.join(directory, name + '.ly')
+    with open(ly_path, 'w') as file_pointer:
+        file_pointer.write(string)
+    return ly_path
+
+
+def test_systemtools_IOManager_run_lilypond_01(
+    lilypond_stub,
+    output_directory,
+    ):
+    r'''Returns exit code, output, output paths and log file path.
+    '''
+
+    ly_path = _write_ly_file(output_directory, 'test')
+    result = abjad.IOManager.run_lilypond(ly_path, lilypond_path=lilypond_stub)
+
+    assert result
+    assert result.exit_code == 0
+    assert result.ly_path == ly_path
+    assert result.output_paths == (ly_path[:-3] + '.pdf',)
+    assert result.stdout == ''
+    assert "Processing `{}'".format(ly_path) in result.stderr
+    assert result.log == result.stdout + result.stderr
+    assert 0 < result.elapsed_time
+    log_directory = abjad.abjad_configuration.lilypond_log_directory
+    assert os.path.dirname(result.log_file_path) == log_directory
+    with open(result.log_file_path) as file_pointer:
+        log = file_pointer.read()
+    assert log.endswith(result.log)
+    with open(abjad.abjad_configuration.lilypond_log_file_path) as file_pointer:
+        assert file_pointer.read() == log
+
+
+def test_systemtools_IOManager_run_lilypond_02(
+    lilypond_stub,
+    output_directory,
+    ):
+    r'''Returns false result when LilyPond fails.
+    '''
+
+    ly_path = _write_ly_file(output_directory, 'test', "{ c'4 error }")
+    result = abjad.IOManager.run_lilypond(ly_path, lilypond_path=lilypond_stub)
+
+    assert not result
+    assert result.exit_code == 1
+    assert result.output_paths == ()
+    assert 'error: syntax error' in result.stderr
+
+
+def test_systemtools_IOManager_run_lilypond_03(
+    lilypond_stub,
+    output_directory,
+    ):
+    r'''Keeps logs of concurrent runs separate.
+    '''
+
+    ly_paths = [
+        _write_ly_file(output_directory, 'test-{}'.format(i))
+        for i in range(8)
+        ]
+    results = [None] * len(ly_paths)
+
+    def render(i):
+        results[i] = abjad.IOManager.run_lilypond(
+            ly_paths[i],
+            lilypond_path=lilypond_stub,
+            )
+
+    threads = [
+        threading.Thread(target=render, args=(i,))
+        for i in range(len(ly_paths))
+        ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(_.log_file_path for _ in results)) == len(ly_paths)
+    for ly_path, result in zip(ly_paths, results):
+        assert result.success
+        with open(result.log_file_path) as file_pointer:
+            log = file_pointer.read()
+        assert log.count('Processing') == 1
+        assert "Processing `{}'".format(ly_path) in log
+
+
+def test_systemtools_IOManager_run_lilypond_04(
+    lilypond_stub,
+    monkeypatch,
+    output_directory,
+    ):
+    r'''Keeps most recent log files only.
+    '''
+
+    monkeypatch.setattr(abjad.IOManager, '_lilypond_log_count', 3)
+    ly_path = _write_ly_file(output_directory, 'test')
+    for _ in range(5):
+        result = abjad.IOManager.run_lilypond(
+            ly_path,
+            lilypond_path=lilypond_stub,
+            )
+
+    log_directory = abjad.abjad_configuration.lilypond_log_directory
+    assert len(os.listdir(log_directory)) == 3
+    assert os.path.basename(result.log_file_path) in os.listdir(log_directory)
@@ -0,0 +1,154 @@
+import abjad
+import asyncio
+import os
+import pytest
+import time
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+@pytest.fixture
+def output_directory(monkeypatch, tmpdir):
+    directory = str(tmpdir.mkdir('output'))
+    monkeypatch.setitem(
+        abjad.abjad_configuration._settings,
+        'abjad_output_directory',
+        directory,
+        )
+    return directory
+
+
+def _write_ly_file(directory, name, string="{ c'4 }"):
+    ly_path = os.path.join(directory, name + '.ly')
+    with open(ly_path, 'w') as file_pointer:
+        file_pointer.write(string)
+    return ly_path
+
+
+def test_systemtools_IOManager_run_lilypond_async_01(
+    lilypond_stub,
+    output_directory,
+    ):
+    r'''Returns same render result as synchronous run.
+    '''
+
+    ly_path = _write_ly_file(output_directory, 'test')
+    result = _run(abjad.IOManager.run_lilypond_async(
+        ly_path,
+        lilypond_path=lilypond_stub,
+        ))
+
+    assert result
+    assert result.exit_code == 0
+    assert result.ly_path == ly_path
+    assert result.output_paths == (ly_path[:-3] + '.pdf',)
+    assert "Processing `{}'".format(ly_path) in result.stderr
+    with open(result.log_file_path) as file_pointer:
+        assert file_pointer.read().endswith(result.log)
+
+    ly_path = _write_ly_file(output_directory, 'error', "{ c'4 error }")
+    result = _run(abjad.IOManager.run_lilypond_async(
+        ly_path,
+        lilypond_path=lilypond_stub,
+        ))
+
+    assert not result
+    assert result.output_paths == ()
+    assert 'error: syntax error' in result.stderr
+
+
+def test_systemtools_IOManager_run_lilypond_async_02(
+    lilypond_stub,
+    output_directory,
+    ):
+    r'''Runs no more LilyPond processes at once than semaphore allows.
+    '''
+
+    ly_paths = [
+        _write_ly_file(output_directory, 'test-{}'.format(i), '% sleep 0.3')
+        for i in range(4)
+        ]
+
+    async def render():
+        semaphore = asyncio.Semaphore(2)
+        return await asyncio.gather(*(
+            abjad.IOManager.run_lilypond_async(
+                _,
+                lilypond_path=lilypond_stub,
+                semaphore=semaphore,
+                )
+            for _ in ly_paths
+            ))
+
+    start_time = time.time()
+    results = _run(render())
+    elapsed_time = time.time() - start_time
+
+    assert [_.ly_path for _ in results] == ly_paths
+    assert all(results)
+    assert 0.6 <= elapsed_time
+
+
+def test_systemtools_IOManager_run_lilypond_async_03(
+    lilypond_stub,
+    monkeypatch,
+    output_directory,
+    ):
+    r'''Limits LilyPond processes with one semaphore for each event loop
+    when semaphore is none.
+    '''
+
+    monkeypatch.setattr(abjad.IOManager, '_lilypond_process_count', 1)
+    ly_paths = [
+        _write_ly_file(output_directory, 'test-{}'.format(i), '% sleep 0.3')
+        for i in range(2)
+        ]
+
+    async def render():
+        return await asyncio.gather(*(
+            abjad.IOManager.run_lilypond_async(_, lilypond_path=lilypond_stub)
+            for _ in ly_paths
+            ))
+
+    start_time = time.time()
+    results = _run(render())
+    elapsed_time = time.time() - start_time
+
+    assert all(results)
+    assert 0.6 <= elapsed_time
+
+
+def test_systemtools_IOManager_run_lilypond_async_04(
+    lilypond_stub,
+    output_directory,
+    ):
+    r'''Kills LilyPond when caller cancels task.
+    '''
+
+    ly_path = _write_ly_file(output_directory, 'test', '% sleep 5')
+
+    async def render():
+        task = asyncio.ensure_future(abjad.IOManager.run_lilypond_async(
+            ly_path,
+            lilypond_path=lilypond_stub,
+            ))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start_time = time.time()
+    _run(render())
+    elapsed_time = time.time() - start_time
+
+    assert elapsed_time < 4
+    time.sleep(0.2)
+    assert not os.path.exists(ly_path[:-3] + '.pdf')
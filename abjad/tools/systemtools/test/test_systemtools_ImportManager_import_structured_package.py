@@ -0,0 +1,95 @@
+import abjad
+import importlib
+import os
+import subprocess
+import sys
+
+
+def test_systemtools_ImportManager_import_structured_package_01():
+    r'''Lazy packages export eponymous public names.
+    '''
+
+    from abjad.tools import scoretools
+
+    assert 'Note' in scoretools.__all__
+    assert 'Note' in dir(scoretools)
+    assert scoretools.Note is abjad.Note
+    assert scoretools.Note.__name__ == 'Note'
+
+
+def test_systemtools_ImportManager_import_structured_package_02():
+    r'''Importing module of lazy package directly leaves eponymous public
+    name in package namespace.
+    '''
+
+    from abjad.tools import scoretools
+    module = importlib.import_module('abjad.tools.scoretools.Tuplet')
+
+    assert scoretools.Tuplet is module.Tuplet
+    assert isinstance(scoretools.Tuplet, type)
+
+
+def test_systemtools_ImportManager_import_structured_package_03():
+    r'''Importing Abjad imports no score classes.
+    '''
+
+    command = 'import abjad, sys; print(sorted(sys.modules))'
+    directory = os.path.dirname(os.path.dirname(abjad.__file__))
+    output = subprocess.check_output(
+        [sys.executable, '-c', command],
+        cwd=directory,
+        )
+    output = output.decode('utf-8')
+
+    assert 'abjad.tools.scoretools' not in output
+    assert 'abjad.tools.pitchtools' not in output
+
+
+def test_systemtools_ImportManager_import_structured_package_04():
+    r'''Getting namespace imports all public names.
+    '''
+
+    namespace = abjad.ImportManager.get_namespace(abjad)
+
+    assert namespace['Staff'] is abjad.Staff
+    assert namespace['scoretools'] is abjad.scoretools
+    assert namespace['silence'] == abjad.SilenceMask.silence
+    assert namespace['abjad_configuration'] is abjad.abjad_configuration
+
+
+def test_systemtools_ImportManager_import_structured_package_05():
+    r'''Importing Abjad lists no directories.
+    '''
+
+    command = '\n'.join((
+        'import os',
+        'def listdir(*arguments):',
+        '    raise Exception(arguments)',
+        'os.listdir = listdir',
+        'import abjad',
+        'abjad.Staff([abjad.Note()])',
+        ))
+    directory = os.path.dirname(os.path.dirname(abjad.__file__))
+    subprocess.check_call(
+        [sys.executable, '-c', command],
+        cwd=directory,
+        )
+
+
+def test_systemtools_ImportManager_import_structured_package_06():
+    r'''Star-importing Abjad imports lazily imported names.
+    '''
+
+    command = '\n'.join((
+        'from abjad import *',
+        'assert Note.__name__ == "Note"',
+        'assert attach.__name__ == "attach"',
+        'assert abjad_configuration.__class__.__name__ == '
+            '"AbjadConfiguration"',
+        'assert Up is not None and f is not None',
+        ))
+    directory = os.path.dirname(os.path.dirname(abjad.__file__))
+    subprocess.check_call(
+        [sys.executable, '-c', command],
+        cwd=directory,
+        )
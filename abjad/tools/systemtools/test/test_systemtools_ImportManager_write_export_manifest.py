@@ -0,0 +1,51 @@
+import abjad
+import importlib
+import os
+
+
+def test_systemtools_ImportManager_write_export_manifest_01():
+    r'''Writes names of public modules and public packages.
+    '''
+
+    with abjad.TemporaryDirectory() as path:
+        for file_name in ('Foo.py', 'bar.py', '_baz.py', 'README.md'):
+            with open(os.path.join(path, file_name), 'w') as file_pointer:
+                file_pointer.write('')
+        for directory_name in ('qux', 'test', 'data'):
+            os.mkdir(os.path.join(path, directory_name))
+        for directory_name in ('qux', 'test'):
+            file_path = os.path.join(path, directory_name, '__init__.py')
+            with open(file_path, 'w') as file_pointer:
+                file_pointer.write('')
+        file_path = abjad.ImportManager.write_export_manifest(path)
+        namespace = {}
+        with open(file_path) as file_pointer:
+            exec(file_pointer.read(), namespace)
+
+    assert os.path.basename(file_path) == '_exports.py'
+    assert namespace['modules'] == ('Foo', 'bar')
+    assert namespace['packages'] == ('qux',)
+
+
+def test_systemtools_ImportManager_write_export_manifest_02():
+    r'''Export manifests of lazily imported Abjad packages are current.
+
+    Run abjad/scr/devel/write-export-manifests when this test fails.
+    '''
+
+    abjad_directory = os.path.dirname(abjad.__file__)
+    for parent_name in ('demos', 'tools'):
+        parent_directory = os.path.join(abjad_directory, parent_name)
+        package_names = ['abjad.{}'.format(parent_name)]
+        for name in sorted(os.listdir(parent_directory)):
+            path = os.path.join(parent_directory, name, '__init__.py')
+            if os.path.exists(path):
+                package_names.append('abjad.{}.{}'.format(parent_name, name))
+        for package_name in package_names:
+            package = importlib.import_module(package_name)
+            if '_lazy_index' not in vars(package):
+                continue
+            manifest = importlib.import_module(package_name + '._exports')
+            path = os.path.dirname(package.__file__)
+            names = abjad.ImportManager._get_export_names(path)
+            assert (manifest.modules, manifest.packages) == names, path
@@ -0,0 +1,173 @@
+import abjad
+import platform
+import pytest
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_01():
+    r'''Reformatting unchanged score reuses format bundles.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Beam(), staff[:])
+    string = format(staff)
+    bundles = [_._format_bundle for _ in staff]
+
+    assert format(staff) == string
+    assert [_._format_bundle for _ in staff] == bundles
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_02():
+    r'''Attaching indicator invalidates format bundle of component only.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    format(staff)
+    bundles = [_._format_bundle for _ in staff]
+
+    abjad.attach(abjad.Articulation('accent'), staff[1])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            c'8
+            d'8 -\accent
+            e'8
+            f'8
+        }
+        '''
+        )
+    assert staff[0]._format_bundle is bundles[0]
+    assert staff[1]._format_bundle is not bundles[1]
+    assert staff[2]._format_bundle is bundles[2]
+
+    abjad.detach(abjad.Articulation, staff[1])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            c'8
+            d'8
+            e'8
+            f'8
+        }
+        '''
+        )
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_03():
+    r'''Changing overrides and settings invalidates format bundles.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    beam = abjad.Beam()
+    abjad.attach(beam, staff[:])
+    override = abjad.override(staff[1])
+    format(staff)
+
+    override.note_head.color = 'red'
+    abjad.override(beam).beam.positions = (4, 4)
+    abjad.setting(staff).instrument_name = 'Violin'
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff \with {
+            instrumentName = #'Violin
+        } {
+            \override Beam.positions = #'(4 . 4)
+            c'8 [
+            \once \override NoteHead.color = #red
+            d'8
+            e'8
+            \revert Beam.positions
+            f'8 ]
+        }
+        '''
+        )
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_04():
+    r'''Changing spanners and pitches invalidates format bundles of leaves
+    sharing spanners.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 d'8 e'8")
+    glissando = abjad.Glissando()
+    abjad.attach(glissando, staff[:3])
+    format(staff)
+
+    staff[2].written_pitch = "f'"
+    abjad.attach(abjad.Slur(), staff[2:])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            c'8 \glissando
+            d'8 \glissando
+            f'8 (
+            e'8 )
+        }
+        '''
+        )
+
+    abjad.detach(glissando, staff[0])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            c'8
+            d'8
+            f'8 (
+            e'8 )
+        }
+        '''
+        )
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_05():
+    r'''Reformatting unchanged score costs much less than formatting it
+    from scratch.
+    '''
+
+    maker = abjad.BenchmarkScoreMaker()
+    score = maker.make_score_00()
+    format(score)
+    cached_count = abjad.IOManager.count_function_calls(
+        'format(score)',
+        globals(),
+        locals(),
+        fixed_point=False,
+        )
+    for component in abjad.iterate(score).components():
+        component._format_bundle_key = None
+    count = abjad.IOManager.count_function_calls(
+        'format(score)',
+        globals(),
+        locals(),
+        fixed_point=False,
+        )
+
+    assert 2 * cached_count < count
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_06():
+    r'''Attaching and detaching context-scoped indicator invalidates format
+    bundles of spanners that read effective indicators.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.ClefSpanner(clef='percussion'), staff[2:])
+    format(staff)
+
+    abjad.attach(abjad.Clef('percussion'), staff[0])
+
+    assert format(staff) == format(abjad.mutate(staff).copy())
+    assert format(staff).count('percussion') == 1
+
+    abjad.detach(abjad.Clef, staff[0])
+
+    assert format(staff) == format(abjad.mutate(staff).copy())
+    assert format(staff).count('percussion') == 1
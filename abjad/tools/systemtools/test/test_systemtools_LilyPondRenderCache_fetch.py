@@ -0,0 +1,164 @@
+import abjad
+import os
+
+
+def _get_invocation_count(lilypond_stub):
+    path = os.path.join(os.path.dirname(lilypond_stub), 'invocations.txt')
+    with open(path) as file_pointer:
+        return sum(1 for line in file_pointer if '--version' not in line)
+
+
+def test_systemtools_LilyPondRenderCache_fetch_01(lilypond_stub):
+    r'''Persistence manager copies PDF from cache instead of running LilyPond
+    again.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        cache = abjad.LilyPondRenderCache(
+            directory=os.path.join(directory, 'cache'),
+            )
+        first_pdf_path = os.path.join(directory, 'first.pdf')
+        second_pdf_path = os.path.join(directory, 'second.pdf')
+        for pdf_path in (first_pdf_path, second_pdf_path):
+            result = abjad.persist(staff).as_pdf(
+                pdf_path,
+                render_cache=cache,
+                render_server=server,
+                )
+            assert result[3] is True
+        with open(first_pdf_path) as file_pointer:
+            first_pdf = file_pointer.read()
+        with open(second_pdf_path) as file_pointer:
+            assert file_pointer.read() == first_pdf
+        assert cache.entry_count == 1
+
+    assert _get_invocation_count(lilypond_stub) == 1
+    assert cache.hit_count == 1
+    assert cache.miss_count == 1
+
+
+def test_systemtools_LilyPondRenderCache_fetch_02(lilypond_stub):
+    r'''Keys depend on LilyPond input and flags.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    other_staff = abjad.Staff("c'4 d'4 e'4 g'4")
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        cache = abjad.LilyPondRenderCache(
+            directory=os.path.join(directory, 'cache'),
+            )
+        path = os.path.join(directory, 'test.pdf')
+        abjad.persist(staff).as_pdf(
+            path,
+            render_cache=cache,
+            render_server=server,
+            )
+        abjad.persist(other_staff).as_pdf(
+            path,
+            render_cache=cache,
+            render_server=server,
+            )
+        path = os.path.join(directory, 'test.png')
+        result = abjad.persist(staff).as_png(
+            path,
+            render_cache=cache,
+            render_server=server,
+            )
+        assert result[0] == (path,)
+        result = abjad.persist(staff).as_png(
+            path,
+            render_cache=cache,
+            render_server=server,
+            )
+        assert result[0] == (path,)
+        assert os.path.isfile(path)
+        assert cache.entry_count == 3
+
+    assert _get_invocation_count(lilypond_stub) == 3
+    assert cache.hit_count == 1
+    assert cache.miss_count == 3
+
+
+def test_systemtools_LilyPondRenderCache_fetch_03(lilypond_stub):
+    r'''Batch persistence manager renders only clients missing from cache.
+    Cache does not store failed renders.
+    '''
+
+    staves = [
+        abjad.Staff("c'4 d'4"),
+        abjad.Staff("e'4 f'4"),
+        abjad.Staff("e'4 f'4", name='error'),
+        ]
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        cache = abjad.LilyPondRenderCache(
+            directory=os.path.join(directory, 'cache'),
+            )
+        pdf_paths = [
+            os.path.join(directory, 'test-{}.pdf'.format(i))
+            for i in range(len(staves))
+            ]
+        results = abjad.persist_many(staves[1:]).as_pdf(
+            pdf_paths[1:],
+            render_cache=cache,
+            render_server=server,
+            )
+        assert [_[3] for _ in results] == [True, False]
+        for pdf_path in pdf_paths[1:]:
+            if os.path.exists(pdf_path):
+                os.remove(pdf_path)
+        results = abjad.persist_many(staves).as_pdf(
+            pdf_paths,
+            render_cache=cache,
+            render_server=server,
+            )
+        assert [_[3] for _ in results] == [True, True, False]
+        assert [_[2] for _ in results][1] == 0.0
+        assert os.path.isfile(pdf_paths[1])
+
+    assert cache.hit_count == 1
+    assert cache.miss_count == 4
+
+
+def test_systemtools_LilyPondRenderCache_fetch_04(lilypond_stub):
+    r'''Cache stores only files LilyPond wrote in render, not older output
+    files named after same LilyPond file.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    other_staff = abjad.Staff("c'4 d'4 e'4 g'4")
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        cache = abjad.LilyPondRenderCache(
+            directory=os.path.join(directory, 'cache'),
+            )
+        path = os.path.join(directory, 'x')
+        abjad.persist(other_staff).as_midi(
+            path + '.midi',
+            render_server=server,
+            )
+        abjad.persist(staff).as_pdf(
+            path + '.pdf',
+            render_cache=cache,
+            render_server=server,
+            )
+        path = os.path.join(directory, 'y')
+        abjad.persist(staff).as_midi(
+            path + '.midi',
+            render_server=server,
+            )
+        with open(path + '.midi') as file_pointer:
+            midi = file_pointer.read()
+        result = abjad.persist(staff).as_pdf(
+            path + '.pdf',
+            render_cache=cache,
+            render_server=server,
+            )
+        assert result[3] is True
+        with open(path + '.midi') as file_pointer:
+            assert file_pointer.read() == midi
+
+    assert cache.hit_count == 1
@@ -0,0 +1,50 @@
+import abjad
+import os
+
+
+def _store(cache, directory, name, size):
+    ly_file_path = os.path.join(directory, name + '.ly')
+    with open(ly_file_path, 'w') as file_pointer:
+        file_pointer.write(name)
+    pdf_path = os.path.join(directory, name + '.pdf')
+    with open(pdf_path, 'w') as file_pointer:
+        file_pointer.write(size * 'x')
+    key = cache.get_key(ly_file_path, lilypond_path='lilypond')
+    render_result = abjad.LilyPondRenderResult(
+        ly_path=ly_file_path,
+        exit_code=0,
+        output_paths=[pdf_path],
+        )
+    assert cache.store(key, render_result)
+    return key, ly_file_path
+
+
+def test_systemtools_LilyPondRenderCache_prune_01():
+    r'''Evicts least recently used entries first.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.LilyPondRenderCache(
+            directory=os.path.join(directory, 'cache'),
+            maximum_size=300,
+            )
+        keys = []
+        for i, name in enumerate(('a', 'b', 'c')):
+            key, ly_file_path = _store(cache, directory, name, 100)
+            entry = os.path.join(cache.directory, key)
+            os.utime(entry, (1000 + i, 1000 + i))
+            keys.append((key, ly_file_path))
+        assert cache.entry_count == 3
+        assert cache.size == 300
+        # fetch updates access time of first entry
+        assert cache.fetch(*keys[0]) == (keys[0][1][:-3] + '.pdf',)
+        _store(cache, directory, 'd', 100)
+        assert cache.entry_count == 3
+        assert cache.fetch(*keys[1]) is None
+        assert cache.fetch(*keys[0]) is not None
+        assert cache.fetch(*keys[2]) is not None
+        assert cache.prune(maximum_size=100) == 2
+        assert cache.entry_count == 1
+        cache.clear()
+        assert cache.entry_count == 0
+        assert cache.size == 0
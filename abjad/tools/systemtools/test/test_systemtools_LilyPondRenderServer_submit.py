@@ -0,0 +1,162 @@
+import abjad
+import concurrent.futures
+import os
+import pytest
+
+
+def _get_invocations(lilypond_stub):
+    path = os.path.join(os.path.dirname(lilypond_stub), 'invocations.txt')
+    with open(path) as file_pointer:
+        return file_pointer.read().splitlines()
+
+
+def _write_ly_files(directory, strings):
+    ly_paths = []
+    for i, string in enumerate(strings):
+        ly_path = os.path.join(directory, 'test-{}.ly'.format(i))
+        with open(ly_path, 'w') as file_pointer:
+            file_pointer.write(string)
+        ly_paths.append(ly_path)
+    return ly_paths
+
+
+def test_systemtools_LilyPondRenderServer_submit_01(lilypond_stub):
+    r'''Renders queued jobs with one LilyPond process.
+    '''
+
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory:
+        ly_paths = _write_ly_files(directory, ["{ c'4 }"] * 4)
+        with server:
+            with server._condition:
+                futures = [server.submit(_) for _ in ly_paths]
+            results = [_.result() for _ in futures]
+        for ly_path, result in zip(ly_paths, results):
+            assert result.ly_path == ly_path
+            assert result.success
+            assert "Processing `{}'".format(ly_path) in result.log
+            assert result.log.count('Processing') == 1
+            pdf_path = os.path.splitext(ly_path)[0] + '.pdf'
+            assert os.path.isfile(pdf_path)
+
+    assert len(_get_invocations(lilypond_stub)) == 1
+
+
+def test_systemtools_LilyPondRenderServer_submit_02(lilypond_stub):
+    r'''Reports exit code and log of each job in batch.
+    '''
+
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory:
+        strings = ["{ c'4 }", "{ c'4 error }", "{ c'4 }"]
+        ly_paths = _write_ly_files(directory, strings)
+        with server:
+            with server._condition:
+                futures = [server.submit(_) for _ in ly_paths]
+            results = [_.result() for _ in futures]
+
+    assert [_.exit_code for _ in results] == [0, 1, 0]
+    assert 'error: syntax error' in results[1].log
+    assert 'error' not in results[0].log
+    assert 'error' not in results[2].log
+    assert len(_get_invocations(lilypond_stub)) == 1
+
+
+def test_systemtools_LilyPondRenderServer_submit_03(lilypond_stub):
+    r'''Renders jobs with different flags or directories in separate
+    processes; limits batches to batch size.
+    '''
+
+    server = abjad.LilyPondRenderServer(
+        batch_size=2,
+        lilypond_path=lilypond_stub,
+        worker_count=2,
+        )
+    with abjad.TemporaryDirectory() as directory:
+        with abjad.TemporaryDirectory() as other_directory:
+            ly_paths = _write_ly_files(directory, ["{ c'4 }"] * 3)
+            other_ly_paths = _write_ly_files(other_directory, ["{ d'4 }"])
+            with server:
+                with server._condition:
+                    futures = [server.submit(_) for _ in ly_paths]
+                    futures.append(server.submit(ly_paths[0], flags='--png'))
+                    futures.append(server.submit(other_ly_paths[0]))
+                results = [_.result() for _ in futures]
+            assert all(_.success for _ in results)
+            png_path = os.path.splitext(ly_paths[0])[0] + '.png'
+            assert os.path.isfile(png_path)
+
+    invocations = _get_invocations(lilypond_stub)
+    assert len(invocations) == 4
+    assert sum('--png' in _ for _ in invocations) == 1
+
+
+def test_systemtools_LilyPondRenderServer_submit_04(lilypond_stub):
+    r'''Persistence manager renders PDF, PNG and MIDI with server.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory, server:
+        pdf_path = os.path.join(directory, 'test.pdf')
+        result = abjad.persist(staff).as_pdf(pdf_path, render_server=server)
+        assert result[0] == pdf_path
+        assert result[3] is True
+        assert os.path.isfile(pdf_path)
+        png_path = os.path.join(directory, 'test.png')
+        result = abjad.persist(staff).as_png(png_path, render_server=server)
+        assert result[0] == (png_path,)
+        assert result[3] is True
+        assert os.path.isfile(png_path)
+        midi_path = os.path.join(directory, 'test.midi')
+        result = abjad.persist(staff).as_midi(midi_path, render_server=server)
+        assert result[0] == midi_path
+        assert os.path.isfile(midi_path)
+
+    assert len(_get_invocations(lilypond_stub)) == 3
+
+
+def test_systemtools_LilyPondRenderServer_submit_05():
+    r'''Sets exception of job when LilyPond does not start.
+    '''
+
+    server = abjad.LilyPondRenderServer(lilypond_path='/nonexistent/lilypond')
+    with abjad.TemporaryDirectory() as directory, server:
+        ly_paths = _write_ly_files(directory, ["{ c'4 }"])
+        future = server.submit(ly_paths[0])
+        with pytest.raises(OSError):
+            future.result()
+        assert isinstance(future, concurrent.futures.Future)
+
+
+def test_systemtools_LilyPondRenderServer_submit_06(
+    lilypond_stub,
+    monkeypatch,
+    tmpdir,
+    ):
+    r'''Writes log file and finds output paths for each job in batch.
+    '''
+
+    monkeypatch.setitem(
+        abjad.abjad_configuration._settings,
+        'abjad_output_directory',
+        str(tmpdir.mkdir('output')),
+        )
+    server = abjad.LilyPondRenderServer(lilypond_path=lilypond_stub)
+    with abjad.TemporaryDirectory() as directory:
+        ly_paths = _write_ly_files(directory, ["{ c'4 }", "{ c'4 error }"])
+        with server:
+            with server._condition:
+                futures = [server.submit(_) for _ in ly_paths]
+            results = [_.result() for _ in futures]
+
+    assert results[0].output_paths == (ly_paths[0][:-3] + '.pdf',)
+    assert results[1].output_paths == ()
+    for ly_path, result in zip(ly_paths, results):
+        assert result.stdout == ''
+        assert result.log == result.stderr
+        with open(result.log_file_path) as file_pointer:
+            log = file_pointer.read()
+        assert log.count('Processing') == 1
+        assert "Processing `{}'".format(ly_path) in log
+    assert results[0].log_file_path != results[1].log_file_path
@@ -1,5 +1,7 @@
 import abjad
+import multiprocessing
 import os
+import pytest
 configuration = abjad.AbjadConfiguration()
 ly_path = os.path.join(
     configuration.abjad_directory, 
@@ -29,3 +31,101 @@ def test_systemtools_PersistenceManager_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist(note).as_ly(ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_systemtools_PersistenceManager_as_ly_03():
+    r'''Agent abjad.persists LilyPond file exactly as formatted.
+    '''
+
+    staff = abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 } f'4")
+    staff.append(abjad.Measure((3, 12), "c'8 d'8 e'8", implicit_scaling=True))
+    abjad.override(staff[0]).tuplet_number.text = abjad.Markup.line(
+        [abjad.Markup('2'), abjad.Markup(':3')],
+        )
+    abjad.setting(staff).instrument_name = abjad.Markup.column(
+        [abjad.Markup('Solo'), abjad.Markup('Flute')],
+        )
+    score = abjad.Score([staff])
+    lilypond_file = abjad.LilyPondFile.new(score, includes=['foo.ily'])
+    lilypond_file.header_block.title = abjad.Markup.column(
+        [abjad.Markup('Title'), abjad.Markup('Subtitle')],
+        )
+    lilypond_file.items.append('% end')
+
+    for strict in (False, True):
+        format_specification = 'lilypond'
+        if strict:
+            format_specification += ':strict'
+        string = format(lilypond_file, format_specification)
+        with abjad.FilesystemState(remove=[ly_path]):
+            abjad.persist(score).as_ly(
+                ly_path,
+                illustrate_function=lambda: lilypond_file,
+                strict=strict,
+                )
+            with open(ly_path) as file_pointer:
+                assert file_pointer.read() == string
+
+
+def test_systemtools_PersistenceManager_as_ly_04(monkeypatch):
+    r'''Agent abjad.persists LilyPond file formatted in worker processes
+    exactly as formatted serially. Forked processes inherit score; spawned
+    processes unpickle score.
+    '''
+
+    staves = []
+    for i in range(4):
+        staff = abjad.Staff(r"c'8 [ d'8 ] \times 2/3 { e'8 f'8 g'8 }")
+        abjad.attach(abjad.Clef('bass'), staff[0])
+        staves.append(staff)
+    staff_group = abjad.StaffGroup(staves[2:])
+    score = abjad.Score(staves[:2] + [staff_group])
+    abjad.attach(abjad.TimeSignature((5, 8)), staves[0][0])
+    lilypond_file = abjad.LilyPondFile.new(score)
+    string = format(lilypond_file)
+
+    get_context = multiprocessing.get_context
+    for start_method in ('fork', 'spawn'):
+        monkeypatch.setattr(
+            multiprocessing,
+            'get_context',
+            lambda method=None: get_context(method or start_method),
+            )
+        with abjad.FilesystemState(remove=[ly_path]):
+            abjad.persist(score).as_ly(
+                ly_path,
+                illustrate_function=lambda: lilypond_file,
+                workers=2,
+                )
+            with open(ly_path) as file_pointer:
+                assert file_pointer.read() == string
+
+
+def test_systemtools_PersistenceManager_as_ly_05(monkeypatch):
+    r'''Agent abjad.persists nothing and keeps existing LilyPond file when
+    formatting raises exception.
+    '''
+
+    def write_lilypond_format(self, file_pointer, strict=False, workers=None):
+        file_pointer.write('% partial output\n')
+        raise RuntimeError('formatting failed')
+
+    note = abjad.Note("c'4")
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(note).as_ly(ly_path)
+        with open(ly_path) as file_pointer:
+            string = file_pointer.read()
+        monkeypatch.setattr(
+            abjad.LilyPondFile,
+            '_write_lilypond_format',
+            write_lilypond_format,
+            )
+        with pytest.raises(RuntimeError):
+            abjad.persist(note).as_ly(ly_path)
+        with open(ly_path) as file_pointer:
+            assert file_pointer.read() == string
+        directory, file_name = os.path.split(ly_path)
+        assert not [
+            _ for _ in os.listdir(directory)
+            if _.startswith(file_name) and _ != file_name
+            ]
@@ -0,0 +1,106 @@
+import abjad
+import asyncio
+import os
+import pytest
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+@pytest.fixture
+def lilypond_configuration(lilypond_stub, monkeypatch, tmpdir):
+    monkeypatch.setitem(
+        abjad.abjad_configuration._settings,
+        'abjad_output_directory',
+        str(tmpdir.mkdir('output')),
+        )
+    monkeypatch.setitem(
+        abjad.abjad_configuration._settings,
+        'lilypond_path',
+        lilypond_stub,
+        )
+
+
+def test_systemtools_PersistenceManager_as_pdf_async_01(
+    lilypond_configuration,
+    ):
+    r'''Persists clients concurrently and returns same results as
+    synchronous persistence.
+    '''
+
+    staves = [abjad.Staff("c'4 d'4"), abjad.Staff("e'4 f'4", name='error')]
+    with abjad.TemporaryDirectory() as directory:
+        pdf_paths = [
+            os.path.join(directory, 'test-{}.pdf'.format(i))
+            for i in range(len(staves))
+            ]
+
+        async def persist():
+            return await asyncio.gather(*(
+                abjad.persist(staff).as_pdf_async(pdf_path, remove_ly=True)
+                for staff, pdf_path in zip(staves, pdf_paths)
+                ))
+
+        results = _run(persist())
+        assert [_[0] for _ in results] == pdf_paths
+        assert [_[3] for _ in results] == [True, False]
+        assert all(isinstance(_[1], float) for _ in results)
+        assert all(isinstance(_[2], float) for _ in results)
+        with open(pdf_paths[0]) as file_pointer:
+            assert format(staves[0][0]) in file_pointer.read()
+        assert os.listdir(directory) == [os.path.basename(pdf_paths[0])]
+
+
+def test_systemtools_PersistenceManager_as_pdf_async_02(
+    lilypond_configuration,
+    ):
+    r'''Copies output from render cache.
+    '''
+
+    staff = abjad.Staff("c'4 d'4")
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.LilyPondRenderCache(os.path.join(directory, 'cache'))
+        for name in ('test-1', 'test-2'):
+            pdf_path = os.path.join(directory, name + '.pdf')
+            result = _run(abjad.persist(staff).as_pdf_async(
+                pdf_path,
+                render_cache=cache,
+                ))
+            assert result[3] is True
+            assert os.path.exists(pdf_path)
+
+    assert cache.hit_count == 1
+    assert cache.miss_count == 1
+
+
+def test_systemtools_PersistenceManager_as_pdf_async_03(
+    lilypond_configuration,
+    ):
+    r'''Persists clients as MIDI files and PNGs.
+    '''
+
+    staff = abjad.Staff("c'4 d'4")
+    with abjad.TemporaryDirectory() as directory:
+        midi_path = os.path.join(directory, 'test-midi.midi')
+        png_path = os.path.join(directory, 'test-png.png')
+
+        async def persist():
+            return await asyncio.gather(
+                abjad.persist(staff).as_midi_async(midi_path, remove_ly=True),
+                abjad.persist(staff).as_png_async(png_path, remove_ly=True),
+                )
+
+        midi_result, png_result = _run(persist())
+        assert midi_result[0] == midi_path
+        assert png_result[0] == (png_path,)
+        assert png_result[3] is True
+        assert os.path.exists(midi_path)
+        assert os.path.exists(png_path)
+        assert not os.path.exists(png_path[:-4] + '.ly')
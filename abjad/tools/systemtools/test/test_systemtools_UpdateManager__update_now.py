@@ -0,0 +1,214 @@
+import abjad
+import platform
+import pytest
+
+
+def _make_score(staff_count, measure_count):
+    score = abjad.Score()
+    for i in range(staff_count):
+        staff = abjad.Staff()
+        for j in range(measure_count):
+            measure = abjad.Measure((2, 8), "c'8 d'8")
+            staff.append(measure)
+        score.append(staff)
+    return score
+
+
+def _get_offsets_and_indices(argument):
+    result = []
+    for component in abjad.iterate(argument).components():
+        timespan = abjad.inspect(component).get_timespan()
+        leaf_index = getattr(component, '_leaf_index', None)
+        measure_number = None
+        if isinstance(component, abjad.Measure):
+            measure_number = component.measure_number
+        result.append((timespan, leaf_index, measure_number))
+    return result
+
+
+def test_systemtools_UpdateManager__update_now_01():
+    r'''Changing written duration updates offsets of following leaves.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4")
+    assert abjad.inspect(staff[2]).get_timespan().start_offset == \
+        abjad.Offset(2, 4)
+
+    staff[0].written_duration = abjad.Duration(1, 2)
+
+    assert abjad.inspect(staff[2]).get_timespan().start_offset == \
+        abjad.Offset(3, 4)
+    assert abjad.inspect(staff).get_timespan().stop_offset == \
+        abjad.Offset(1)
+
+
+def test_systemtools_UpdateManager__update_now_02():
+    r'''Changing tuplet multiplier updates offsets inside and after tuplet.
+    '''
+
+    staff = abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 } f'4")
+    leaves = abjad.select(staff).leaves()
+    assert abjad.inspect(leaves[1]).get_timespan().start_offset == \
+        abjad.Offset(1, 12)
+
+    staff[0].multiplier = abjad.Multiplier(4, 5)
+
+    assert abjad.inspect(leaves[1]).get_timespan().start_offset == \
+        abjad.Offset(1, 10)
+    assert abjad.inspect(leaves[3]).get_timespan().start_offset == \
+        abjad.Offset(3, 10)
+
+
+def test_systemtools_UpdateManager__update_now_03():
+    r'''Incremental update agrees with update from scratch after edits
+    in one staff of many.
+    '''
+
+    score = _make_score(4, 8)
+    _get_offsets_and_indices(score)
+
+    staff = score[1]
+    staff[3].insert(1, abjad.Note("e'16"))
+    staff[5][0].written_duration = abjad.Duration(1, 4)
+    del(staff[6])
+    abjad.attach(abjad.GraceContainer("c'16 d'16"), staff[0][0])
+    score[2][2].implicit_scaling = True
+
+    new_score = abjad.mutate(score).copy()
+    assert _get_offsets_and_indices(score) == \
+        _get_offsets_and_indices(new_score)
+
+
+def test_systemtools_UpdateManager__update_now_04():
+    r'''Incremental update renumbers leaves and measures after insertion.
+    '''
+
+    staff = abjad.Staff(3 * abjad.Measure((2, 8), "c'8 d'8"))
+    abjad.inspect(staff).get_timespan()
+    leaves = abjad.select(staff).leaves()
+    assert [_._leaf_index for _ in leaves] == [0, 1, 2, 3, 4, 5]
+    assert [_.measure_number for _ in staff] == [1, 2, 3]
+
+    staff.insert(0, abjad.Measure((1, 8), "b8"))
+    abjad.inspect(staff).get_timespan()
+
+    leaves = abjad.select(staff).leaves()
+    assert [_._leaf_index for _ in leaves] == [0, 1, 2, 3, 4, 5, 6]
+    assert [_.measure_number for _ in staff] == [1, 2, 3, 4]
+    assert abjad.inspect(leaves[-1]).get_timespan().stop_offset == \
+        abjad.Offset(7, 8)
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_systemtools_UpdateManager__update_now_05():
+    r'''Cost of updating after one-note edit grows much more slowly than
+    size of score.
+    '''
+
+    small_score = _make_score(4, 20)
+    large_score = _make_score(40, 20)
+    counts = []
+    for score in (small_score, large_score):
+        abjad.inspect(score).get_timespan()
+        leaf = score[0][10][0]
+        last_leaf = score[-1][-1][-1]
+        count = abjad.IOManager.count_function_calls(
+            'leaf.written_duration = abjad.Duration(1, 8);'
+            'abjad.inspect(last_leaf).get_timespan()',
+            globals(),
+            locals(),
+            )
+        counts.append(count)
+
+    assert counts[1] < 4 * counts[0]
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_systemtools_UpdateManager__update_now_06():
+    r'''Cost of updating grows with size of edit.
+    '''
+
+    score = _make_score(4, 40)
+    abjad.inspect(score).get_timespan()
+    last_leaf = score[-1][-1][-1]
+    counts = []
+    for measure_count in (1, 20):
+        measures = score[0][:measure_count]
+        count = abjad.IOManager.count_function_calls(
+            'for measure in measures: measure.implicit_scaling = False\n'
+            'abjad.inspect(last_leaf).get_timespan()',
+            globals(),
+            locals(),
+            )
+        counts.append(count)
+
+    assert 2 * counts[0] < counts[1]
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_systemtools_UpdateManager__update_now_07():
+    r'''Cost of updating whole score is linear in size of score.
+    '''
+
+    maker = abjad.BenchmarkScoreMaker()
+    counts = []
+    for voice_count in (1, 4):
+        voice = maker.make_score_00()
+        for i in range(voice_count - 1):
+            voice.extend(maker.make_score_00()[:])
+        manager = abjad.UpdateManager()
+        count = abjad.IOManager.count_function_calls(
+            'manager._update_subtree_offsets('
+            'voice, abjad.Offset(0), abjad.Multiplier(1), [0, 0], (0, 0),'
+            'True, force=True)',
+            globals(),
+            locals(),
+            )
+        counts.append(count)
+
+    assert counts[1] < 4.5 * counts[0]
+    assert counts[0] < 30000
+
+
+def test_systemtools_UpdateManager__update_now_08():
+    r'''Updates grace note offsets in one pass.
+    '''
+
+    voice = abjad.Voice("c'4 d'4 e'4")
+    abjad.attach(abjad.GraceContainer("f'16 g'16"), voice[1])
+    abjad.attach(abjad.AfterGraceContainer("a'16"), voice[1])
+    grace_notes = voice[1]._grace_container[:]
+    after_grace_note = voice[1]._after_grace_container[0]
+
+    timespan = abjad.inspect(grace_notes[0]).get_timespan()
+    assert timespan.start_offset == abjad.Offset(
+        (1, 4),
+        grace_displacement=(-1, 8),
+        )
+    assert timespan.stop_offset == abjad.Offset(
+        (1, 4),
+        grace_displacement=(-1, 16),
+        )
+    timespan = abjad.inspect(grace_notes[1]).get_timespan()
+    assert timespan.stop_offset == abjad.Offset(
+        (1, 4),
+        grace_displacement=0,
+        )
+    timespan = abjad.inspect(after_grace_note).get_timespan()
+    assert timespan.start_offset == abjad.Offset(
+        (1, 2),
+        grace_displacement=(-1, 16),
+        )
+    assert [_._leaf_index for _ in grace_notes] == [1, 2]
+    assert voice[1]._leaf_index == 3
+    assert after_grace_note._leaf_index == 4
+    assert voice[2]._leaf_index == 5
@@ -0,0 +1,48 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'AnnotatedTimespan',
+    'CompoundInequality',
+    'OffsetTimespanTimeRelation',
+    'TimeRelation',
+    'Timespan',
+    'TimespanInequality',
+    'TimespanList',
+    'TimespanTimespanTimeRelation',
+    'offset_happens_after_timespan_starts',
+    'offset_happens_after_timespan_stops',
+    'offset_happens_before_timespan_starts',
+    'offset_happens_before_timespan_stops',
+    'offset_happens_during_timespan',
+    'offset_happens_when_timespan_starts',
+    'offset_happens_when_timespan_stops',
+    'timespan_2_contains_timespan_1_improperly',
+    'timespan_2_curtails_timespan_1',
+    'timespan_2_delays_timespan_1',
+    'timespan_2_happens_during_timespan_1',
+    'timespan_2_intersects_timespan_1',
+    'timespan_2_is_congruent_to_timespan_1',
+    'timespan_2_overlaps_all_of_timespan_1',
+    'timespan_2_overlaps_only_start_of_timespan_1',
+    'timespan_2_overlaps_only_stop_of_timespan_1',
+    'timespan_2_overlaps_start_of_timespan_1',
+    'timespan_2_overlaps_stop_of_timespan_1',
+    'timespan_2_starts_after_timespan_1_starts',
+    'timespan_2_starts_after_timespan_1_stops',
+    'timespan_2_starts_before_timespan_1_starts',
+    'timespan_2_starts_before_timespan_1_stops',
+    'timespan_2_starts_during_timespan_1',
+    'timespan_2_starts_when_timespan_1_starts',
+    'timespan_2_starts_when_timespan_1_stops',
+    'timespan_2_stops_after_timespan_1_starts',
+    'timespan_2_stops_after_timespan_1_stops',
+    'timespan_2_stops_before_timespan_1_starts',
+    'timespan_2_stops_before_timespan_1_stops',
+    'timespan_2_stops_during_timespan_1',
+    'timespan_2_stops_when_timespan_1_starts',
+    'timespan_2_stops_when_timespan_1_stops',
+    'timespan_2_trisects_timespan_1',
+    )
+
+packages = ()
@@ -0,0 +1,18 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'ChordExtent',
+    'ChordInversion',
+    'ChordQuality',
+    'ChordSuspension',
+    'Mode',
+    'RomanNumeral',
+    'RootedChordClass',
+    'RootlessChordClass',
+    'Scale',
+    'ScaleDegree',
+    'TonalAnalysis',
+    )
+
+packages = ()
@@ -0,0 +1,28 @@
+# generated by ImportManager.write_export_manifest();
+# do not edit by hand
+
+modules = (
+    'analyze',
+    'annotate',
+    'attach',
+    'batch',
+    'detach',
+    'graph',
+    'inspect',
+    'iterate',
+    'label',
+    'mutate',
+    'new',
+    'override',
+    'parse',
+    'persist',
+    'persist_many',
+    'play',
+    'select',
+    'sequence',
+    'setting',
+    'show',
+    'tweak',
+    )
+
+packages = ()
@@ -155,4 +155,8 @@ def attach(
         synthetic_offset=synthetic_offset,
         tag=tag,
         )
+    batch = abjad.Batch._find_batch(component)
+    if batch is not None:
+        batch._queue(wrapper)
+        return
     wrapper._bind_to_component(component)
@@ -0,0 +1,35 @@
+def batch(component):
+    r'''Makes batch context manager for `component`.
+
+    ..  container:: example
+
+        Queues indicators attached inside `with` block and attaches them
+        with one score update on exit:
+
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> with abjad.batch(staff):
+        ...     for note in staff:
+        ...         abjad.attach(abjad.Articulation('>'), note)
+        ...
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff {
+                c'4 -\accent
+                d'4 -\accent
+                e'4 -\accent
+                f'4 -\accent
+            }
+
+    ..  container:: example
+
+        Returns batch:
+
+        >>> abjad.batch(staff)
+        Batch(component=Staff("c'4 d'4 e'4 f'4"), update_on_enter=True)
+
+    '''
+    import abjad
+    return abjad.Batch(component=component)
@@ -57,6 +57,9 @@ def detach(prototype, component_expression=None):
             for item in component_expression._indicator_wrappers[:]:
                 if isinstance(item, prototype):
                     component_expression._indicator_wrappers.remove(item)
+                    component_expression._bump_format_version()
+                    if isinstance(component_expression, abjad.Component):
+                        component_expression._effective_indicator_index = None
                     result.append(item)
                 # indicator is a expression
                 elif (
@@ -65,6 +68,9 @@ def detach(prototype, component_expression=None):
                     ):
                     item._detach()
                     result.append(item.indicator)
+            batch = abjad.Batch._find_batch(component_expression)
+            if batch is not None:
+                result.extend(batch._detach(prototype, component_expression))
             result = tuple(result)
             return result
     else:
@@ -80,6 +86,9 @@ def detach(prototype, component_expression=None):
             for item in component_expression._indicator_wrappers[:]:
                 if item == prototype:
                     component_expression._indicator_wrappers.remove(item)
+                    component_expression._bump_format_version()
+                    if isinstance(component_expression, abjad.Component):
+                        component_expression._effective_indicator_index = None
                     result.append(item)
                 # indicator is an expression
                 elif (
@@ -88,6 +97,9 @@ def detach(prototype, component_expression=None):
                     ):
                     item._detach()
                     result.append(item.indicator)
+            batch = abjad.Batch._find_batch(component_expression)
+            if batch is not None:
+                result.extend(batch._detach(prototype, component_expression))
             result = tuple(result)
             return result
     items = []
@@ -1,6 +1,3 @@
-_lilypond_parsers_by_language = {}
-
-
 def parse(string, language='english'):
     r'''Parses LilyPond `string`.
 
@@ -29,7 +26,7 @@ def parse(string, language='english'):
         return lilypondparsertools.parse_reduced_ly_syntax(string[4:])
     elif string.startswith('rtm:'):
         return rhythmtreetools.parse_rtm_syntax(string[4:])
-    if language not in _lilypond_parsers_by_language:
-        parser = lilypondparsertools.LilyPondParser(default_language=language)
-        _lilypond_parsers_by_language[language] = parser
-    return _lilypond_parsers_by_language[language](string)
+    return lilypondparsertools.LilyPondParser._call_pooled(
+        string,
+        default_language=language,
+        )
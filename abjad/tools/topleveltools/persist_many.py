@@ -0,0 +1,23 @@
+def persist_many(clients):
+    r'''Makes batch persistence manager.
+
+    ..  container:: example
+
+        Persists staves as PDFs with two LilyPond processes at once:
+
+        >>> staves = [
+        ...     abjad.Staff("c'4 e'4 d'4 f'4"),
+        ...     abjad.Staff("d'4 f'4 e'4 g'4"),
+        ...     ]
+        >>> abjad.persist_many(staves).as_pdf(workers=2) # doctest: +SKIP
+
+    ..  container:: example
+
+        Returns batch persistence manager:
+
+        >>> abjad.persist_many(staves)
+        BatchPersistenceManager(clients=(Staff("c'4 e'4 d'4 f'4"), Staff("d'4 f'4 e'4 g'4")))
+
+    '''
+    import abjad
+    return abjad.BatchPersistenceManager(clients)
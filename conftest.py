@@ -1,5 +1,19 @@
 import abjad
+import os
 import pytest
+import sys
+
+
+# coroutines use Python 3.5 syntax
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.extend([
+        'abjad/tools/systemtools/_coroutines.py',
+        'abjad/tools/systemtools/test/'
+            'test_systemtools_IOManager_run_lilypond_async.py',
+        'abjad/tools/systemtools/test/'
+            'test_systemtools_PersistenceManager_as_pdf_async.py',
+        ])
 
 
 @pytest.fixture(autouse=True)
@@ -8,3 +22,71 @@ def add_libraries(doctest_namespace):
     doctest_namespace['f'] = abjad.f
     doctest_namespace['Infinity'] = abjad.mathtools.Infinity()
     doctest_namespace['NegativeInfinity'] = abjad.mathtools.NegativeInfinity()
+
+
+_lilypond_stub = r'''#! {executable}
+import os
+import re
+import sys
+import time
+arguments = sys.argv[1:]
+with open(os.path.join({directory!r}, 'invocations.txt'), 'a') as file_pointer:
+    file_pointer.write(' '.join(arguments) + '\n')
+if '--version' in arguments:
+    print('GNU LilyPond 2.19.0')
+    sys.exit(0)
+output = arguments[arguments.index('-o') + 1]
+extension = '.png' if '--png' in arguments else '.pdf'
+ly_paths = [_ for _ in arguments if _.endswith('.ly')]
+failed_paths = []
+print('GNU LilyPond 2.19.0', file=sys.stderr)
+for ly_path in ly_paths:
+    print("Processing `{{}}'".format(ly_path), file=sys.stderr)
+    with open(ly_path) as file_pointer:
+        string = file_pointer.read()
+    match = re.search(r'sleep (\d+(\.\d+)?)', string)
+    if match is not None:
+        time.sleep(float(match.group(1)))
+    if 'error' in string:
+        message = '{{}}:1:1: error: syntax error'.format(ly_path)
+        print(message, file=sys.stderr)
+        failed_paths.append(ly_path)
+        continue
+    base = os.path.splitext(os.path.basename(ly_path))[0]
+    if os.path.isdir(output):
+        base = os.path.join(output, base)
+    else:
+        base = output
+    if '\\midi' in string:
+        with open(base + '.midi', 'w') as file_pointer:
+            file_pointer.write(string)
+    with open(base + extension, 'w') as file_pointer:
+        file_pointer.write(string)
+    print('Success: compilation successfully completed', file=sys.stderr)
+if failed_paths:
+    failed_paths = ' '.join('"{{}}"'.format(_) for _ in failed_paths)
+    message = 'fatal error: failed files: {{}}'.format(failed_paths)
+    print(message, file=sys.stderr)
+    sys.exit(1)
+'''
+
+
+@pytest.fixture
+def lilypond_stub(tmpdir):
+    r'''Makes stub LilyPond executable that copies LilyPond files to output
+    files and fails on files that contain the word "error". Stub sleeps
+    for `n` seconds before copying files that contain ``sleep n``.
+
+    Stub appends arguments of each call to ``invocations.txt`` in its
+    directory.
+    '''
+    directory = str(tmpdir.mkdir('lilypond_stub'))
+    path = os.path.join(directory, 'lilypond')
+    with open(path, 'w') as file_pointer:
+        string = _lilypond_stub.format(
+            directory=directory,
+            executable=sys.executable,
+            )
+        file_pointer.write(string)
+    os.chmod(path, 0o755)
+    return path